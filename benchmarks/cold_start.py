@@ -0,0 +1,142 @@
+"""Measure the cold start of `chat -p` and the Textual UI.
+
+Times fresh interpreters importing what each mode needs before it can send
+a prompt (the headless pipe path, and the app with its widget tree), and the
+app's time to first frame: from interpreter start until the first screen
+has been rendered, headless, with an empty config. `-X importtime` shows
+which modules the app import spends its time in. The Claude subprocess and
+MCP servers are left out, as both modes share them.
+
+    uv run python benchmarks/cold_start.py --runs 10
+    uv run python benchmarks/cold_start.py --budget-ms 600  # exit 1 if over
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# The SDK is listed for both, as the app only imports it after the first frame
+MODES = {
+    "chat -p": "import agent_chat_cli.cli, agent_chat_cli.headless.pipe, claude_agent_sdk",
+    "chat (TUI)": "import agent_chat_cli.cli, agent_chat_cli.app, claude_agent_sdk",
+}
+
+# What the app imports before its first frame
+FIRST_FRAME_IMPORTS = "import agent_chat_cli.cli, agent_chat_cli.app"
+
+# Prints milliseconds from interpreter start to the first rendered frame
+FIRST_FRAME = """
+import time
+START = time.perf_counter()
+
+from pathlib import Path
+
+from agent_chat_cli import app
+
+
+class FirstFrame(app.AgentChatCLIApp):
+    CSS_PATH = Path(app.__file__).parent / app.AgentChatCLIApp.CSS_PATH
+
+    async def on_mount(self):
+        await super().on_mount()
+        self.call_after_refresh(self.exit, time.perf_counter())
+
+
+elapsed = FirstFrame().run(headless=True)
+print((elapsed - START) * 1000, flush=True)
+"""
+
+CONFIG = 'system_prompt: "You are a helpful assistant."\nmodel: sonnet\n'
+
+
+def measure(code: str, runs: int) -> float:
+    timings = []
+
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], check=True)
+        timings.append(time.perf_counter() - start)
+
+    return statistics.median(timings) * 1000
+
+
+def measure_first_frame(runs: int) -> float:
+    timings = []
+
+    # Empty config and HOME, so no MCP servers start and no journal is kept.
+    # A file rather than `-c`, as Textual needs the source file of an App
+    with tempfile.TemporaryDirectory() as workdir:
+        Path(workdir, "agent-chat-cli.config.yaml").write_text(CONFIG)
+        Path(workdir, "first_frame.py").write_text(FIRST_FRAME)
+        env = {**os.environ, "HOME": workdir}
+
+        for _ in range(runs):
+            result = subprocess.run(
+                [sys.executable, "first_frame.py"],
+                cwd=workdir,
+                env=env,
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+            timings.append(float(result.stdout.split()[-1]))
+
+    return statistics.median(timings)
+
+
+def import_profile(code: str, top: int) -> list[tuple[int, str]]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    entries = []
+
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+
+        _, cumulative, name = line.split("|")
+        entries.append((int(cumulative), name.rstrip()))
+
+    return sorted(entries, reverse=True)[:top]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--top", type=int, default=15, help="Imports listed")
+    parser.add_argument(
+        "--budget-ms", type=float, default=None, help="Max time to first frame"
+    )
+    args = parser.parse_args()
+
+    results = {mode: measure(code, args.runs) for mode, code in MODES.items()}
+
+    for mode, ms in results.items():
+        print(f"{mode:<12} {ms:7.0f}ms median over {args.runs} runs")
+
+    saved = results["chat (TUI)"] - results["chat -p"]
+    print(f"chat -p starts {saved:.0f}ms sooner")
+
+    print("\nSlowest imports before the first frame (cumulative):")
+
+    for microseconds, name in import_profile(FIRST_FRAME_IMPORTS, args.top):
+        print(f"  {microseconds / 1000:7.1f}ms {name}")
+
+    first_frame = measure_first_frame(args.runs)
+    print(f"\nFirst frame  {first_frame:7.0f}ms median over {args.runs} runs")
+
+    if args.budget_ms is not None and first_frame > args.budget_ms:
+        print(f"Over the {args.budget_ms:.0f}ms budget", file=sys.stderr)
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
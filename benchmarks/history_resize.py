@@ -0,0 +1,69 @@
+"""Measure how long a terminal resize takes with a long chat history.
+
+Fills a headless app with alternating user / agent messages, then times a
+handful of resizes, which force every mounted message to be laid out again.
+
+    uv run python benchmarks/history_resize.py --messages 500
+"""
+
+import argparse
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from agent_chat_cli.app import AgentChatCLIApp
+from agent_chat_cli.components.messages import RoleType
+
+AGENT_REPLY = (
+    "Here is a summary of the change:\n\n"
+    "- Moved the parser into its own module\n"
+    "- Added tests for the edge cases\n\n"
+    "```python\nprint('hello')\n```\n"
+)
+
+
+async def run(messages: int, resizes: int) -> tuple[float, float]:
+    with (
+        patch("agent_chat_cli.app.AgentLoop") as agent_loop,
+        patch("agent_chat_cli.components.header.load_config") as load_config,
+    ):
+        agent_loop.return_value.start = AsyncMock()
+        agent_loop.return_value.query_queue.empty = MagicMock(return_value=True)
+        load_config.return_value = MagicMock(mcp_servers={}, agents={})
+
+        app = AgentChatCLIApp()
+        async with app.run_test(size=(100, 40)) as pilot:
+            start = time.perf_counter()
+
+            for index in range(messages):
+                role = RoleType.USER if index % 2 == 0 else RoleType.AGENT
+                content = f"Question {index}" if index % 2 == 0 else AGENT_REPLY
+                await app.renderer.add_message(role, content, thinking=False)
+
+            await pilot.pause()
+            fill = time.perf_counter() - start
+
+            start = time.perf_counter()
+
+            for index in range(resizes):
+                await pilot.resize_terminal(100 + index % 2 * 20, 40)
+                await pilot.pause()
+
+            return fill, (time.perf_counter() - start) / resizes
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--messages", type=int, default=500)
+    parser.add_argument("--resizes", type=int, default=5)
+    args = parser.parse_args()
+
+    fill, resize = asyncio.run(run(args.messages, args.resizes))
+    print(
+        f"{args.messages} messages added in {fill:.3f}s, "
+        f"{resize * 1000:.1f}ms per resize"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Time the conversation search index over thousands of saved sessions.
+
+Writes `--sessions` synthetic conversations to a temporary directory, then
+times the first full ingest, an update with nothing changed, and searches.
+
+    uv run python benchmarks/search_index.py --sessions 2000
+"""
+
+import argparse
+import random
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from agent_chat_cli.core.conversation_store import ConversationStore, Message
+from agent_chat_cli.utils import journal, save_conversation
+from agent_chat_cli.utils.enums import RoleType
+from agent_chat_cli.utils.search_index import SearchIndex
+
+WORDS = (
+    "deploy service cluster rollback migration schema index query latency "
+    "token session journal restore permission prompt server tool config "
+    "signing keys certificate bucket release branch review pipeline cache"
+).split()
+
+QUERIES = ["deploy", "signing keys", "migration schema", "rollback release"]
+
+# Filler, so the topic words above are about as rare as they are in real chats
+FILLER = [f"w{number}" for number in range(5000)]
+
+
+def write_sessions(directory: Path, sessions: int) -> None:
+    save_conversation.CONVERSATION_OUTPUT_DIR = directory
+    journal.JOURNAL_DIR = directory / "journal"
+    rng = random.Random(0)
+
+    for number in range(sessions):
+        store = ConversationStore()
+
+        for turn in range(10):
+            role = RoleType.USER if turn % 2 == 0 else RoleType.AGENT
+            words = rng.choices(FILLER, k=57) + rng.choices(WORDS, k=3)
+            store.add(Message(role, " ".join(words)))
+
+        path = Path(save_conversation.save_conversation(store))
+        path.rename(directory / f"convo-{number:06}.md")
+
+
+def timed(function) -> float:
+    start = time.perf_counter()
+    function()
+    return (time.perf_counter() - start) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sessions", type=int, default=2000)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        root = Path(directory)
+        write_sessions(root, args.sessions)
+        index = SearchIndex(root / "search.db")
+
+        print(f"{args.sessions} sessions")
+        print(f"  first ingest:     {timed(index.update):8.1f}ms")
+        print(f"  unchanged update: {timed(index.update):8.1f}ms")
+
+        for query in QUERIES:
+            timings = [timed(lambda: index.search(query)) for _ in range(args.runs)]
+            print(f"  search {query!r:20} {statistics.median(timings):8.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Measure how many streamed chunks per second the Renderer can absorb.
+
+Drives `Renderer.handle_app_event` with STREAM_EVENTs inside a headless app,
+the same way AgentLoop delivers them, and reports delivery throughput.
+
+    uv run python benchmarks/stream_throughput.py --chunks 200
+"""
+
+import argparse
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from agent_chat_cli.app import AgentChatCLIApp
+from agent_chat_cli.core.agent_loop import AppEvent
+from agent_chat_cli.utils.enums import AppEventType
+
+
+async def run(chunks: int) -> float:
+    with (
+        patch("agent_chat_cli.app.AgentLoop") as agent_loop,
+        patch("agent_chat_cli.components.header.load_config") as load_config,
+    ):
+        agent_loop.return_value.start = AsyncMock()
+        agent_loop.return_value.query_queue.empty = MagicMock(return_value=True)
+        load_config.return_value = MagicMock(mcp_servers={}, agents={})
+
+        app = AgentChatCLIApp()
+        async with app.run_test(size=(100, 40)) as pilot:
+            start = time.perf_counter()
+
+            for index in range(chunks):
+                await app.renderer.handle_app_event(
+                    AppEvent(
+                        type=AppEventType.STREAM_EVENT,
+                        data={"text": f"word{index} " + ("\n\n" * (index % 20 == 0))},
+                    )
+                )
+
+            await app.renderer.handle_app_event(
+                AppEvent(type=AppEventType.RESULT, data=None)
+            )
+
+            # Include the time for the UI to catch up with the conversation
+            await pilot.pause()
+
+            return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--chunks", type=int, default=200)
+    args = parser.parse_args()
+
+    elapsed = asyncio.run(run(args.chunks))
+    print(
+        f"{args.chunks} chunks in {elapsed:.3f}s "
+        f"({args.chunks / elapsed:,.0f} chunks/s)"
+    )
+
+
+if __name__ == "__main__":
+    main()
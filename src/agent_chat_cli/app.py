@@ -1,4 +1,6 @@
 import asyncio
+from pathlib import Path
+from typing import Any, Coroutine
 
 from textual.app import App, ComposeResult
 from textual.containers import VerticalScroll
@@ -8,17 +10,17 @@ from agent_chat_cli.components.header import Header
 from agent_chat_cli.components.chat_history import ChatHistory
 from agent_chat_cli.components.thinking_indicator import ThinkingIndicator
 from agent_chat_cli.components.tool_permission_prompt import ToolPermissionPrompt
+from agent_chat_cli.components.turn_summary import TurnSummary
 from agent_chat_cli.components.user_input import UserInput
 from agent_chat_cli.core.agent_loop import AgentLoop
+from agent_chat_cli.core.conversation_store import ConversationStore
 from agent_chat_cli.core.renderer import Renderer
 from agent_chat_cli.core.actions import Actions
 from agent_chat_cli.core.ui_state import UIState
+from agent_chat_cli.utils.config import ConfigService, load_config
 from agent_chat_cli.utils.logger import setup_logging
-
-from dotenv import load_dotenv
-
-load_dotenv()
-setup_logging()
+from agent_chat_cli.utils.search_index import SearchIndex
+from agent_chat_cli.utils.tracing import Tracer
 
 
 class AgentChatCLIApp(App):
@@ -33,21 +35,44 @@ class AgentChatCLIApp(App):
     def __init__(self) -> None:
         super().__init__(ansi_color=True)
 
+        self.conversation = ConversationStore()
         self.actions = Actions(app=self)
-        self.agent_loop = AgentLoop(app=self)
+        self.agent_loop = AgentLoop(app=self, journal=True)
         self.renderer = Renderer(app=self)
         self.ui_state = UIState(app=self)
+        self.search_index = SearchIndex()
+
+        # Kept so they are not garbage collected mid-run, and cancelled on exit
+        self._tasks: set[asyncio.Task] = set()
 
     def compose(self) -> ComposeResult:
         with VerticalScroll():
             yield Header()
-            yield ChatHistory()
+            yield ChatHistory(store=self.conversation)
             yield ThinkingIndicator()
+            yield TurnSummary()
             yield ToolPermissionPrompt(actions=self.actions)
             yield UserInput(actions=self.actions)
 
     async def on_mount(self) -> None:
-        asyncio.create_task(self.agent_loop.start())
+        self.ui_state.attach_scroll()
+        self.agent_loop.query_queue.subscribe(self.ui_state.update_queued_count)
+        self._start_task(self.renderer.start())
+        self._start_task(self.agent_loop.start())
+        self._start_task(self.actions.index_conversations())
+
+        # Edits to the config are applied to the running session
+        self._start_task(ConfigService.watch())
+
+    def on_unmount(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+
+    def _start_task(self, coroutine: Coroutine[Any, Any, None]) -> None:
+        task = asyncio.create_task(coroutine)
+
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
 
     async def action_interrupt(self) -> None:
         await self.actions.interrupt()
@@ -57,6 +82,15 @@ class AgentChatCLIApp(App):
 
 
 def main():
+    # `.env` is loaded by `cli.main`, the entry point of every mode
+    config = load_config()
+    setup_logging(sample_rates=config.log_sample_rates)
+
+    if config.trace_file:
+        # Exported at exit; registered after logging, so it runs first and
+        # its `trace_exported` record still reaches the log
+        Tracer.enable(Path(config.trace_file).expanduser())
+
     app = AgentChatCLIApp()
     app.run()
 
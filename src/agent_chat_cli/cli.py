@@ -0,0 +1,113 @@
+import argparse
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+
+def build_parser() -> argparse.ArgumentParser:
+    # Options shared by every mode that answers permission requests unattended
+    unattended = argparse.ArgumentParser(add_help=False)
+    unattended.add_argument(
+        "--allow-tools",
+        action="store_true",
+        help="Approve tool permission requests instead of denying them",
+    )
+
+    parser = argparse.ArgumentParser(
+        prog="chat", description="Agent Chat CLI", parents=[unattended]
+    )
+    parser.add_argument(
+        "-p",
+        "--print",
+        dest="prompt",
+        nargs="?",
+        const="-",
+        default=None,
+        help="Print the response to a prompt (or stdin) and exit, without the UI",
+    )
+
+    commands = parser.add_subparsers(dest="command")
+
+    batch = commands.add_parser(
+        "batch",
+        help="Run a JSONL file of prompts without the UI",
+        parents=[unattended],
+    )
+    batch.add_argument("prompts", type=Path, help="JSONL file of prompts")
+    batch.add_argument(
+        "--concurrency", type=int, default=4, help="Sessions run in parallel"
+    )
+    batch.add_argument(
+        "--out", type=Path, default=Path("results.jsonl"), help="JSONL results file"
+    )
+    batch.add_argument(
+        "--rate", type=float, default=None, help="Max prompts started per minute"
+    )
+
+    serve = commands.add_parser(
+        "serve",
+        help="Keep warm sessions for `chat attach` on a unix socket",
+        parents=[unattended],
+    )
+    serve.add_argument("--socket", type=Path, default=None, help="Socket path")
+    serve.add_argument(
+        "--pool", type=int, default=2, help="Connected sessions kept waiting"
+    )
+
+    attach = commands.add_parser("attach", help="Chat through a running `chat serve`")
+    attach.add_argument(
+        "prompt", nargs="?", default=None, help="Send one prompt and exit"
+    )
+    attach.add_argument("--socket", type=Path, default=None, help="Socket path")
+
+    search = commands.add_parser("search", help="Search saved conversations")
+    search.add_argument("query", nargs="+", help="Words to search for")
+    search.add_argument("--limit", type=int, default=20, help="Most hits shown")
+
+    return parser
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+    load_dotenv()
+
+    # Each mode only imports what it needs, so headless runs skip Textual
+    if args.command == "batch":
+        from agent_chat_cli.headless import batch
+
+        batch.main(
+            args.prompts, args.out, args.concurrency, args.rate, args.allow_tools
+        )
+        return
+
+    if args.command == "serve":
+        from agent_chat_cli.headless import daemon
+
+        daemon.main(args.socket, args.pool, args.allow_tools)
+        return
+
+    if args.command == "attach":
+        from agent_chat_cli.headless import client
+
+        client.main(args.prompt, args.socket)
+        return
+
+    if args.command == "search":
+        from agent_chat_cli.utils import search_index
+
+        search_index.main(" ".join(args.query), args.limit)
+        return
+
+    if args.prompt is not None:
+        from agent_chat_cli.headless import pipe
+
+        pipe.main(args.prompt, args.allow_tools)
+        return
+
+    from agent_chat_cli.app import main as run_app
+
+    run_app()
+
+
+if __name__ == "__main__":
+    main()
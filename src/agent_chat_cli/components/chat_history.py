@@ -1,24 +1,214 @@
 import json
-from textual.containers import Container
+
+from textual.containers import Container, ScrollableContainer
 
 from agent_chat_cli.components.messages import (
     AgentMessage,
-    Message,
-    RoleType,
     SystemMessage,
     ToolMessage,
     UserMessage,
 )
+from agent_chat_cli.core.conversation_store import (
+    ConversationEvent,
+    ConversationStore,
+    Message,
+)
+from agent_chat_cli.utils.enums import ConversationEventType, RoleType
+
+MessageWidget = SystemMessage | UserMessage | AgentMessage | ToolMessage
 
 
 class ChatHistory(Container):
+    """Virtualized view of a `ConversationStore`.
+
+    Every message lives in the store, but widgets are only mounted for the
+    records overlapping the scroll viewport plus `OVERSCAN` records on either
+    side. Rows taken up by unmounted records are reserved with top / bottom
+    padding so the scroll position stays stable.
+    """
+
+    # Number of messages kept mounted beyond each edge of the viewport
+    OVERSCAN = 10
+
+    def __init__(self, store: ConversationStore | None = None) -> None:
+        super().__init__()
+
+        self.store = store if store is not None else ConversationStore()
+
+        self._heights: list[int] = []
+        self._widgets: dict[int, MessageWidget] = {}
+        self._sync_scheduled = False
+        self._scroller: ScrollableContainer | None = None
+
+    @property
+    def messages(self) -> list[Message]:
+        return self.store.messages
+
+    def on_mount(self) -> None:
+        scroller = self.parent
+        if isinstance(scroller, ScrollableContainer):
+            self._scroller = scroller
+            self.watch(scroller, "scroll_y", self._schedule_sync, init=False)
+
+        self.store.subscribe(self._on_conversation_event)
+
+        for index in range(len(self.store)):
+            self._on_message_added(index)
+
+    def on_unmount(self) -> None:
+        self.store.unsubscribe(self._on_conversation_event)
+
+    def on_resize(self) -> None:
+        self._schedule_sync()
+
     def add_message(self, message: Message) -> None:
-        message_item = self._create_message(message)
-        self.mount(message_item)
+        self.store.add(message)
+
+    def _on_conversation_event(self, event: ConversationEvent) -> None:
+        match event.type:
+            case ConversationEventType.ADDED:
+                self._on_message_added(event.index)
+
+            case ConversationEventType.APPENDED:
+                widget = self._widgets.get(event.index)
+
+                # Unmounted records pick up the new text when they are mounted
+                if isinstance(widget, AgentMessage):
+                    self.call_later(self._append_to_widget, widget, event.text)
+
+            case ConversationEventType.CLEARED:
+                self._heights.clear()
+                self._widgets.clear()
+
+                self.styles.padding = (0, 0, 0, 0)
+                self.remove_children()
+
+    def _on_message_added(self, index: int) -> None:
+        self._heights.append(self._estimate_height(self.store[index]))
+
+        if self._scroller is not None and not self._extends_window(index):
+            self._update_padding()
+            self._schedule_sync()
+            return
+
+        self.mount(self._mount_record(index))
+        self._schedule_sync()
+
+    def _schedule_sync(self, *_) -> None:
+        if self._sync_scheduled or self._scroller is None:
+            return
+
+        self._sync_scheduled = True
+        self.call_after_refresh(self._sync_window)
+
+    async def _sync_window(self) -> None:
+        self._sync_scheduled = False
+
+        # Runs on this widget's message queue, so it never interleaves with
+        # the appends scheduled by `_on_conversation_event`
+        changed = self._measure_heights()
+        start, end = self._visible_window()
+
+        removed = [i for i in self._widgets if not start <= i < end]
+        if removed:
+            await self.remove_children([self._widgets.pop(i) for i in removed])
+
+            # The store may have been cleared while the widgets were removed
+            end = min(end, len(self.store))
+
+        mounted = sorted(self._widgets)
+        before = [i for i in range(start, end) if not mounted or i < mounted[0]]
+        after = [i for i in range(start, end) if mounted and i > mounted[-1]]
+
+        if before:
+            widgets = [self._mount_record(i) for i in before]
+            await self.mount_all(widgets, before=0)
+
+        if after:
+            widgets = [self._mount_record(i) for i in after]
+            await self.mount_all(widgets)
+
+        self._update_padding()
+
+        # Newly mounted widgets replace estimates with real heights on the next
+        # pass, which may shift the window again until it settles
+        if changed or removed or before or after:
+            self._schedule_sync()
+
+    async def _append_to_widget(self, widget: AgentMessage, text: str) -> None:
+        # The window may have moved since the append was scheduled
+        if widget in self._widgets.values():
+            await widget.append(text)
+
+    def _extends_window(self, index: int) -> bool:
+        # Only grow the mounted window when it already reaches the new message
+        if self._widgets and index - 1 not in self._widgets:
+            return False
+
+        _, end = self._visible_window()
+        return index < end
+
+    def _mount_record(self, index: int) -> MessageWidget:
+        widget = self._create_message(self.store[index])
+        self._widgets[index] = widget
+        return widget
+
+    def _visible_window(self) -> tuple[int, int]:
+        if self._scroller is None or not len(self.store):
+            return 0, len(self.store)
+
+        viewport_top = self._scroller.scroll_y - self.virtual_region.y
+        viewport_bottom = viewport_top + self._scroller.size.height
+
+        first = len(self.store) - 1
+        last = 0
+        y = 0
+
+        for index, height in enumerate(self._heights):
+            if y + height > viewport_top and index < first:
+                first = index
+            if y < viewport_bottom:
+                last = index
+            y += height
+
+        first = min(first, last)
+
+        return (
+            max(0, first - self.OVERSCAN),
+            min(len(self.store), last + 1 + self.OVERSCAN),
+        )
+
+    def _measure_heights(self) -> bool:
+        changed = False
+
+        for index, widget in self._widgets.items():
+            height = widget.outer_size.height
+
+            if height:
+                height += widget.styles.margin.height
+                changed = changed or self._heights[index] != height
+                self._heights[index] = height
+
+        return changed
+
+    def _update_padding(self) -> None:
+        if not self._widgets:
+            top, bottom = sum(self._heights), 0
+        else:
+            mounted = sorted(self._widgets)
+            top = sum(self._heights[: mounted[0]])
+            bottom = sum(self._heights[mounted[-1] + 1 :])
+
+        self.styles.padding = (top, 0, bottom, 0)
+
+    def _estimate_height(self, message: Message) -> int:
+        width = max(self.size.width, 20)
+        lines = sum(len(line) // width + 1 for line in message.content.splitlines())
+
+        # Role label, content and bottom margin
+        return lines + 2
 
-    def _create_message(
-        self, message: Message
-    ) -> SystemMessage | UserMessage | AgentMessage | ToolMessage:
+    def _create_message(self, message: Message) -> MessageWidget:
         match message.type:
             case RoleType.SYSTEM:
                 system_message = SystemMessage()
@@ -4,15 +4,19 @@ from textual.widgets import Label
 
 from agent_chat_cli.components.flex import Flex
 from agent_chat_cli.components.spacer import Spacer
-from agent_chat_cli.utils.config import load_config
+from agent_chat_cli.utils.config import ConfigChange, ConfigService, load_config
+from agent_chat_cli.utils.enums import TimelineStatus
 from agent_chat_cli.utils.mcp_server_status import MCPServerStatus
+from agent_chat_cli.utils.startup_timeline import StartupTimeline, TimelineEntry
+from agent_chat_cli.utils.turn_metrics import format_ms
 
 
 class Header(Widget):
     def compose(self) -> ComposeResult:
         config = load_config()
 
-        mcp_servers = ", ".join(config.mcp_servers.keys())
+        self._server_names = list(config.mcp_servers.keys())
+        mcp_servers = ", ".join(self._server_names)
         agents = ", ".join(config.agents.keys())
 
         yield Label(
@@ -23,6 +27,10 @@ class Header(Widget):
             yield Label("Available MCP Servers:", classes="dim")
             yield Label(f" {mcp_servers}", id="header-mcp-servers")
 
+        with Flex():
+            yield Label("Startup:", classes="dim")
+            yield Label(f" {self._format_timeline()}", id="header-startup")
+
         if agents:
             with Flex():
                 yield Label("Agents:", classes="dim")
@@ -37,20 +45,31 @@ class Header(Widget):
 
     def on_mount(self) -> None:
         MCPServerStatus.subscribe(self._handle_mcp_server_status)
+        StartupTimeline.subscribe(self._handle_startup_timeline)
+        ConfigService.subscribe(self._handle_config_change)
 
     def on_unmount(self) -> None:
         MCPServerStatus.unsubscribe(self._handle_mcp_server_status)
+        StartupTimeline.unsubscribe(self._handle_startup_timeline)
+        ConfigService.unsubscribe(self._handle_config_change)
 
-    def _handle_mcp_server_status(self) -> None:
-        config = load_config()
-        server_names = list(config.mcp_servers.keys())
+    def _handle_config_change(self, change: ConfigChange) -> None:
+        if "mcp_servers" not in change.sections:
+            return
+
+        self._server_names = list(change.config.mcp_servers.keys())
+        self._handle_mcp_server_status()
 
+    def _handle_mcp_server_status(self) -> None:
         server_parts = []
-        for name in server_names:
+        for name in self._server_names:
             is_connected = MCPServerStatus.is_connected(name)
 
             if is_connected:
                 server_parts.append(f"{name}")
+            elif MCPServerStatus.get_status(name) == "pending":
+                # Still starting; it attaches once ready
+                server_parts.append(f"[dim]{name}[/dim]")
             else:
                 # Error connecting to MCP
                 server_parts.append(f"[#ffa2dc][strike]{name}[/strike][/]")
@@ -59,3 +78,29 @@ class Header(Widget):
 
         label = self.query_one("#header-mcp-servers", Label)
         label.update(f" {mcp_servers}")
+
+    def _handle_startup_timeline(self) -> None:
+        label = self.query_one("#header-startup", Label)
+        label.update(f" {self._format_timeline()}")
+
+    def _format_timeline(self) -> str:
+        return ", ".join(
+            self._format_entry(entry) for entry in StartupTimeline.entries()
+        )
+
+    def _format_entry(self, entry: TimelineEntry) -> str:
+        duration = format_ms(entry.duration_ms or 0)
+
+        match entry.status:
+            case TimelineStatus.RUNNING:
+                return f"[dim]{entry.name}[/dim]"
+            case TimelineStatus.LAZY:
+                return f"{entry.name} lazy"
+            case TimelineStatus.TIMEOUT:
+                return f"[#ffa2dc]{entry.name} timeout {duration}[/]"
+            case TimelineStatus.LATE:
+                return f"{entry.name} {duration} (late)"
+            case TimelineStatus.FAILED:
+                return f"[#ffa2dc][strike]{entry.name}[/strike][/]"
+            case _:
+                return f"{entry.name} {duration}"
@@ -1,27 +1,23 @@
-from dataclasses import dataclass
-from enum import Enum
-from typing import Any
-
 from textual.widget import Widget
-from textual.widgets import Label, Markdown
+from textual.widgets import Label
 from textual.app import ComposeResult
+from textual.css.query import NoMatches
 from rich.markup import escape
 
+from agent_chat_cli.components.streaming_markdown import StreamingMarkdown
+from agent_chat_cli.core.conversation_store import Message
+from agent_chat_cli.utils.enums import RoleType
 from agent_chat_cli.utils import get_tool_info, format_tool_input
 
 
-class RoleType(Enum):
-    SYSTEM = "system"
-    USER = "user"
-    AGENT = "agent"
-    TOOL = "tool"
-
-
-@dataclass
-class Message:
-    type: RoleType
-    content: str
-    metadata: dict[str, Any] | None = None
+__all__ = [
+    "AgentMessage",
+    "Message",
+    "RoleType",
+    "SystemMessage",
+    "ToolMessage",
+    "UserMessage",
+]
 
 
 class SystemMessage(Widget):
@@ -36,6 +32,8 @@ class UserMessage(Widget):
     message: str = ""
 
     def compose(self) -> ComposeResult:
+        from textual.widgets import Markdown
+
         yield Label("[bold][#a3c1ad]You:[/][/bold]")
         yield Markdown(self.message)
 
@@ -45,7 +43,21 @@ class AgentMessage(Widget):
 
     def compose(self) -> ComposeResult:
         yield Label("[bold][#1995bb]Agent:[/][/bold]")
-        yield Markdown(self.message)
+        yield StreamingMarkdown(self.message)
+
+    @property
+    def source(self) -> str:
+        return self.query_one(StreamingMarkdown).source
+
+    async def append(self, text: str) -> None:
+        try:
+            markdown = self.query_one(StreamingMarkdown)
+        except NoMatches:
+            # Not composed yet, so the text is picked up by compose()
+            self.message += text
+            return
+
+        await markdown.append(text)
 
 
 class ToolMessage(Widget):
@@ -0,0 +1,66 @@
+from typing import TYPE_CHECKING
+
+from textual.widget import Widget
+from textual.app import ComposeResult
+from textual.containers import VerticalScroll
+from textual.widgets import OptionList
+from textual.widgets.option_list import Option
+
+if TYPE_CHECKING:
+    from agent_chat_cli.core.actions import Actions
+
+# Longest preview of a queued message shown in the menu
+PREVIEW_LENGTH = 60
+
+
+class QueueMenu(Widget):
+    """Lists messages waiting for the agent; selecting one cancels it."""
+
+    def __init__(self, actions: Actions) -> None:
+        super().__init__()
+        self.actions = actions
+
+    def compose(self) -> ComposeResult:
+        yield OptionList()
+
+    def show(self, prompts: list[str]) -> None:
+        option_list = self.query_one(OptionList)
+        option_list.clear_options()
+
+        for index, prompt in enumerate(prompts):
+            option_list.add_option(
+                Option(f"{index + 1}. {_preview(prompt)}", id=str(index))
+            )
+
+        self.add_class("visible")
+
+        scroll_containers = self.app.query(VerticalScroll)
+        if scroll_containers:
+            scroll_containers.first().scroll_end(animate=False)
+
+        option_list.highlighted = 0
+        option_list.focus()
+
+    def hide(self) -> None:
+        self.remove_class("visible")
+
+    @property
+    def is_visible(self) -> bool:
+        return self.has_class("visible")
+
+    async def on_option_list_option_selected(
+        self, event: OptionList.OptionSelected
+    ) -> None:
+        self.hide()
+
+        if event.option_id is not None:
+            await self.actions.cancel_queued_prompt(int(event.option_id))
+
+
+def _preview(prompt: str) -> str:
+    line = " ".join(prompt.split())
+
+    if len(line) <= PREVIEW_LENGTH:
+        return line
+
+    return line[: PREVIEW_LENGTH - 1] + "…"
@@ -13,6 +13,10 @@ COMMANDS = [
     {"id": "clear", "label": "/clear - Clear chat history"},
     {"id": "model", "label": "/model - Change model"},
     {"id": "save", "label": "/save  - Save conversation to markdown"},
+    {"id": "queue", "label": "/queue - Show or cancel queued messages"},
+    {"id": "restore", "label": "/restore - Restore the session that crashed"},
+    {"id": "search", "label": "/search - Search saved conversations"},
+    {"id": "stats", "label": "/stats - Show latency and cost for this session"},
     {"id": "exit", "label": "/exit  - Exit"},
 ]
 
@@ -87,5 +91,13 @@ class SlashCommandMenu(Widget):
                 await self.actions.new()
             case "model":
                 self.actions.show_model_menu()
+            case "queue":
+                await self.actions.show_queue_menu()
+            case "search":
+                self.actions.start_search()
+            case "restore":
+                await self.actions.restore()
+            case "stats":
+                await self.actions.show_stats()
             case "save":
                 await self.actions.save()
@@ -0,0 +1,210 @@
+import asyncio
+import re
+from typing import TYPE_CHECKING
+
+from textual.app import ComposeResult
+from textual.widget import Widget
+
+# Markdown (and its parser and syntax highlighting) is only imported once the
+# first message is shown, so it stays off the path to the first frame
+if TYPE_CHECKING:
+    from textual.widgets import Markdown
+
+FENCE_PATTERN = re.compile(r"^ {0,3}(`{3,}|~{3,})")
+LIST_ITEM_PATTERN = re.compile(r"^ {0,3}([-+*]|\d{1,9}[.)])(\s|$)")
+
+# A partial line that more text could still turn into a list item
+PARTIAL_LIST_ITEM_PATTERN = re.compile(r"^ {0,3}\d{1,9}$")
+
+
+def split_blocks(text: str) -> tuple[list[str], str]:
+    """Split markdown into finalized top-level blocks and the trailing open block.
+
+    A block is finalized once a blank line (outside of a code fence) is followed
+    by an unindented line that does not continue a list, or once a top-level
+    code fence closes. Anything after the last finalized block may still change
+    as more text streams in.
+    """
+    splitter = BlockSplitter()
+    blocks = splitter.feed(text)
+
+    return blocks, splitter.open_block
+
+
+class BlockSplitter:
+    """`split_blocks` for text that arrives in fragments.
+
+    Complete lines are scanned once, with the fence and blank-line state kept
+    between calls, so a fragment costs the same however long the open block
+    (a long code fence or list) has grown.
+    """
+
+    def __init__(self) -> None:
+        # Complete lines of the open block, and the fragments of the line
+        # still being written (joined once its newline arrives)
+        self._lines: list[str] = []
+        self._partial: list[str] = []
+        self._partial_checked = False
+
+        self._fence: str | None = None
+        self._fence_is_top_level = False
+        self._after_blank = False
+
+    @property
+    def open_block(self) -> str:
+        return "".join(self._lines) + "".join(self._partial)
+
+    def feed(self, fragment: str) -> list[str]:
+        """Add text and return the blocks it finalized."""
+        blocks: list[str] = []
+
+        if not fragment:
+            return blocks
+
+        self._partial.append(fragment)
+
+        if "\n" in fragment:
+            text = "".join(self._partial)
+            start = 0
+
+            while (end := text.find("\n", start)) != -1:
+                line = text[start : end + 1]
+                start = end + 1
+
+                if self._ends_block(line):
+                    blocks.append(self._take_block())
+
+                self._after_blank = False
+                self._lines.append(line)
+
+                if self._scan(line):
+                    blocks.append(self._take_block())
+
+            self._partial = [text[start:]] if start < len(text) else []
+            self._partial_checked = False
+
+        if self._partial and self._after_blank and not self._partial_checked:
+            partial = "".join(self._partial)
+
+            # A line's start is usually enough to end the previous block, but
+            # `1` may still become `1. item` and continue a list
+            if not PARTIAL_LIST_ITEM_PATTERN.match(partial):
+                self._partial_checked = True
+
+                if self._ends_block(partial):
+                    blocks.append(self._take_block())
+
+        return blocks
+
+    def _ends_block(self, line: str) -> bool:
+        return (
+            self._after_blank
+            and line[:1] not in (" ", "\t", "\n", "\r")
+            and not (
+                LIST_ITEM_PATTERN.match(line)
+                and LIST_ITEM_PATTERN.match(self._lines[0])
+            )
+        )
+
+    def _scan(self, line: str) -> bool:
+        # True when the line closes a top-level code fence
+        match = FENCE_PATTERN.match(line)
+
+        if self._fence is not None:
+            if (
+                match
+                and match.group(1)[0] == self._fence[0]
+                and len(match.group(1)) >= len(self._fence)
+                and not line[match.end() :].strip()
+            ):
+                self._fence = None
+                return self._fence_is_top_level
+        elif match:
+            self._fence = match.group(1)
+            self._fence_is_top_level = not line[:1].isspace()
+        elif not line.strip():
+            self._after_blank = True
+
+        return False
+
+    def _take_block(self) -> str:
+        block = "".join(self._lines)
+        self._lines = []
+        self._after_blank = False
+
+        return block
+
+
+class StreamingMarkdown(Widget):
+    """Markdown document that grows by appending fragments.
+
+    Finalized blocks are parsed and mounted once as their own Markdown widget;
+    only the trailing open block is re-parsed as new text arrives, so the cost
+    of an append does not grow with the length of the document.
+    """
+
+    def __init__(self, markdown: str = "") -> None:
+        super().__init__()
+
+        self._splitter = BlockSplitter()
+        self._blocks: list[str] = self._splitter.feed(markdown)
+        self._tail_widget: "Markdown | None" = None
+
+        # What has been handed to widgets so far
+        self._rendered_blocks = 0
+        self._rendered_tail = ""
+        self._render_lock = asyncio.Lock()
+
+    @property
+    def source(self) -> str:
+        return "".join(self._blocks) + self._splitter.open_block
+
+    def compose(self) -> ComposeResult:
+        from textual.widgets import Markdown
+
+        open_block = self._splitter.open_block
+
+        for block in self._blocks:
+            yield Markdown(block, classes="block")
+
+        self._rendered_blocks = len(self._blocks)
+        self._rendered_tail = open_block
+        self._tail_widget = Markdown(open_block)
+        yield self._tail_widget
+
+    async def on_mount(self) -> None:
+        await self._render_pending()
+
+    async def append(self, fragment: str) -> None:
+        if not fragment:
+            return
+
+        self._blocks.extend(self._splitter.feed(fragment))
+
+        # Until the tail is mounted, on_mount renders whatever has arrived
+        if self._tail_widget is None or not self._tail_widget.is_mounted:
+            return
+
+        await self._render_pending()
+
+    async def _render_pending(self) -> None:
+        if self._tail_widget is None:
+            return
+
+        from textual.widgets import Markdown
+
+        async with self._render_lock:
+            finalized = self._blocks[self._rendered_blocks :]
+            self._rendered_blocks = len(self._blocks)
+
+            if finalized:
+                await self.mount_all(
+                    [Markdown(block, classes="block") for block in finalized],
+                    before=self._tail_widget,
+                )
+
+            open_block = self._splitter.open_block
+
+            if open_block != self._rendered_tail:
+                self._rendered_tail = open_block
+                await self._tail_widget.update(open_block)
@@ -10,13 +10,26 @@ from agent_chat_cli.components.flex import Flex
 class ThinkingIndicator(Widget):
     is_thinking: var[bool] = var(False)
 
+    # Messages waiting for the agent to finish
+    queued: var[int] = var(0)
+
     def compose(self) -> ComposeResult:
         with Flex():
             yield BalloonSpinner()
-            yield Label("Agent is thinking...", classes="dim")
+            yield Label(self._label(), id="thinking-label", classes="dim")
 
     def on_mount(self) -> None:
         self.display = False
 
     def watch_is_thinking(self, is_thinking: bool) -> None:
         self.display = is_thinking
+
+    def watch_queued(self) -> None:
+        if self.is_mounted:
+            self.query_one("#thinking-label", Label).update(self._label())
+
+    def _label(self) -> str:
+        if not self.queued:
+            return "Agent is thinking..."
+
+        return f"Agent is thinking... ({self.queued} queued, /queue to cancel)"
@@ -17,10 +17,20 @@ if TYPE_CHECKING:
     from agent_chat_cli.core.actions import Actions
 
 
+SINGLE_HINT = (
+    "  Allow? (Enter=yes, s=this call for the session, "
+    "a=allow this tool for this session, ESC=no, or ask another question):"
+)
+BATCH_HINT = (
+    "  Allow all? (Enter=yes, 1 3=only those, s=these calls for the session, "
+    "a=allow these tools for this session, ESC=no, or ask another question):"
+)
+
+
 class ToolPermissionPrompt(Widget):
     is_visible = reactive(False)
-    tool_name = reactive("")
-    tool_input: dict[str, Any] = reactive({}, init=False)  # type: ignore[assignment]
+    # Tool calls awaiting an answer, each with its `tool_name` and `tool_input`
+    requests: list[dict[str, Any]] = reactive([], init=False)  # type: ignore[assignment]
 
     BINDINGS = [
         Binding(Key.ENTER.value, "submit", "Submit", priority=True),
@@ -32,9 +42,7 @@ class ToolPermissionPrompt(Widget):
 
     def compose(self) -> ComposeResult:
         yield Label("", id="tool-display")
-        yield Label(
-            "  Allow? (Enter=yes, ESC=no, or ask another question):", classes="dim"
-        )
+        yield Label(SINGLE_HINT, id="permission-hint", classes="dim")
 
         yield Spacer()
 
@@ -56,22 +64,28 @@ class ToolPermissionPrompt(Widget):
             input_widget.clear()
             input_widget.focus()
 
-    def watch_tool_name(self, tool_name: str) -> None:
-        if not tool_name:
+    def watch_requests(self, requests: list[dict[str, Any]]) -> None:
+        if not requests:
             return
 
-        tool_info = get_tool_info(tool_name)
         tool_display_label = self.query_one("#tool-display", Label)
+        hint_label = self.query_one("#permission-hint", Label)
 
-        if tool_info["server_name"]:
-            tool_display = (
-                rf"[bold]Confirm Tool:[/] [cyan]\[{tool_info['server_name']}][/] "
-                f"{tool_info['tool_name']}"
+        if len(requests) == 1:
+            tool_display_label.update(
+                f"[bold]Confirm Tool:[/] {_describe(requests[0]['tool_name'])}"
             )
-        else:
-            tool_display = f"[bold]Confirm Tool:[/] {tool_name}"
+            hint_label.update(SINGLE_HINT)
+            return
+
+        lines = [f"[bold]Confirm {len(requests)} Tools:[/]"]
+        lines.extend(
+            f"  {position}. {_describe(request['tool_name'])}"
+            for position, request in enumerate(requests, start=1)
+        )
 
-        tool_display_label.update(tool_display)
+        tool_display_label.update("\n".join(lines))
+        hint_label.update(BATCH_HINT)
 
     async def action_submit(self) -> None:
         input_widget = self.query_one("#permission-input", TextArea)
@@ -106,3 +120,12 @@ class ToolPermissionPrompt(Widget):
             input_widget.insert("no")
 
             await self.action_submit()
+
+
+def _describe(tool_name: str) -> str:
+    tool_info = get_tool_info(tool_name)
+
+    if tool_info["server_name"]:
+        return rf"[cyan]\[{tool_info['server_name']}][/] {tool_info['tool_name']}"
+
+    return tool_name
@@ -0,0 +1,21 @@
+from textual.widget import Widget
+from textual.widgets import Label
+from textual.app import ComposeResult
+from textual.reactive import var
+
+
+class TurnSummary(Widget):
+    # Timings and cost of the last answer, empty while the agent is busy
+    text: var[str] = var("")
+
+    def compose(self) -> ComposeResult:
+        yield Label("", id="turn-summary-label", classes="dim")
+
+    def on_mount(self) -> None:
+        self.display = False
+
+    def watch_text(self, text: str) -> None:
+        self.display = bool(text)
+
+        if self.is_mounted:
+            self.query_one("#turn-summary-label", Label).update(text)
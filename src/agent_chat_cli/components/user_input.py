@@ -3,11 +3,13 @@ from textual.app import ComposeResult
 from textual.widgets import TextArea, OptionList
 from textual.binding import Binding
 from textual.events import DescendantBlur
+from textual.reactive import var
 
 from agent_chat_cli.components.caret import Caret
 from agent_chat_cli.components.flex import Flex
 from agent_chat_cli.components.slash_command_menu import SlashCommandMenu
 from agent_chat_cli.components.model_selection_menu import ModelSelectionMenu
+from agent_chat_cli.components.queue_menu import QueueMenu
 from agent_chat_cli.core.actions import Actions
 from agent_chat_cli.utils.enums import Key
 
@@ -17,6 +19,9 @@ class UserInput(Widget):
         Binding(Key.ENTER.value, "submit", "Submit", priority=True),
     ]
 
+    # Set by /search: the next submission is a search query, not a message
+    search_mode = var(False, init=False)
+
     def __init__(self, actions: Actions) -> None:
         super().__init__()
         self.actions = actions
@@ -37,6 +42,7 @@ class UserInput(Widget):
             actions=self.actions, on_filter_change=self._on_filter_change
         )
         yield ModelSelectionMenu(actions=self.actions)
+        yield QueueMenu(actions=self.actions)
 
     def _on_filter_change(self, char: str) -> None:
         text_area = self.query_one(TextArea)
@@ -45,6 +51,10 @@ class UserInput(Widget):
         else:
             text_area.insert(char)
 
+    def watch_search_mode(self, search_mode: bool) -> None:
+        input_widget = self.query_one(TextArea)
+        input_widget.placeholder = "Search saved conversations" if search_mode else ""
+
     def on_mount(self) -> None:
         input_widget = self.query_one(TextArea)
         input_widget.focus()
@@ -78,6 +88,13 @@ class UserInput(Widget):
             self._close_menu(event, menu)
             return
 
+        if self.search_mode and event.key == Key.ESCAPE.value:
+            event.stop()
+            event.prevent_default()
+            self.search_mode = False
+            self.query_one(TextArea).clear()
+            return
+
         if event.key == "up":
             await self._navigate_history(event, direction=-1)
             return
@@ -96,7 +113,9 @@ class UserInput(Widget):
         input_widget = self.query_one(TextArea)
         input_widget.insert("\n")
 
-    def _close_menu(self, event, menu: SlashCommandMenu | ModelSelectionMenu) -> None:
+    def _close_menu(
+        self, event, menu: SlashCommandMenu | ModelSelectionMenu | QueueMenu
+    ) -> None:
         if event.key == Key.ESCAPE.value:
             event.stop()
             event.prevent_default()
@@ -152,7 +171,9 @@ class UserInput(Widget):
         input_widget.text = self.message_history[self.history_index]
         input_widget.move_cursor_relative(rows=999, columns=999)
 
-    def _get_visible_menu(self) -> SlashCommandMenu | ModelSelectionMenu | None:
+    def _get_visible_menu(
+        self,
+    ) -> SlashCommandMenu | ModelSelectionMenu | QueueMenu | None:
         slash_menu = self.query_one(SlashCommandMenu)
         if slash_menu.is_visible:
             return slash_menu
@@ -161,6 +182,10 @@ class UserInput(Widget):
         if model_menu.is_visible:
             return model_menu
 
+        queue_menu = self.query_one(QueueMenu)
+        if queue_menu.is_visible:
+            return queue_menu
+
         return None
 
     async def action_submit(self) -> None:
@@ -180,6 +205,12 @@ class UserInput(Widget):
         if not user_message:
             return
 
+        if self.search_mode:
+            self.search_mode = False
+            input_widget.clear()
+            await self.actions.search(user_message)
+            return
+
         self.message_history.append(user_message)
         self.history_index = None
         self.draft_message = ""
@@ -1,11 +1,24 @@
+import asyncio
+import sqlite3
+import time
+from dataclasses import asdict
 from typing import TYPE_CHECKING
 
-from agent_chat_cli.utils.enums import ControlCommand
-from agent_chat_cli.components.messages import RoleType
-from agent_chat_cli.components.chat_history import ChatHistory
+from rich.markup import escape
+
+from agent_chat_cli.core.agent_loop import AppEvent
+from agent_chat_cli.utils.enums import AppEventType, ControlCommand, RoleType
 from agent_chat_cli.components.tool_permission_prompt import ToolPermissionPrompt
+from agent_chat_cli.utils.journal import mark_finished
 from agent_chat_cli.utils.logger import log_json
+from agent_chat_cli.utils.permission_cache import (
+    DENY_RESPONSES,
+    is_approval,
+    parse_selection,
+)
 from agent_chat_cli.utils.save_conversation import save_conversation
+from agent_chat_cli.utils.search_index import MATCH_END, MATCH_START, SearchHit
+from agent_chat_cli.utils.tracing import Tracer
 
 if TYPE_CHECKING:
     from agent_chat_cli.app import AgentChatCLIApp
@@ -20,10 +33,16 @@ class Actions:
         await self._query(message)
 
     async def post_system_message(self, message: str, thinking: bool = True) -> None:
-        await self.app.renderer.add_message(RoleType.SYSTEM, message, thinking=thinking)
+        # Queued like every other event, so it lands after text already streamed
+        await self.post_app_event(
+            AppEvent(
+                type=AppEventType.SYSTEM,
+                data={"message": message, "thinking": thinking},
+            )
+        )
 
     async def post_app_event(self, event) -> None:
-        await self.app.renderer.handle_app_event(event)
+        await self.app.renderer.events.put(event)
 
     async def interrupt(self) -> None:
         permission_prompt = self.app.query_one(ToolPermissionPrompt)
@@ -31,8 +50,7 @@ class Actions:
             return
 
         self.app.ui_state.stop_thinking()
-        self.app.ui_state.set_interrupting(True)
-        await self.app.agent_loop.client.interrupt()
+        await self.app.agent_loop.interrupt()
 
     async def clear(self) -> None:
         await self.app.renderer.reset_chat_history()
@@ -55,29 +73,150 @@ class Actions:
 
         await self.app.agent_loop.permission_response_queue.put(response)
 
+        batch_size = len(self.app.query_one(ToolPermissionPrompt).requests)
         self.app.ui_state.hide_permission_prompt()
         self.app.ui_state.start_thinking()
 
         normalized = response.lower().strip()
-        if normalized not in ["y", "yes", "allow", ""]:
-            if normalized in ["n", "no", "deny"]:
+
+        # Picking some tools of a batch lets the turn go on with those
+        if (
+            not is_approval(normalized)
+            and parse_selection(normalized, batch_size) is None
+        ):
+            if normalized in DENY_RESPONSES:
                 await self._query("The user has denied the tool")
             else:
                 await self.post_user_message(response)
 
     async def save(self) -> None:
-        chat_history = self.app.query_one(ChatHistory)
-        file_path = save_conversation(chat_history)
+        with Tracer.span("save", "actions", messages=len(self.app.conversation)):
+            file_path = save_conversation(self.app.conversation)
+
         await self.post_system_message(
             f"Conversation saved to {file_path}", thinking=False
         )
 
+    async def restore(self) -> None:
+        snapshot = self.app.agent_loop.unfinished_session
+
+        if snapshot is None:
+            await self.post_system_message("Nothing to restore", thinking=False)
+            return
+
+        self.app.agent_loop.unfinished_session = None
+        mark_finished(snapshot.path)
+
+        await self.clear()
+
+        for message in snapshot.messages:
+            self.app.conversation.add(message)
+
+        if snapshot.session_id:
+            await self.app.agent_loop.resume(snapshot.session_id)
+
+        await self.post_system_message(
+            f"Restored {len(snapshot.messages)} messages from {snapshot.path}",
+            thinking=False,
+        )
+
+    def start_search(self) -> None:
+        self.app.ui_state.start_search()
+
+    async def search(self, query: str) -> None:
+        started = time.perf_counter()
+
+        try:
+            # Picks up conversations saved since the index was last updated
+            with Tracer.span("search", "actions") as span:
+                hits = await asyncio.to_thread(self._update_and_search, query)
+                span.set(hits=len(hits))
+        except sqlite3.Error as error:
+            await self.post_system_message(f"Search failed: {error}", thinking=False)
+            return
+
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        log_json(
+            {
+                "event": "search",
+                "hits": len(hits),
+                "elapsed_ms": round(elapsed_ms, 1),
+            }
+        )
+
+        if not hits:
+            await self.post_system_message(
+                f"No matches for {escape(query)!r}", thinking=False
+            )
+            return
+
+        lines = [f"Found {len(hits)} for {escape(query)!r} ({elapsed_ms:.0f}ms):"]
+        lines.extend(
+            f"{position}. {_format_hit(hit)}"
+            for position, hit in enumerate(hits, start=1)
+        )
+
+        await self.post_system_message("\n".join(lines), thinking=False)
+
+    async def index_conversations(self) -> None:
+        try:
+            update = await asyncio.to_thread(self.app.search_index.update)
+        except sqlite3.Error as error:
+            log_json({"event": "search_index_failed", "error": str(error)})
+            return
+
+        log_json({"event": "search_index_updated", **asdict(update)})
+
+    def _update_and_search(self, query: str) -> list[SearchHit]:
+        self.app.search_index.update()
+        return self.app.search_index.search(query)
+
     def show_model_menu(self) -> None:
         self.app.ui_state.show_model_menu()
 
+    async def show_queue_menu(self) -> None:
+        prompts = self.app.agent_loop.query_queue.pending_prompts()
+
+        if not prompts:
+            await self.post_system_message("No queued messages", thinking=False)
+            return
+
+        self.app.ui_state.show_queue_menu(prompts)
+
+    async def cancel_queued_prompt(self, index: int) -> None:
+        prompt = self.app.agent_loop.query_queue.cancel_prompt(index)
+
+        # It may have been sent while the menu was open
+        if prompt is None:
+            return
+
+        await self.post_system_message(
+            f"Cancelled queued message: {prompt}", thinking=False
+        )
+
     async def change_model(self, model: str) -> None:
         await self.app.agent_loop.change_model(model)
         await self.post_system_message(f"Switched to {model}", thinking=False)
 
+    async def show_stats(self) -> None:
+        agent_loop = self.app.agent_loop
+        cache = agent_loop.permission_cache.stats()
+
+        await self.post_system_message(
+            f"{agent_loop.metrics.report()}\n"
+            f"Permissions remembered: {cache['tools']} tools, {cache['calls']} calls "
+            f"({cache['hits']} prompts skipped)",
+            thinking=False,
+        )
+
     async def _query(self, user_input: str) -> None:
         await self.app.agent_loop.query_queue.put(user_input)
+
+
+def _format_hit(hit: SearchHit) -> str:
+    # escape() leaves a `[` that doesn't look like a tag, e.g. `[\x02key`, which
+    # would open the highlight's tag early; escape every bracket instead
+    snippet = " ".join(hit.snippet.split()).replace("[", r"\[")
+    snippet = snippet.replace(MATCH_START, "[bold]").replace(MATCH_END, "[/bold]")
+
+    return f"{escape(hit.path)} ({hit.role}): {snippet}"
@@ -1,25 +1,16 @@
 import asyncio
-from typing import Any, TYPE_CHECKING
+import importlib
+import time
+from typing import Any, Coroutine, TYPE_CHECKING
 from dataclasses import dataclass
 
-from claude_agent_sdk import (
-    ClaudeAgentOptions,
-    ClaudeSDKClient,
-)
-from claude_agent_sdk.types import (
-    AssistantMessage,
-    Message,
-    StreamEvent,
-    SystemMessage,
-    TextBlock,
-    ToolUseBlock,
-    ToolPermissionContext,
-    PermissionResult,
-    PermissionResultAllow,
-    PermissionResultDeny,
-)
-
+from agent_chat_cli.core.mcp_manager import MCPManager
+from agent_chat_cli.core.query_queue import QueryQueue, coalesce_prompts
 from agent_chat_cli.utils.config import (
+    APP_CONFIG_FIELDS,
+    RESTART_CONFIG_FIELDS,
+    ConfigChange,
+    ConfigService,
     load_config,
     get_available_servers,
     get_sdk_config,
@@ -29,11 +20,41 @@ from agent_chat_cli.utils.enums import (
     ContentType,
     ControlCommand,
     ModelChangeCommand,
+    PermissionAction,
+    ResumeCommand,
 )
-from agent_chat_cli.utils.logger import log_json
+from agent_chat_cli.utils.journal import (
+    Journal,
+    JournalSnapshot,
+    find_unfinished_session,
+)
+from agent_chat_cli.utils.logger import log_json, set_sample_rates
 from agent_chat_cli.utils.mcp_server_status import MCPServerStatus
+from agent_chat_cli.utils.permission_cache import (
+    ALLOW_CALL_RESPONSES,
+    ALLOW_TOOL_RESPONSES,
+    DENY_RESPONSES,
+    PermissionCache,
+    is_approval,
+    parse_selection,
+)
+from agent_chat_cli.utils.permission_policy import PermissionPolicy
+from agent_chat_cli.utils.startup_timeline import StartupTimeline
+from agent_chat_cli.utils.tracing import Span, Tracer
+from agent_chat_cli.utils.turn_metrics import SessionMetrics, TurnMetrics
 
+# The SDK is most of the cold start, so it is imported where it is used and
+# first loaded by `AgentLoop.start()` in a thread, after the UI has painted
 if TYPE_CHECKING:
+    from claude_agent_sdk import ClaudeSDKClient
+    from claude_agent_sdk.types import (
+        Message,
+        PermissionResult,
+        PermissionResultAllow,
+        PermissionResultDeny,
+        ToolPermissionContext,
+    )
+
     from agent_chat_cli.app import AgentChatCLIApp
 
 
@@ -43,87 +64,451 @@ class AppEvent:
     data: Any
 
 
+@dataclass
+class PermissionRequest:
+    tool_name: str
+    tool_input: dict[str, Any]
+    result: "asyncio.Future[PermissionResult]"
+
+
 class AgentLoop:
+    # How long an interrupted response may keep streaming before it is abandoned
+    DRAIN_TIMEOUT = 5.0
+
+    # How long to wait for the other tool calls of a turn before prompting
+    PERMISSION_BATCH_WINDOW = 0.05
+
     def __init__(
         self,
         app: "AgentChatCLIApp",
         session_id: str | None = None,
+        mcp_manager: MCPManager | None = None,
+        journal: bool = False,
     ) -> None:
         self.app = app
+
+        StartupTimeline.begin("config")
         self.config = load_config()
-        self.session_id = session_id
         self.available_servers = get_available_servers()
+        self.permission_policy = PermissionPolicy(self.config.permissions)
+        StartupTimeline.end("config")
 
-        self.client: ClaudeSDKClient
+        # Kept across /new, for as long as the app runs
+        self.permission_cache = PermissionCache()
 
-        self.query_queue: asyncio.Queue[str | ControlCommand | ModelChangeCommand] = (
-            asyncio.Queue()
-        )
+        # Latency and usage of recent turns, for /stats
+        self.metrics = SessionMetrics()
+        self._turn: TurnMetrics | None = None
+
+        # Spans of the turn in flight, and of its tool calls by tool_use_id
+        self._query_span: Span | None = None
+        self._tool_spans: dict[str, Span] = {}
+
+        # The previous run's transcript if it crashed, offered for /restore.
+        # Both are set up by `start`, off the event loop.
+        self.unfinished_session: JournalSnapshot | None = None
+        self.journal: Journal | None = None
+        self._journal_enabled = journal
+
+        self.session_id = session_id
+
+        # Outlives every client, so reconnecting never relaunches a server.
+        # Headless runs share one manager between all of their loops.
+        self._owns_mcp_manager = mcp_manager is None
+        self.mcp_manager = mcp_manager or MCPManager(self.available_servers)
+
+        self.client: "ClaudeSDKClient"
+
+        self.query_queue = QueryQueue()
         self.permission_response_queue: asyncio.Queue[str] = asyncio.Queue()
         self.permission_lock = asyncio.Lock()
 
+        # Tool calls waiting to be shown together in the next prompt
+        self._permission_batch: list[PermissionRequest] = []
+        self._permission_flush: asyncio.Task | None = None
+
+        # Set once the first client is connected and queries can be sent
+        self.ready = asyncio.Event()
+
         self._running = False
+        self._querying = False
+        self._interrupted = False
+        self._response_task: asyncio.Task | None = None
+        self._drain_task: asyncio.Task | None = None
+
+        # Pre-connected client for the next conversation, and the model it runs
+        self._standby_task: "asyncio.Task[ClaudeSDKClient] | None" = None
+        self._standby_model: str | None = None
+        self._background_tasks: set[asyncio.Task] = set()
 
     async def start(self) -> None:
-        await self._initialize_client()
+        # Cancellation is how the app quits; only an error leaves the journal
+        # open, so that the session is offered for /restore next time
+        clean_exit = False
+
+        try:
+            if self._journal_enabled:
+                await self._open_journal()
+
+            await self.mcp_manager.start()
+
+            StartupTimeline.begin("sdk")
+            await asyncio.to_thread(importlib.import_module, "claude_agent_sdk")
+            StartupTimeline.end("sdk")
+
+            StartupTimeline.begin("client")
+            await self._initialize_client()
+            StartupTimeline.end("client")
+            self.ready.set()
+
+            log_json(
+                {"event": "startup_complete", "timeline": StartupTimeline.as_dicts()}
+            )
+
+            self._warm_standby()
+
+            # Loops sharing a manager (headless runs) leave it to its owner
+            if self._owns_mcp_manager:
+                ConfigService.subscribe(self._on_config_change)
+
+            if self.unfinished_session is not None:
+                await self.app.actions.post_system_message(
+                    f"The last session ended unexpectedly "
+                    f"({len(self.unfinished_session.messages)} messages). "
+                    "Use /restore to bring it back.",
+                    thinking=False,
+                )
 
-        self._running = True
+            self._running = True
+            await self._run()
+            clean_exit = True
+        except asyncio.CancelledError:
+            clean_exit = True
+            raise
+        finally:
+            await self._shutdown(clean_exit)
 
+    async def _run(self) -> None:
         while self._running:
             user_input = await self.query_queue.get()
 
+            # Leftovers of an interrupted response must not leak into this one
+            await self._finish_drain()
+
             if isinstance(user_input, ModelChangeCommand):
+                # Switched in place; the conversation and subprocess are kept
                 self.config.model = user_input.model
+                await self.client.set_model(user_input.model)
+                continue
+
+            if isinstance(user_input, ResumeCommand):
+                self.session_id = user_input.session_id
                 await self.client.disconnect()
                 await self._initialize_client()
                 continue
 
             if isinstance(user_input, ControlCommand):
                 if user_input == ControlCommand.NEW_CONVERSATION:
-                    await self.client.disconnect()
                     self.session_id = None
-                    await self._initialize_client()
+                    await self._swap_in_standby()
+                elif user_input == ControlCommand.RECONNECT:
+                    await self._reconnect()
                 continue
 
-            self.app.ui_state.set_interrupting(False)
+            if self.config.coalesce_queued_prompts:
+                user_input = self._coalesce(user_input)
 
-            await self.client.query(user_input)
+            self._interrupted = False
+            self._querying = True
+            self._turn = TurnMetrics()
 
-            async for message in self.client.receive_response():
-                if self.app.ui_state.interrupting:
-                    continue
+            with Tracer.span("query", "agent_loop", chars=len(user_input)) as span:
+                self._query_span = span
 
-                await self._handle_message(message)
+                await self.client.query(user_input)
+
+                if not self._interrupted:
+                    self._response_task = asyncio.create_task(self._receive_response())
+
+                    try:
+                        await self._response_task
+                    except asyncio.CancelledError:
+                        # Only swallow the cancellation coming from interrupt()
+                        if not self._interrupted:
+                            raise
+                    finally:
+                        self._response_task = None
+
+                # Tool calls the response ended (or was interrupted) without
+                for tool_span in self._tool_spans.values():
+                    tool_span.end(finished=False)
+
+                self._tool_spans.clear()
+                self._query_span = None
+                span.set(interrupted=self._interrupted)
+
+            self._querying = False
+            turn = self._finish_turn()
 
             await self.app.actions.post_app_event(
-                AppEvent(type=AppEventType.RESULT, data=None)
+                AppEvent(type=AppEventType.RESULT, data={"summary": turn.summary()})
             )
 
+    def _finish_turn(self) -> TurnMetrics:
+        turn, self._turn = self._turn or TurnMetrics(), None
+        turn.finish(interrupted=self._interrupted)
+
+        self.metrics.add(turn)
+        log_json({"event": "turn_metrics", **turn.as_dict()})
+
+        return turn
+
+    def _coalesce(self, user_input: str) -> str:
+        # Prompts typed while the agent was busy become one turn, not one each
+        queued = self.query_queue.take_prompts()
+
+        if not queued:
+            return user_input
+
+        log_json({"event": "prompts_coalesced", "count": len(queued) + 1})
+
+        return coalesce_prompts([user_input, *queued])
+
+    async def _open_journal(self) -> None:
+        self.unfinished_session = await asyncio.to_thread(find_unfinished_session)
+        self.journal = await asyncio.to_thread(
+            Journal.create, self.app.conversation, self.config.journal_fsync
+        )
+
+    async def _shutdown(self, clean_exit: bool) -> None:
+        ConfigService.unsubscribe(self._on_config_change)
+
+        if self.journal is not None:
+            self.journal.close(finished=clean_exit)
+
+        await self._discard_standby()
+
+        if hasattr(self, "client"):
+            await self.client.disconnect()
+
+        if self._owns_mcp_manager:
+            await self.mcp_manager.stop()
+
+    async def interrupt(self) -> None:
+        """Abandon the in-flight response so the next query can start right away.
+
+        The SDK is still asked to stop, and whatever it sends until the result
+        arrives is drained in the background before the next query is sent.
+        """
+        if not self._querying or self._interrupted:
+            return
+
+        self._interrupted = True
+
+        if self._response_task is not None:
+            self._response_task.cancel()
+
+        self._drain_task = asyncio.create_task(self._drain_response())
+
+    async def _receive_response(self) -> None:
+        with Tracer.span("stream", "agent_loop"):
+            async for message in self.client.receive_response():
+                await self._handle_message(message)
+
+    async def _drain_response(self) -> None:
+        try:
+            async with asyncio.timeout(self.DRAIN_TIMEOUT):
+                await self.client.interrupt()
+
+                async for _ in self.client.receive_response():
+                    pass
+
+            return
+        except TimeoutError:
+            log_json({"event": "interrupt_drain_timeout"})
+        except Exception as error:
+            log_json({"event": "interrupt_drain_failed", "error": repr(error)})
+
+        # The unread rest of the response would be taken for the next one's,
+        # so the client is replaced; the conversation resumes by session_id
+        try:
+            await self._replace_client()
+        except Exception as error:
+            log_json({"event": "interrupt_reconnect_failed", "error": repr(error)})
+
+    async def _finish_drain(self) -> None:
+        if self._drain_task is None:
+            return
+
+        await self._drain_task
+        self._drain_task = None
+
     async def change_model(self, model: str) -> None:
         await self.query_queue.put(
             ModelChangeCommand(ControlCommand.CHANGE_MODEL, model)
         )
 
-    async def _initialize_client(self, mcp_servers: dict | None = None) -> None:
-        if mcp_servers is None:
-            mcp_servers = {
-                name: config.model_dump()
-                for name, config in self.available_servers.items()
-            }
-        sdk_config = get_sdk_config(self.config)
+    async def resume(self, session_id: str) -> None:
+        await self.query_queue.put(ResumeCommand(ControlCommand.RESUME, session_id))
 
-        sdk_config["mcp_servers"] = mcp_servers
-        sdk_config["can_use_tool"] = self._can_use_tool
+    async def _initialize_client(self) -> None:
+        self.client = await self._connect_client(resume=self.session_id)
 
-        if self.session_id:
-            sdk_config["resume"] = self.session_id
+    async def _connect_client(self, resume: str | None = None) -> "ClaudeSDKClient":
+        from claude_agent_sdk import (
+            AgentDefinition,
+            ClaudeAgentOptions,
+            ClaudeSDKClient,
+        )
+
+        sdk_config = get_sdk_config(self.config)
+
+        if sdk_config.get("agents"):
+            # The SDK serializes its own dataclass, not the dumped dicts
+            sdk_config["agents"] = {
+                name: AgentDefinition(**agent)
+                for name, agent in sdk_config["agents"].items()
+            }
 
         # Init the Agent
-        self.client = ClaudeSDKClient(options=ClaudeAgentOptions(**sdk_config))
+        options = ClaudeAgentOptions(
+            **sdk_config,
+            mcp_servers=self.mcp_manager.sdk_servers(),
+            can_use_tool=self._can_use_tool,
+            resume=resume,
+        )
+        client = ClaudeSDKClient(options=options)
+
+        with Tracer.span("client_connect", "agent_loop", resume=bool(resume)):
+            await client.connect()
+
+        return client
+
+    def _warm_standby(self) -> None:
+        if not self.config.prewarm_client:
+            return
+
+        self._standby_model = self.config.model
+        self._standby_task = asyncio.create_task(self._connect_client())
+
+    async def _take_standby(self) -> "ClaudeSDKClient | None":
+        task, self._standby_task = self._standby_task, None
+
+        if task is None:
+            return None
+
+        try:
+            client = await task
+        except Exception as error:
+            log_json({"event": "standby_client_failed", "error": str(error)})
+            return None
+
+        if self._standby_model != self.config.model:
+            await client.set_model(self.config.model)
+
+        return client
+
+    async def _swap_in_standby(self) -> None:
+        previous = self.client
+        standby = await self._take_standby()
+
+        if standby is None:
+            await previous.disconnect()
+            await self._initialize_client()
+        else:
+            self.client = standby
+
+            # Shut the old subprocess down without making the user wait
+            self._run_in_background(previous.disconnect())
+
+        self._warm_standby()
+
+    async def _discard_standby(self) -> None:
+        standby, self._standby_task = self._standby_task, None
+
+        if standby is not None and not standby.done():
+            standby.cancel()
+        elif standby is not None and not standby.cancelled():
+            if standby.exception() is None:
+                await standby.result().disconnect()
+
+    async def _replace_client(self) -> None:
+        try:
+            await self.client.disconnect()
+        except Exception as error:
+            # A dead client is replaced all the same
+            log_json({"event": "client_disconnect_failed", "error": repr(error)})
+
+        await self._initialize_client()
+
+    async def _reconnect(self) -> None:
+        # New client options, same conversation (resumed by session_id)
+        await self.client.disconnect()
+        await self._initialize_client()
 
-        await self.client.connect()
+        # The standby was connected with the old options too
+        await self._discard_standby()
+        self._warm_standby()
+
+    def _on_config_change(self, change: ConfigChange) -> None:
+        self._run_in_background(self._apply_config(change))
+
+    async def _apply_config(self, change: ConfigChange) -> None:
+        sections = change.sections
+        log_json({"event": "config_applied", "sections": sorted(sections)})
+
+        for name in sections - {"model"}:
+            setattr(self.config, name, getattr(change.config, name))
+
+        if "permissions" in sections:
+            self.permission_policy = PermissionPolicy(change.config.permissions)
+
+        if "mcp_servers" in sections:
+            self.available_servers = change.config.mcp_servers
+            await self.mcp_manager.update_servers(change.config.mcp_servers)
+
+        if "journal_fsync" in sections and self.journal is not None:
+            # Read by the writer thread for each batch
+            self.journal.fsync = change.config.journal_fsync
+
+        if "log_sample_rates" in sections:
+            set_sample_rates(change.config.log_sample_rates)
+
+        if "model" in sections:
+            await self.change_model(change.config.model)
+
+        restart = sections & RESTART_CONFIG_FIELDS
+
+        if restart:
+            await self.app.actions.post_system_message(
+                f"Restart the app to apply {', '.join(sorted(restart))}",
+                thinking=False,
+            )
+
+        # The other app settings are applied above or read from `self.config`
+        # as they are used; the rest (including the MCP server list) only
+        # reaches the SDK when a client connects
+        if sections - APP_CONFIG_FIELDS - {"model"}:
+            await self.query_queue.put(ControlCommand.RECONNECT)
+
+    def _run_in_background(self, coroutine: Coroutine[Any, Any, None]) -> None:
+        task = asyncio.create_task(coroutine)
+
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    async def _handle_message(self, message: "Message") -> None:
+        from claude_agent_sdk.types import (
+            AssistantMessage,
+            ResultMessage,
+            StreamEvent,
+            SystemMessage,
+            TextBlock,
+            ToolResultBlock,
+            ToolUseBlock,
+            UserMessage,
+        )
 
-    async def _handle_message(self, message: Message) -> None:
         if isinstance(message, SystemMessage):
             log_json(message.data)
 
@@ -132,9 +517,17 @@ class AgentLoop:
             ):
                 # When initializing the chat, we store the session_id for later
                 self.session_id = message.data["session_id"]
+                self.app.conversation.session_id = self.session_id
 
-                # Report connected / error status back to UI
-                MCPServerStatus.update(message.data["mcp_servers"])
+                if self.journal is not None:
+                    self.journal.record_session(self.session_id)
+
+                # Report connected / error status back to UI. Managed servers
+                # always look connected through their relay, so MCPManager
+                # reports those itself.
+                for server in message.data["mcp_servers"]:
+                    if server.get("name") not in self.mcp_manager.servers:
+                        MCPServerStatus.set_status(server["name"], server.get("status"))
 
         # Handle streaming messages
         if isinstance(message, StreamEvent):
@@ -143,6 +536,9 @@ class AgentLoop:
             if event.get("type") == ContentType.CONTENT_BLOCK_DELTA.value:
                 delta = event.get("delta", {})
 
+                if self._turn is not None:
+                    self._turn.chunk()
+
                 # Chunk in streaming text
                 if delta.get("type") == ContentType.TEXT_DELTA.value:
                     text_chunk = delta.get("text", "")
@@ -166,6 +562,11 @@ class AgentLoop:
                             {"type": ContentType.TEXT.value, "text": block.text}
                         )
                     elif isinstance(block, ToolUseBlock):
+                        # Ended when its ToolResultBlock comes back
+                        self._tool_spans[block.id] = Tracer.start(
+                            "tool_call", "agent_loop", tool=block.name
+                        )
+
                         content.append(
                             {
                                 "type": ContentType.TOOL_USE.value,
@@ -183,63 +584,227 @@ class AgentLoop:
                 )
             )
 
+        elif isinstance(message, UserMessage) and isinstance(message.content, list):
+            for block in message.content:
+                if isinstance(block, ToolResultBlock):
+                    tool_span = self._tool_spans.pop(block.tool_use_id, None)
+
+                    if tool_span is not None:
+                        tool_span.end(is_error=bool(block.is_error))
+
+        elif isinstance(message, ResultMessage) and self._turn is not None:
+            self._turn.record_result(
+                usage=message.usage,
+                cost_usd=message.total_cost_usd,
+                api_ms=message.duration_api_ms,
+                num_turns=message.num_turns,
+            )
+
     async def _can_use_tool(
         self,
         tool_name: str,
         tool_input: dict[str, Any],
-        _context: ToolPermissionContext,
-    ) -> PermissionResult:
+        _context: "ToolPermissionContext",
+    ) -> "PermissionResult":
         """Agent SDK handler for tool use permissions"""
 
-        # Handle permission request queue sequentially
-        async with self.permission_lock:
-            await self.app.actions.post_app_event(
-                AppEvent(
-                    type=AppEventType.TOOL_PERMISSION_REQUEST,
-                    data={
-                        "tool_name": tool_name,
-                        "tool_input": tool_input,
-                    },
-                )
+        # Policy rules decide first, so only `ask` reaches the prompt
+        started = time.perf_counter()
+        decision = self.permission_policy.evaluate(tool_name, tool_input)
+
+        log_json(
+            {
+                "event": "permission_policy_decision",
+                "tool_name": tool_name,
+                "action": decision.action.value,
+                "rule": decision.rule,
+                "match_us": round((time.perf_counter() - started) * 1_000_000, 1),
+            }
+        )
+
+        if decision.action is PermissionAction.ALLOW:
+            return _allow(tool_input)
+
+        if decision.action is PermissionAction.DENY:
+            await self.app.actions.post_system_message(
+                f"Permission denied for {tool_name} by policy"
             )
 
-            # Grab response from permission queue
-            user_response = await self.permission_response_queue.get()
-            response = user_response.lower().strip()
+            # Not interrupted, so the agent can carry on without the tool
+            return _deny("Denied by permission policy")
 
-            accepted_tool = response in ["y", "yes", "allow", ""]
-            rejected_tool = response in ["n", "no", "deny"]
+        if self._allowed_this_session(tool_name, tool_input):
+            return _allow(tool_input)
 
-            log_json(
-                {
-                    "event": "tool_permission_decision",
-                    "response": response,
-                    "accepted_tool": accepted_tool,
-                    "rejected_tool": rejected_tool,
-                }
+        # Calls made in the same turn arrive together and share one prompt
+        request = PermissionRequest(
+            tool_name=tool_name,
+            tool_input=tool_input,
+            result=asyncio.get_running_loop().create_future(),
+        )
+        self._permission_batch.append(request)
+
+        if self._permission_flush is None:
+            self._permission_flush = asyncio.create_task(self._flush_permissions())
+            self._background_tasks.add(self._permission_flush)
+            self._permission_flush.add_done_callback(self._background_tasks.discard)
+
+        return await request.result
+
+    async def _flush_permissions(self) -> None:
+        await asyncio.sleep(self.PERMISSION_BATCH_WINDOW)
+
+        # Calls arriving from here on start the next batch
+        batch, self._permission_batch = self._permission_batch, []
+        self._permission_flush = None
+
+        try:
+            # One prompt on screen at a time
+            async with self.permission_lock:
+                await self._ask_permission(batch)
+        finally:
+            # Cancelling the future would raise CancelledError inside the
+            # SDK's can_use_tool; answer the calls left over instead
+            for request in batch:
+                if not request.result.done():
+                    request.result.set_result(_deny("cancelled"))
+
+    async def _ask_permission(self, batch: list[PermissionRequest]) -> None:
+        pending: list[PermissionRequest] = []
+
+        for request in batch:
+            if request.result.done():
+                continue
+
+            # The answer to the previous prompt may have allowed this already
+            if self._allowed_this_session(request.tool_name, request.tool_input):
+                request.result.set_result(_allow(request.tool_input))
+            else:
+                pending.append(request)
+
+        if not pending:
+            return
+
+        # Only the time the prompt is on screen; batches queue for the lock
+        asked_at = time.perf_counter()
+
+        # This runs in the SDK's task, so the turn is passed as the parent
+        wait_span = Tracer.start(
+            "permission_wait",
+            "agent_loop",
+            parent=self._query_span,
+            tools=[request.tool_name for request in pending],
+        )
+
+        await self.app.actions.post_app_event(
+            AppEvent(
+                type=AppEventType.TOOL_PERMISSION_REQUEST,
+                data={
+                    "requests": [
+                        {
+                            "tool_name": request.tool_name,
+                            "tool_input": request.tool_input,
+                        }
+                        for request in pending
+                    ]
+                },
             )
+        )
 
-            if accepted_tool:
-                return PermissionResultAllow(
-                    behavior="allow",
-                    updated_input=tool_input,
-                )
+        # Grab response from permission queue
+        user_response = await self.permission_response_queue.get()
+        response = user_response.lower().strip()
+
+        wait_span.end()
+
+        if self._turn is not None:
+            self._turn.permission_wait_ms += (time.perf_counter() - asked_at) * 1000
+
+        accepted_tool = is_approval(response)
+        rejected_tool = response in DENY_RESPONSES
+        selection = parse_selection(response, len(pending))
+
+        for request in pending:
+            if response in ALLOW_CALL_RESPONSES:
+                self.permission_cache.allow_call(request.tool_name, request.tool_input)
+            elif response in ALLOW_TOOL_RESPONSES:
+                self.permission_cache.allow_tool(request.tool_name)
+
+        log_json(
+            {
+                "event": "tool_permission_decision",
+                "response": response,
+                "accepted_tool": accepted_tool,
+                "rejected_tool": rejected_tool,
+                "selection": sorted(selection) if selection is not None else None,
+                "batch_size": len(pending),
+            }
+        )
 
-            if rejected_tool:
+        results: "list[PermissionResult]"
+
+        if accepted_tool:
+            results = [_allow(request.tool_input) for request in pending]
+
+        elif selection is not None:
+            # Picked individually: the rest are skipped, but the turn goes on
+            results = [
+                _allow(request.tool_input)
+                if position in selection
+                else _deny("User denied permission")
+                for position, request in enumerate(pending, start=1)
+            ]
+
+            denied = [
+                request.tool_name
+                for position, request in enumerate(pending, start=1)
+                if position not in selection
+            ]
+
+            if denied:
                 await self.app.actions.post_system_message(
-                    f"Permission denied for {tool_name}"
+                    f"Permission denied for {', '.join(denied)}"
                 )
 
-                return PermissionResultDeny(
-                    behavior="deny",
-                    message="User denied permission",
-                    interrupt=True,
-                )
+        elif rejected_tool:
+            await self.app.actions.post_system_message(
+                "Permission denied for "
+                + ", ".join(request.tool_name for request in pending)
+            )
+
+            results = [_deny("User denied permission", interrupt=True) for _ in pending]
 
+        else:
             # If a user instead typed in a message (instead of confirming or denying)
             # actions.respond_to_tool_permission will handle posting and querying.
-            return PermissionResultDeny(
-                behavior="deny",
-                message=user_response,
-                interrupt=True,
-            )
+            results = [_deny(user_response, interrupt=True) for _ in pending]
+
+        for request, result in zip(pending, results):
+            if not request.result.done():
+                request.result.set_result(result)
+
+    def _allowed_this_session(self, tool_name: str, tool_input: dict[str, Any]) -> bool:
+        if not self.permission_cache.is_allowed(tool_name, tool_input):
+            return False
+
+        log_json(
+            {
+                "event": "permission_cache_hit",
+                "tool_name": tool_name,
+                **self.permission_cache.stats(),
+            }
+        )
+
+        return True
+
+
+def _allow(tool_input: dict[str, Any]) -> "PermissionResultAllow":
+    from claude_agent_sdk.types import PermissionResultAllow
+
+    return PermissionResultAllow(behavior="allow", updated_input=tool_input)
+
+
+def _deny(message: str, interrupt: bool = False) -> "PermissionResultDeny":
+    from claude_agent_sdk.types import PermissionResultDeny
+
+    return PermissionResultDeny(behavior="deny", message=message, interrupt=interrupt)
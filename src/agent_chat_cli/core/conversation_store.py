@@ -0,0 +1,101 @@
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from agent_chat_cli.utils.enums import ConversationEventType, RoleType
+
+
+class Message:
+    """A single transcript entry.
+
+    Streamed text is kept as a list of chunks and only joined when `content`
+    is read, so appending a chunk does not copy the text received so far.
+    """
+
+    __slots__ = ("type", "metadata", "_chunks")
+
+    def __init__(
+        self,
+        type: RoleType,
+        content: str = "",
+        metadata: dict[str, Any] | None = None,
+    ) -> None:
+        self.type = type
+        self.metadata = metadata
+        self._chunks = [content] if content else []
+
+    @property
+    def content(self) -> str:
+        if len(self._chunks) > 1:
+            self._chunks = ["".join(self._chunks)]
+
+        return self._chunks[0] if self._chunks else ""
+
+    def append(self, text: str) -> None:
+        if text:
+            self._chunks.append(text)
+
+    def __repr__(self) -> str:
+        return f"Message(type={self.type}, content={self.content!r})"
+
+
+@dataclass(slots=True)
+class ConversationEvent:
+    type: ConversationEventType
+    index: int = -1
+    text: str = ""
+
+
+class ConversationStore:
+    """Append-only transcript shared by the UI, exporters and headless modes.
+
+    Writers (AgentLoop, Renderer) add and extend messages here; readers either
+    read `messages` directly or subscribe to be told about each change.
+    """
+
+    def __init__(self) -> None:
+        self.session_id: str | None = None
+
+        self._messages: list[Message] = []
+        self._callbacks: list[Callable[[ConversationEvent], None]] = []
+
+    @property
+    def messages(self) -> list[Message]:
+        return list(self._messages)
+
+    def __len__(self) -> int:
+        return len(self._messages)
+
+    def __getitem__(self, index: int) -> Message:
+        return self._messages[index]
+
+    def add(self, message: Message) -> int:
+        index = len(self._messages)
+        self._messages.append(message)
+
+        self._notify(ConversationEvent(ConversationEventType.ADDED, index))
+
+        return index
+
+    def append(self, index: int, text: str) -> None:
+        if not text:
+            return
+
+        self._messages[index].append(text)
+        self._notify(ConversationEvent(ConversationEventType.APPENDED, index, text))
+
+    def clear(self) -> None:
+        self._messages.clear()
+        self.session_id = None
+
+        self._notify(ConversationEvent(ConversationEventType.CLEARED))
+
+    def subscribe(self, callback: Callable[[ConversationEvent], None]) -> None:
+        self._callbacks.append(callback)
+
+    def unsubscribe(self, callback: Callable[[ConversationEvent], None]) -> None:
+        if callback in self._callbacks:
+            self._callbacks.remove(callback)
+
+    def _notify(self, event: ConversationEvent) -> None:
+        for callback in self._callbacks:
+            callback(event)
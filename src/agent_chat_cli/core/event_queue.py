@@ -0,0 +1,83 @@
+import asyncio
+from collections import deque
+from typing import TYPE_CHECKING
+
+from agent_chat_cli.utils.enums import AppEventType
+
+if TYPE_CHECKING:
+    from agent_chat_cli.core.agent_loop import AppEvent
+
+
+class EventQueue:
+    """Bounded FIFO of AppEvents between AgentLoop and the Renderer.
+
+    A STREAM_EVENT that arrives while another is still waiting at the back of
+    the queue is merged into it, so a slow consumer receives fewer, larger
+    chunks instead of falling behind. Other events are never merged or
+    dropped; once `max_size` events are waiting, `put()` blocks the producer
+    until the consumer catches up.
+    """
+
+    def __init__(self, max_size: int = 256) -> None:
+        self.max_size = max(max_size, 1)
+
+        self._events: deque["AppEvent"] = deque()
+        self._condition = asyncio.Condition()
+
+        # Metrics
+        self.received = 0
+        self.merged = 0
+        self.producer_waits = 0
+        self.high_water = 0
+
+    @property
+    def depth(self) -> int:
+        return len(self._events)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "depth": self.depth,
+            "high_water": self.high_water,
+            "received": self.received,
+            "merged": self.merged,
+            "producer_waits": self.producer_waits,
+        }
+
+    async def put(self, event: "AppEvent") -> None:
+        async with self._condition:
+            self.received += 1
+
+            if self._merge(event):
+                return
+
+            if len(self._events) >= self.max_size:
+                self.producer_waits += 1
+                await self._condition.wait_for(
+                    lambda: len(self._events) < self.max_size
+                )
+
+            self._events.append(event)
+            self.high_water = max(self.high_water, len(self._events))
+            self._condition.notify_all()
+
+    async def get(self) -> "AppEvent":
+        async with self._condition:
+            await self._condition.wait_for(lambda: bool(self._events))
+
+            event = self._events.popleft()
+            self._condition.notify_all()
+
+            return event
+
+    def _merge(self, event: "AppEvent") -> bool:
+        if event.type is not AppEventType.STREAM_EVENT or not self._events:
+            return False
+
+        last = self._events[-1]
+        if last.type is not AppEventType.STREAM_EVENT:
+            return False
+
+        last.data = {"text": last.data.get("text", "") + event.data.get("text", "")}
+        self.merged += 1
+
+        return True
@@ -0,0 +1,720 @@
+import asyncio
+import itertools
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from agent_chat_cli.utils.config import MCPServerConfig
+from agent_chat_cli.utils.enums import MCPStartMode, TimelineStatus
+from agent_chat_cli.utils.logger import log_json
+from agent_chat_cli.utils.mcp_schema_cache import MCPSchema, load_schema, save_schema
+from agent_chat_cli.utils.mcp_server_status import MCPServerStatus
+from agent_chat_cli.utils.startup_timeline import StartupTimeline
+from agent_chat_cli.utils.tracing import Tracer
+
+if TYPE_CHECKING:
+    from claude_agent_sdk.types import McpServerConfig, McpStdioServerConfig
+
+PROTOCOL_VERSION = "2025-06-18"
+CLIENT_INFO = {"name": "agent-chat-cli", "version": "0.1.0"}
+
+# Tool results (e.g. screenshots) arrive as a single JSON line
+MESSAGE_LIMIT = 64 * 1024 * 1024
+
+# Run as a plain script: it imports nothing from the package
+RELAY_SCRIPT = str(Path(__file__).with_name("mcp_relay.py"))
+
+
+class MCPServerProcess:
+    """A configured stdio MCP server, started once and shared by every client.
+
+    The app performs the MCP handshake itself and answers each client's
+    `initialize` from it, so the process outlives any single connection.
+    Request ids are rewritten per connection so that several clients (e.g.
+    the active and the standby one) can talk to the server at the same time.
+
+    A `start: lazy` server with a cached schema is not launched up front:
+    `initialize` and `tools/list` are answered from the cache, and the process
+    is only started by the first request that needs it.
+
+    A server still starting after its `connect_timeout` is degraded: clients
+    get the cached (or an empty) tool list right away and are sent
+    `tools/list_changed` once it attaches.
+    """
+
+    # Crashes in a row before the server is given up; a run that stayed up
+    # for STABLE_UPTIME seconds starts the count again
+    MAX_RESTARTS = 5
+    RESTART_DELAY = 1.0
+    STABLE_UPTIME = 60.0
+    HANDSHAKE_TIMEOUT = 60.0
+
+    def __init__(self, name: str, config: MCPServerConfig) -> None:
+        self.name = name
+        self.config = config
+
+        self.initialize_result: dict[str, Any] | None = None
+        self.restarts = 0
+        self.launches = 0
+        self.degraded = False
+
+        # Duration of each step of the last start, in ms
+        self.phases: dict[str, float] = {}
+        self.connections: list[asyncio.StreamWriter] = []
+
+        # Handshake and tools recorded by a previous run
+        self.cached_schema: MCPSchema | None = load_schema(name, config)
+        self.first_call_ms: float | None = None
+
+        self._process: asyncio.subprocess.Process | None = None
+        self._ready = asyncio.Event()
+        self._start_lock = asyncio.Lock()
+        self._stopping = False
+
+        self._ids = itertools.count(1)
+        self._waiters: dict[int, asyncio.Future[dict[str, Any]]] = {}
+        self._requests: dict[int, tuple[asyncio.StreamWriter, Any]] = {}
+        self._reader_task: asyncio.Task | None = None
+        self._schema_task: asyncio.Task | None = None
+        self._launch_task: asyncio.Task | None = None
+        self._launched_at = 0.0
+        self._spawned_at = 0.0
+
+        # Tools handed to clients while the server was not up
+        self._served_tools: list[dict[str, Any]] | None = None
+
+        # Request id and start time of the call that launched a lazy server
+        self._launch_timer: tuple[int, float] | None = None
+
+    @property
+    def pid(self) -> int | None:
+        return self._process.pid if self._process is not None else None
+
+    @property
+    def is_ready(self) -> bool:
+        return self._ready.is_set()
+
+    @property
+    def is_lazy(self) -> bool:
+        # Without a cached schema there is nothing to serve until it has run once
+        return self.config.start is MCPStartMode.LAZY and self.cached_schema is not None
+
+    async def start(self) -> None:
+        async with self._start_lock:
+            if self._process is not None:
+                return
+
+            self._stopping = False
+            started = time.perf_counter()
+
+            process = await asyncio.create_subprocess_exec(
+                self.config.command,
+                *self.config.args,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+                env={**os.environ, **self.config.env},
+                limit=MESSAGE_LIMIT,
+            )
+
+            self._process = process
+            self._spawned_at = time.perf_counter()
+            self._reader_task = asyncio.create_task(self._read_stdout(process))
+
+            spawned = time.perf_counter()
+            self.phases = {"spawn": (spawned - started) * 1000}
+
+            try:
+                async with asyncio.timeout(self.HANDSHAKE_TIMEOUT):
+                    response = await self.request(
+                        "initialize",
+                        {
+                            "protocolVersion": PROTOCOL_VERSION,
+                            "capabilities": {},
+                            "clientInfo": CLIENT_INFO,
+                        },
+                    )
+            except BaseException:
+                await self.stop()
+                raise
+
+            if "error" in response:
+                await self.stop()
+                raise RuntimeError(
+                    response["error"].get("message", "initialize failed")
+                )
+
+            self.initialize_result = response["result"]
+            await self._write({"jsonrpc": "2.0", "method": "notifications/initialized"})
+            self._ready.set()
+
+            self.phases["handshake"] = (time.perf_counter() - spawned) * 1000
+            self._schema_task = asyncio.create_task(self._refresh_schema())
+
+            log_json({"event": "mcp_server_started", "server": self.name})
+
+    async def stop(self) -> None:
+        self._stopping = True
+        self._ready.clear()
+
+        # A launch still under way would otherwise leave the server running
+        launch = self._launch_task
+        if launch and not launch.done() and launch is not asyncio.current_task():
+            launch.cancel()
+            await asyncio.gather(launch, return_exceptions=True)
+
+        process, self._process = self._process, None
+        if process is None or process.returncode is not None:
+            return
+
+        process.terminate()
+
+        try:
+            async with asyncio.timeout(5):
+                await process.wait()
+        except TimeoutError:
+            process.kill()
+
+        # Children of the server (e.g. under npx) can keep its stdout open
+        if self._reader_task is not None and not self._reader_task.done():
+            self._reader_task.cancel()
+            await self._on_exit(process)
+
+    def launch(self) -> None:
+        """Start the server in the background unless it is up or on its way."""
+        if self.is_ready or (self._launch_task and not self._launch_task.done()):
+            return
+
+        self._launched_at = time.perf_counter()
+        self._launch_task = asyncio.create_task(self._launch())
+
+    async def wait_ready(self, timeout: float | None = None) -> bool:
+        self.launch()
+
+        if self._launch_task is not None:
+            try:
+                async with asyncio.timeout(timeout):
+                    # The launch carries on if this wait gives up
+                    await asyncio.shield(self._launch_task)
+            except TimeoutError:
+                return False
+
+        return self.is_ready
+
+    async def wait_connected(self) -> bool:
+        """Wait for the server until `connect_timeout` after its launch.
+
+        Past that the server is degraded rather than failed: it keeps starting
+        in the background and attaches to clients when it is ready.
+        """
+        self.launch()
+
+        elapsed = time.perf_counter() - self._launched_at
+        if await self.wait_ready(max(self.config.connect_timeout - elapsed, 0)):
+            return True
+
+        launching = self._launch_task is not None and not self._launch_task.done()
+
+        if launching and not self.degraded:
+            self.degraded = True
+            StartupTimeline.end(self.name, TimelineStatus.TIMEOUT)
+
+            log_json(
+                {
+                    "event": "mcp_server_degraded",
+                    "server": self.name,
+                    "connect_timeout": self.config.connect_timeout,
+                }
+            )
+
+        return False
+
+    async def _launch(self) -> None:
+        # Lazy servers launch after startup and report their own latency
+        first_launch = self.launches == 0 and not self.is_lazy
+        self.launches += 1
+
+        if first_launch:
+            StartupTimeline.begin(self.name)
+
+        MCPServerStatus.set_status(self.name, "pending")
+
+        try:
+            with Tracer.span("mcp_connect", "mcp", server=self.name):
+                await self.start()
+        except Exception as error:
+            log_json(
+                {
+                    "event": "mcp_server_unavailable",
+                    "server": self.name,
+                    "error": str(error),
+                }
+            )
+            MCPServerStatus.set_status(self.name, "failed")
+
+            if first_launch:
+                StartupTimeline.end(self.name, TimelineStatus.FAILED, self.phases)
+            return
+
+        MCPServerStatus.set_status(self.name, "connected")
+
+        if first_launch:
+            status = TimelineStatus.LATE if self.degraded else TimelineStatus.OK
+            StartupTimeline.end(self.name, status, self.phases)
+
+        self.degraded = False
+
+    async def request(self, method: str, params: dict[str, Any]) -> dict[str, Any]:
+        """Send a request of the app's own and wait for the raw response."""
+        request_id = next(self._ids)
+        future: asyncio.Future[dict[str, Any]] = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._waiters[request_id] = future
+
+        try:
+            await self._write(
+                {"jsonrpc": "2.0", "id": request_id, "method": method, "params": params}
+            )
+            return await future
+        finally:
+            self._waiters.pop(request_id, None)
+
+    async def handle_client_message(
+        self, connection: asyncio.StreamWriter, message: dict[str, Any]
+    ) -> None:
+        method = message.get("method")
+
+        if method == "notifications/initialized":
+            return
+
+        if not self.is_ready and (self.is_lazy or self.degraded):
+            if self._answer_from_cache(connection, message):
+                return
+
+        if method == "initialize":
+            if await self.wait_connected():
+                _send(connection, _result(message["id"], self.initialize_result))
+            elif not self.degraded or not self._answer_from_cache(connection, message):
+                _send(connection, _error(message["id"], f"{self.name} is unavailable"))
+            return
+
+        if method is not None and "id" in message:
+            launching = self.is_lazy and not self.is_ready
+            started = time.perf_counter()
+
+            if not await self.wait_ready():
+                _send(connection, _error(message["id"], f"{self.name} is unavailable"))
+                return
+
+            request_id = next(self._ids)
+            self._requests[request_id] = (connection, message["id"])
+
+            if launching and self.first_call_ms is None:
+                self._launch_timer = (request_id, started)
+
+            try:
+                await self._write({**message, "id": request_id})
+            except ConnectionError as error:
+                del self._requests[request_id]
+                _send(connection, _error(message["id"], str(error)))
+            return
+
+        if method == "notifications/cancelled":
+            request_id = self._find_request(connection, message["params"]["requestId"])
+            if request_id is None:
+                return
+
+            message = {
+                **message,
+                "params": {**message["params"], "requestId": request_id},
+            }
+
+        # Notifications and responses to server-initiated requests
+        if self.is_ready:
+            await self._write(message)
+
+    def detach(self, connection: asyncio.StreamWriter) -> None:
+        if connection in self.connections:
+            self.connections.remove(connection)
+
+        for request_id, (owner, _) in list(self._requests.items()):
+            if owner is connection:
+                del self._requests[request_id]
+
+    def _answer_from_cache(
+        self, connection: asyncio.StreamWriter, message: dict[str, Any]
+    ) -> bool:
+        schema = self.cached_schema or MCPSchema(
+            initialize={
+                "protocolVersion": message.get("params", {}).get(
+                    "protocolVersion", PROTOCOL_VERSION
+                ),
+                "capabilities": {},
+                "serverInfo": {"name": self.name, "version": "0.0.0"},
+            },
+            tools=[],
+        )
+
+        match message.get("method"):
+            case "initialize":
+                # Ask the client to listen for the tools of the real server
+                capabilities = schema["initialize"].get("capabilities", {})
+                tools = {**capabilities.get("tools", {}), "listChanged": True}
+
+                result = {
+                    **schema["initialize"],
+                    "capabilities": {**capabilities, "tools": tools},
+                }
+            case "tools/list":
+                result = {"tools": schema["tools"]}
+                self._served_tools = schema["tools"]
+            case "ping":
+                result = {}
+            case _:
+                return False
+
+        _send(connection, _result(message["id"], result))
+        return True
+
+    async def _refresh_schema(self) -> None:
+        tools: list[dict[str, Any]] = []
+        params: dict[str, Any] = {}
+
+        try:
+            while True:
+                response = await self.request("tools/list", params)
+                if "error" in response:
+                    return
+
+                tools.extend(response["result"].get("tools", []))
+
+                cursor = response["result"].get("nextCursor")
+                if not cursor:
+                    break
+
+                params = {"cursor": cursor}
+        except ConnectionError:
+            return
+
+        assert self.initialize_result is not None
+        self.cached_schema = MCPSchema(initialize=self.initialize_result, tools=tools)
+        save_schema(self.name, self.config, self.initialize_result, tools)
+
+        served, self._served_tools = self._served_tools, None
+
+        # Clients were handed a cached or empty list that is now out of date
+        if served is not None and served != tools:
+            for connection in self.connections:
+                _send(
+                    connection,
+                    {"jsonrpc": "2.0", "method": "notifications/tools/list_changed"},
+                )
+
+    def _report_first_call(self, started: float) -> None:
+        self._launch_timer = None
+        self.first_call_ms = (time.perf_counter() - started) * 1000
+
+        log_json(
+            {
+                "event": "mcp_lazy_first_call",
+                "server": self.name,
+                "latency_ms": round(self.first_call_ms, 1),
+            }
+        )
+
+    def _find_request(
+        self, connection: asyncio.StreamWriter, client_id: Any
+    ) -> int | None:
+        for request_id, (owner, original_id) in self._requests.items():
+            if owner is connection and original_id == client_id:
+                return request_id
+
+        return None
+
+    async def _write(self, message: dict[str, Any]) -> None:
+        stdin = self._stdin()
+        stdin.write(json.dumps(message).encode() + b"\n")
+
+        # Holds the sender back while the server is not reading its stdin
+        await stdin.drain()
+
+    def _stdin(self) -> asyncio.StreamWriter:
+        if self._process is None or self._process.stdin is None:
+            raise ConnectionError(f"{self.name} is not running")
+
+        return self._process.stdin
+
+    async def _read_stdout(self, process: asyncio.subprocess.Process) -> None:
+        assert process.stdout is not None
+
+        async for line in process.stdout:
+            try:
+                message = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+
+            self._dispatch(message)
+
+        await process.wait()
+        await self._on_exit(process)
+
+    def _dispatch(self, message: dict[str, Any]) -> None:
+        # Responses go back to whoever asked, under the id they used
+        if "method" not in message:
+            request_id = message.get("id")
+
+            # Every id the app sends is an int; anything else is not ours
+            if not isinstance(request_id, int):
+                return
+
+            waiter = self._waiters.get(request_id)
+
+            if waiter is not None:
+                if not waiter.done():
+                    waiter.set_result(message)
+            elif request_id in self._requests:
+                if self._launch_timer and self._launch_timer[0] == request_id:
+                    self._report_first_call(self._launch_timer[1])
+
+                connection, original_id = self._requests.pop(request_id)
+                _send(connection, {**message, "id": original_id})
+            return
+
+        # Server-initiated requests are answered by the most recent client
+        if "id" in message:
+            if self.connections:
+                _send(self.connections[-1], message)
+            else:
+                # Not drained: the stdout reader must never wait on the server
+                self._stdin().write(
+                    json.dumps(_error(message["id"], "No client connected")).encode()
+                    + b"\n"
+                )
+            return
+
+        for connection in self.connections:
+            _send(connection, message)
+
+    async def _on_exit(self, process: asyncio.subprocess.Process) -> None:
+        if self._process is process:
+            self._process = None
+            self._ready.clear()
+
+        for waiter in self._waiters.values():
+            if not waiter.done():
+                waiter.set_exception(ConnectionError(f"{self.name} exited"))
+
+        for connection, original_id in self._requests.values():
+            _send(connection, _error(original_id, f"{self.name} exited"))
+
+        self._requests.clear()
+
+        # A lazy server is simply launched again by the next call
+        if self._stopping or self.is_lazy:
+            return
+
+        log_json(
+            {
+                "event": "mcp_server_exited",
+                "server": self.name,
+                "returncode": process.returncode,
+                "restarts": self.restarts,
+            }
+        )
+
+        if time.perf_counter() - self._spawned_at >= self.STABLE_UPTIME:
+            self.restarts = 0
+
+        if self.restarts >= self.MAX_RESTARTS:
+            MCPServerStatus.set_status(self.name, "failed")
+            return
+
+        self.restarts += 1
+        await asyncio.sleep(self.RESTART_DELAY)
+
+        if not self._stopping:
+            # A client request may already have brought it back up
+            await self.wait_ready()
+
+
+class MCPManager:
+    """Owns the configured MCP servers for the lifetime of the app.
+
+    Servers are launched once, and every SDK client is pointed at a tiny relay
+    (`core/mcp_relay.py`) that connects back to them over a unix socket, so
+    `/new`, `/model` and the standby client never relaunch a server.
+    """
+
+    def __init__(self, servers: dict[str, MCPServerConfig]) -> None:
+        self.servers = {
+            name: MCPServerProcess(name, config) for name, config in servers.items()
+        }
+
+        self._socket_dir: str | None = None
+        self._socket_server: asyncio.Server | None = None
+
+    @property
+    def socket_path(self) -> str:
+        assert self._socket_dir is not None
+        return str(Path(self._socket_dir) / "mcp.sock")
+
+    async def start(self) -> None:
+        if not self.servers or self._socket_server is not None:
+            return
+
+        # Private directory, so only this user can reach the servers
+        self._socket_dir = tempfile.mkdtemp(prefix="agent-chat-cli-")
+        self._socket_server = await asyncio.start_unix_server(
+            self._handle_connection, path=self.socket_path, limit=MESSAGE_LIMIT
+        )
+
+        # Servers start concurrently and alongside the client connect; each
+        # client's `initialize` waits at most for the server's connect_timeout
+        for server in self.servers.values():
+            self._launch(server)
+
+    async def update_servers(self, servers: dict[str, MCPServerConfig]) -> None:
+        """Switch to a new server list, leaving unchanged servers running.
+
+        Clients only see added servers once they reconnect.
+        """
+        stale = [
+            name
+            for name, server in self.servers.items()
+            if servers.get(name) != server.config
+        ]
+        await asyncio.gather(*(self.servers.pop(name).stop() for name in stale))
+
+        added = [name for name in servers if name not in self.servers]
+
+        for name in added:
+            self.servers[name] = MCPServerProcess(name, servers[name])
+
+        log_json({"event": "mcp_servers_updated", "stopped": stale, "added": added})
+
+        if self._socket_server is None:
+            await self.start()
+            return
+
+        for name in added:
+            self._launch(self.servers[name])
+
+    def _launch(self, server: MCPServerProcess) -> None:
+        if not server.is_lazy:
+            server.launch()
+            return
+
+        StartupTimeline.begin(server.name)
+        StartupTimeline.end(server.name, TimelineStatus.LAZY)
+        MCPServerStatus.set_status(server.name, "connected")
+
+    async def wait_connected(self) -> None:
+        await asyncio.gather(
+            *(
+                server.wait_connected()
+                for server in self.servers.values()
+                if not server.is_lazy
+            )
+        )
+
+    async def stop(self) -> None:
+        if self._socket_server is not None:
+            self._socket_server.close()
+            self._socket_server = None
+
+        await asyncio.gather(*(server.stop() for server in self.servers.values()))
+
+        if self._socket_dir is not None:
+            shutil.rmtree(self._socket_dir, ignore_errors=True)
+            self._socket_dir = None
+
+    def sdk_servers(self) -> "dict[str, McpServerConfig]":
+        if self._socket_server is None:
+            return {}
+
+        servers: dict[str, McpServerConfig] = {}
+
+        for name in self.servers:
+            relay: McpStdioServerConfig = {
+                "type": "stdio",
+                "command": sys.executable,
+                "args": [RELAY_SCRIPT, self.socket_path, name],
+            }
+            servers[name] = relay
+
+        return servers
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        name = (await reader.readline()).decode().strip()
+        server = self.servers.get(name)
+
+        if server is None:
+            writer.close()
+            return
+
+        server.connections.append(writer)
+
+        # Each message is handled in its own task, so a request waiting on a
+        # server launch does not hold up the messages behind it (e.g. cancels)
+        tasks: set[asyncio.Task] = set()
+
+        try:
+            async for line in reader:
+                try:
+                    message = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+
+                task = asyncio.create_task(
+                    server.handle_client_message(writer, message)
+                )
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+                task.add_done_callback(partial(_log_failure, server.name))
+        except ConnectionError:
+            pass
+        finally:
+            for task in tasks:
+                task.cancel()
+
+            server.detach(writer)
+            writer.close()
+
+
+def _log_failure(server: str, task: asyncio.Task) -> None:
+    if task.cancelled() or task.exception() is None:
+        return
+
+    log_json(
+        {
+            "event": "mcp_client_message_failed",
+            "server": server,
+            "error": repr(task.exception()),
+        }
+    )
+
+
+def _send(connection: asyncio.StreamWriter, message: dict[str, Any]) -> None:
+    if not connection.is_closing():
+        connection.write(json.dumps(message).encode() + b"\n")
+
+
+def _result(request_id: Any, result: Any) -> dict[str, Any]:
+    return {"jsonrpc": "2.0", "id": request_id, "result": result}
+
+
+def _error(request_id: Any, message: str) -> dict[str, Any]:
+    return {
+        "jsonrpc": "2.0",
+        "id": request_id,
+        "error": {"code": -32000, "message": message},
+    }
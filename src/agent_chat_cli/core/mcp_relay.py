@@ -0,0 +1,47 @@
+"""Stdio MCP server that forwards to a server held by `MCPManager`.
+
+Every SDK client launches this in place of the configured command:
+
+    python mcp_relay.py <socket path> <server name>
+
+It only copies bytes between its stdio and the app's socket, so it starts in
+milliseconds and can exit with its client while the real server keeps running.
+"""
+
+import os
+import socket
+import sys
+import threading
+
+CHUNK_SIZE = 64 * 1024
+
+
+def _forward_stdin(connection: socket.socket) -> None:
+    try:
+        while data := os.read(sys.stdin.fileno(), CHUNK_SIZE):
+            connection.sendall(data)
+
+        connection.shutdown(socket.SHUT_WR)
+    except OSError:
+        pass
+
+
+def main() -> None:
+    socket_path, name = sys.argv[1:3]
+
+    connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    connection.connect(socket_path)
+    connection.sendall(name.encode() + b"\n")
+
+    threading.Thread(target=_forward_stdin, args=(connection,), daemon=True).start()
+
+    try:
+        while data := connection.recv(CHUNK_SIZE):
+            sys.stdout.buffer.write(data)
+            sys.stdout.buffer.flush()
+    except OSError:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+import asyncio
+from collections import deque
+from typing import Callable
+
+from agent_chat_cli.utils.enums import ControlCommand, ModelChangeCommand, ResumeCommand
+
+type Query = str | ControlCommand | ModelChangeCommand | ResumeCommand
+
+
+class QueryQueue:
+    """AgentLoop's input queue, with queued prompts visible and cancellable.
+
+    Subscribers are called whenever the queue changes, so the UI can show
+    what is still waiting.
+    """
+
+    def __init__(self) -> None:
+        self._items: deque[Query] = deque()
+        self._added = asyncio.Condition()
+        self._callbacks: list[Callable[[], None]] = []
+
+    async def put(self, item: Query) -> None:
+        async with self._added:
+            self._items.append(item)
+            self._added.notify()
+
+        self._notify()
+
+    async def get(self) -> Query:
+        async with self._added:
+            await self._added.wait_for(lambda: bool(self._items))
+            item = self._items.popleft()
+
+        self._notify()
+        return item
+
+    def get_nowait(self) -> Query:
+        if not self._items:
+            raise asyncio.QueueEmpty
+
+        item = self._items.popleft()
+        self._notify()
+        return item
+
+    def empty(self) -> bool:
+        return not self._items
+
+    def qsize(self) -> int:
+        return len(self._items)
+
+    def pending_prompts(self) -> list[str]:
+        return [item for item in self._items if isinstance(item, str)]
+
+    def cancel_prompt(self, index: int) -> str | None:
+        """Drop the `index`th queued prompt and return it, if still queued."""
+        positions = [
+            position
+            for position, item in enumerate(self._items)
+            if isinstance(item, str)
+        ]
+
+        if not 0 <= index < len(positions):
+            return None
+
+        prompt = self._items[positions[index]]
+        del self._items[positions[index]]
+        self._notify()
+
+        return prompt if isinstance(prompt, str) else None
+
+    def take_prompts(self) -> list[str]:
+        """Remove and return the prompts queued ahead of any command."""
+        prompts = []
+
+        while self._items and isinstance(prompt := self._items[0], str):
+            self._items.popleft()
+            prompts.append(prompt)
+
+        if prompts:
+            self._notify()
+
+        return prompts
+
+    def subscribe(self, callback: Callable[[], None]) -> None:
+        self._callbacks.append(callback)
+
+    def unsubscribe(self, callback: Callable[[], None]) -> None:
+        if callback in self._callbacks:
+            self._callbacks.remove(callback)
+
+    def _notify(self) -> None:
+        for callback in self._callbacks:
+            callback()
+
+
+def coalesce_prompts(prompts: list[str]) -> str:
+    """Merge prompts typed while the agent was busy into one turn, in order."""
+    if len(prompts) == 1:
+        return prompts[0]
+
+    messages = "\n\n".join(
+        f"[Message {number}]\n{prompt}" for number, prompt in enumerate(prompts, 1)
+    )
+
+    return (
+        f"I sent {len(prompts)} messages while you were busy. "
+        f"Answer them together, in order:\n\n{messages}"
+    )
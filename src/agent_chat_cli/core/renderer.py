@@ -1,18 +1,15 @@
-from dataclasses import dataclass
+import json
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
-from textual.widgets import Markdown
-
-from agent_chat_cli.components.chat_history import ChatHistory
-from agent_chat_cli.components.messages import (
-    AgentMessage as AgentMessageWidget,
-    Message,
-    RoleType,
-    ToolMessage,
-)
 from agent_chat_cli.core.agent_loop import AppEvent
-from agent_chat_cli.utils.enums import AppEventType, ContentType
+from agent_chat_cli.core.conversation_store import Message
+from agent_chat_cli.core.event_queue import EventQueue
+from agent_chat_cli.core.stream_coalescer import StreamCoalescer
+from agent_chat_cli.utils.config import load_config
+from agent_chat_cli.utils.enums import AppEventType, ContentType, RoleType
 from agent_chat_cli.utils.logger import log_json
+from agent_chat_cli.utils.tracing import Tracer
 
 if TYPE_CHECKING:
     from agent_chat_cli.app import AgentChatCLIApp
@@ -20,12 +17,24 @@ if TYPE_CHECKING:
 
 @dataclass
 class StreamBuffer:
-    widget: AgentMessageWidget | None = None
-    text: str = ""
+    # Store index of the agent message being streamed into
+    index: int | None = None
+
+    # Chunks received since the last flush
+    chunks: list[str] = field(default_factory=list)
+
+    @property
+    def pending(self) -> bool:
+        return bool(self.chunks)
+
+    def take_pending(self) -> str:
+        pending = "".join(self.chunks)
+        self.chunks = []
+        return pending
 
     def reset(self) -> None:
-        self.widget = None
-        self.text = ""
+        self.index = None
+        self.chunks = []
 
 
 class Renderer:
@@ -33,6 +42,32 @@ class Renderer:
         self.app = app
         self._stream = StreamBuffer()
 
+        streaming = load_config().streaming
+        self.events = EventQueue(max_size=streaming.queue_size)
+        self._coalescer = StreamCoalescer(
+            flush=self._flush_stream,
+            target_fps=streaming.target_fps,
+            max_latency=streaming.max_latency_ms / 1000,
+        )
+
+    async def start(self) -> None:
+        # Render events in order, decoupled from the pace of the SDK stream
+        while True:
+            event = await self.events.get()
+
+            # One bad event must not stop rendering (and block AgentLoop on a
+            # full queue) for the rest of the session
+            try:
+                await self.handle_app_event(event)
+            except Exception as error:
+                log_json(
+                    {
+                        "event": "render_failed",
+                        "type": event.type.value,
+                        "error": repr(error),
+                    }
+                )
+
     async def handle_app_event(self, event: AppEvent) -> None:
         match event.type:
             case AppEventType.STREAM_EVENT:
@@ -51,10 +86,12 @@ class Renderer:
                 await self._render_tool_permission_request(event)
 
             case AppEventType.RESULT:
-                await self._on_complete()
+                log_json({"event": "event_queue_stats", **self.events.stats()})
+                await self._on_complete(event)
 
-        if event.type is not AppEventType.RESULT:
-            await self.app.ui_state.scroll_to_bottom()
+        # Stream chunks scroll when they are flushed to the widget
+        if event.type not in (AppEventType.RESULT, AppEventType.STREAM_EVENT):
+            self.app.ui_state.scroll_to_bottom()
 
     async def add_message(
         self, type: RoleType, content: str, thinking: bool = True
@@ -69,16 +106,16 @@ class Renderer:
             case _:
                 raise ValueError(f"Unsupported message type: {type}")
 
-        chat_history = self.app.query_one(ChatHistory)
-        chat_history.add_message(message)
+        self.app.conversation.add(message)
 
         if thinking:
             self.app.ui_state.start_thinking()
-        await self.app.ui_state.scroll_to_bottom()
+
+        # Sending a message always jumps back to the latest output
+        self.app.ui_state.scroll_to_bottom(force=type is RoleType.USER)
 
     async def reset_chat_history(self) -> None:
-        chat_history = self.app.query_one(ChatHistory)
-        await chat_history.remove_children()
+        self.app.conversation.clear()
 
     async def _render_stream_event(self, event: AppEvent) -> None:
         text_chunk = event.data.get("text", "")
@@ -86,46 +123,67 @@ class Renderer:
         if not text_chunk:
             return
 
-        chat_history = self.app.query_one(ChatHistory)
+        self._stream.chunks.append(text_chunk)
 
-        if self._stream.widget is None:
-            self._stream.text = text_chunk
+        # Render the first token right away, then coalesce the rest per frame
+        if self._stream.index is None:
+            await self._coalescer.flush()
+        else:
+            self._coalescer.notify()
 
-            agent_msg = AgentMessageWidget()
-            agent_msg.message = text_chunk
+    async def _flush_stream(self) -> None:
+        if not self._stream.pending:
+            return
 
-            await chat_history.mount(agent_msg)
-            self._stream.widget = agent_msg
-        else:
-            self._stream.text += text_chunk
+        text = self._stream.take_pending()
 
-            markdown = self._stream.widget.query_one(Markdown)
-            markdown.update(self._stream.text)
+        with Tracer.span("render_flush", "renderer", chars=len(text)):
+            if self._stream.index is None:
+                self._stream.index = self.app.conversation.add(
+                    Message(type=RoleType.AGENT, content=text)
+                )
+            else:
+                self.app.conversation.append(self._stream.index, text)
+
+        self.app.ui_state.scroll_to_bottom()
+
+    async def _end_stream(self) -> None:
+        if self._stream.pending:
+            await self._coalescer.flush()
+
+        self._stream.reset()
 
     async def _render_assistant_message(self, event: AppEvent) -> None:
         content_blocks = event.data.get("content", [])
-        chat_history = self.app.query_one(ChatHistory)
 
         for block in content_blocks:
             block_type = block.get("type")
 
             if block_type == ContentType.TOOL_USE.value:
-                if self._stream.widget is not None:
-                    self._stream.reset()
-
-                tool_name = block.get("name", "unknown")
-                tool_input = block.get("input", {})
+                if self._stream.index is not None:
+                    await self._end_stream()
 
-                tool_msg = ToolMessage()
-                tool_msg.tool_name = tool_name
-                tool_msg.tool_input = tool_input
+                tool_msg = Message(
+                    type=RoleType.TOOL,
+                    content=json.dumps(block.get("input", {})),
+                    metadata={"tool_name": block.get("name", "unknown")},
+                )
 
-                await chat_history.mount(tool_msg)
+                self.app.conversation.add(tool_msg)
 
     async def _render_system_message(self, event: AppEvent) -> None:
-        system_content = event.data if isinstance(event.data, str) else str(event.data)
+        if isinstance(event.data, dict):
+            system_content = str(event.data.get("message", ""))
+            thinking = event.data.get("thinking", True)
+        else:
+            system_content = str(event.data)
+            thinking = True
 
-        await self.add_message(RoleType.SYSTEM, system_content)
+        # Text streamed after the message continues below it
+        if self._stream.index is not None:
+            await self._end_stream()
+
+        await self.add_message(RoleType.SYSTEM, system_content, thinking=thinking)
 
     async def _render_user_message(self, event: AppEvent) -> None:
         user_content = event.data if isinstance(event.data, str) else str(event.data)
@@ -133,21 +191,25 @@ class Renderer:
         await self.add_message(RoleType.USER, user_content)
 
     async def _render_tool_permission_request(self, event: AppEvent) -> None:
+        requests = event.data.get("requests", [])
+
         log_json(
             {
                 "event": "showing_permission_prompt",
-                "tool_name": event.data.get("tool_name", ""),
+                "tool_names": [request["tool_name"] for request in requests],
             }
         )
 
-        self.app.ui_state.show_permission_prompt(
-            tool_name=event.data.get("tool_name", ""),
-            tool_input=event.data.get("tool_input", {}),
-        )
+        self.app.ui_state.show_permission_prompt(requests)
+
+    async def _on_complete(self, event: AppEvent) -> None:
+        # Shown even when a queued prompt follows; it is cleared once that
+        # one starts
+        if event.data and event.data.get("summary"):
+            self.app.ui_state.show_turn_summary(event.data["summary"])
 
-    async def _on_complete(self) -> None:
         if not self.app.agent_loop.query_queue.empty():
             return
 
         self.app.ui_state.stop_thinking()
-        self._stream.reset()
+        await self._end_stream()
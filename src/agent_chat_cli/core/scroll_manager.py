@@ -0,0 +1,48 @@
+from typing import TYPE_CHECKING
+
+from textual.containers import VerticalScroll
+
+if TYPE_CHECKING:
+    from agent_chat_cli.app import AgentChatCLIApp
+
+
+class ScrollManager:
+    # Distance (in rows) from the end that still counts as being at the bottom
+    PIN_THRESHOLD = 1
+
+    def __init__(self, app: "AgentChatCLIApp") -> None:
+        self.app = app
+        self._container: VerticalScroll | None = None
+        self._pinned = True
+        self._scheduled = False
+
+    @property
+    def is_pinned(self) -> bool:
+        return self._pinned
+
+    def attach(self, container: VerticalScroll) -> None:
+        self._container = container
+        self.app.watch(container, "scroll_y", self._on_scroll, init=False)
+
+    def request_scroll(self, force: bool = False) -> None:
+        if force:
+            self._pinned = True
+
+        if self._scheduled or self._container is None:
+            return
+
+        # Coalesce bursts into one scroll once the new content has been laid out
+        self._scheduled = True
+        self._container.call_after_refresh(self._scroll_to_end)
+
+    def _scroll_to_end(self) -> None:
+        self._scheduled = False
+
+        if self._container is not None and self._pinned:
+            self._container.scroll_end(animate=False, immediate=True)
+
+    def _on_scroll(self, scroll_y: float) -> None:
+        if self._container is None:
+            return
+
+        self._pinned = scroll_y >= self._container.max_scroll_y - self.PIN_THRESHOLD
@@ -0,0 +1,79 @@
+import asyncio
+import time
+from typing import Awaitable, Callable
+
+from agent_chat_cli.utils.logger import log_json
+
+
+class StreamCoalescer:
+    """Runs `flush` at most once per display frame, and never later than
+    `max_latency` after new data was first reported via `notify()`."""
+
+    def __init__(
+        self,
+        flush: Callable[[], Awaitable[None]],
+        target_fps: int = 30,
+        max_latency: float = 0.05,
+    ) -> None:
+        self._flush = flush
+        self.frame_interval = 1 / max(target_fps, 1)
+        self.max_latency = max_latency
+
+        self._last_flush = 0.0
+        self._handle: asyncio.TimerHandle | None = None
+        self._task: asyncio.Task | None = None
+
+    @property
+    def pending(self) -> bool:
+        return self._handle is not None or (
+            self._task is not None and not self._task.done()
+        )
+
+    def notify(self) -> None:
+        if self._handle is not None:
+            return
+
+        next_frame = self._last_flush + self.frame_interval - time.monotonic()
+        delay = max(0.0, min(next_frame, self.max_latency))
+
+        loop = asyncio.get_running_loop()
+        self._handle = loop.call_later(delay, self._on_timer)
+
+    async def flush(self) -> None:
+        self._cancel_timer()
+
+        # A timed flush already under way finishes first, so output stays in order
+        task, self._task = self._task, None
+
+        if task is not None and not task.done():
+            await asyncio.wait({task})
+
+        await self._run_flush()
+
+    def cancel(self) -> None:
+        self._cancel_timer()
+
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _run_flush(self) -> None:
+        self._last_flush = time.monotonic()
+        await self._flush()
+
+    def _cancel_timer(self) -> None:
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+    def _on_timer(self) -> None:
+        self._handle = None
+        self._task = asyncio.create_task(self._run_flush())
+        self._task.add_done_callback(_log_failure)
+
+
+def _log_failure(task: asyncio.Task) -> None:
+    if task.cancelled() or task.exception() is None:
+        return
+
+    log_json({"event": "stream_flush_failed", "error": repr(task.exception())})
@@ -1,4 +1,3 @@
-import asyncio
 from typing import TYPE_CHECKING, Any
 
 from textual.containers import VerticalScroll
@@ -6,8 +5,11 @@ from textual.widgets import TextArea
 
 from agent_chat_cli.components.thinking_indicator import ThinkingIndicator
 from agent_chat_cli.components.tool_permission_prompt import ToolPermissionPrompt
+from agent_chat_cli.components.turn_summary import TurnSummary
 from agent_chat_cli.components.user_input import UserInput
 from agent_chat_cli.components.model_selection_menu import ModelSelectionMenu
+from agent_chat_cli.components.queue_menu import QueueMenu
+from agent_chat_cli.core.scroll_manager import ScrollManager
 
 if TYPE_CHECKING:
     from agent_chat_cli.app import AgentChatCLIApp
@@ -16,19 +18,14 @@ if TYPE_CHECKING:
 class UIState:
     def __init__(self, app: "AgentChatCLIApp") -> None:
         self.app = app
-        self._interrupting = False
-
-    @property
-    def interrupting(self) -> bool:
-        return self._interrupting
-
-    def set_interrupting(self, value: bool) -> None:
-        self._interrupting = value
+        self.scroll = ScrollManager(app)
 
     def start_thinking(self) -> None:
         thinking_indicator = self.app.query_one(ThinkingIndicator)
         thinking_indicator.is_thinking = True
 
+        self.show_turn_summary("")
+
         input_widget = self.app.query_one(TextArea)
         input_widget.cursor_blink = False
 
@@ -40,15 +37,16 @@ class UIState:
             input_widget = self.app.query_one(TextArea)
             input_widget.cursor_blink = True
 
-    def show_permission_prompt(
-        self, tool_name: str, tool_input: dict[str, Any]
-    ) -> None:
+    def show_turn_summary(self, text: str) -> None:
+        turn_summary = self.app.query_one(TurnSummary)
+        turn_summary.text = text
+
+    def show_permission_prompt(self, requests: list[dict[str, Any]]) -> None:
         thinking_indicator = self.app.query_one(ThinkingIndicator)
         thinking_indicator.is_thinking = False
 
         permission_prompt = self.app.query_one(ToolPermissionPrompt)
-        permission_prompt.tool_name = tool_name
-        permission_prompt.tool_input = tool_input
+        permission_prompt.requests = requests
         permission_prompt.is_visible = True
 
         user_input = self.app.query_one(UserInput)
@@ -73,11 +71,26 @@ class UIState:
         input_widget = user_input.query_one(TextArea)
         input_widget.clear()
 
-    async def scroll_to_bottom(self) -> None:
-        await asyncio.sleep(0.1)
-        container = self.app.query_one(VerticalScroll)
-        container.scroll_end(animate=False, immediate=True)
+    def attach_scroll(self) -> None:
+        self.scroll.attach(self.app.query_one(VerticalScroll))
+
+    def scroll_to_bottom(self, force: bool = False) -> None:
+        self.scroll.request_scroll(force=force)
 
     def show_model_menu(self) -> None:
         model_menu = self.app.query_one(ModelSelectionMenu)
         model_menu.show()
+
+    def start_search(self) -> None:
+        user_input = self.app.query_one(UserInput)
+        user_input.search_mode = True
+
+    def show_queue_menu(self, prompts: list[str]) -> None:
+        queue_menu = self.app.query_one(QueueMenu)
+        queue_menu.show(prompts)
+
+    def update_queued_count(self) -> None:
+        thinking_indicator = self.app.query_one(ThinkingIndicator)
+        thinking_indicator.queued = len(
+            self.app.agent_loop.query_queue.pending_prompts()
+        )
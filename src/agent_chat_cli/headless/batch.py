@@ -0,0 +1,193 @@
+import asyncio
+import json
+import math
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, TextIO
+
+from agent_chat_cli.core.mcp_manager import MCPManager
+from agent_chat_cli.headless.rate_limiter import RateLimiter
+from agent_chat_cli.headless.session import HeadlessSession
+from agent_chat_cli.utils.config import get_available_servers
+
+
+@dataclass
+class BatchPrompt:
+    id: Any
+    prompt: str
+
+
+@dataclass
+class BatchReport:
+    completed: int = 0
+    failed: int = 0
+    elapsed: float = 0.0
+    latencies: list[float] = field(default_factory=list)
+
+    @property
+    def throughput(self) -> float:
+        return self.completed / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def p50(self) -> float:
+        return percentile(self.latencies, 50)
+
+    @property
+    def p95(self) -> float:
+        return percentile(self.latencies, 95)
+
+    def summary(self) -> str:
+        return (
+            f"{self.completed} completed, {self.failed} failed in {self.elapsed:.1f}s "
+            f"({self.throughput:.2f} prompts/s), "
+            f"latency p50 {self.p50:.2f}s, p95 {self.p95:.2f}s"
+        )
+
+
+def percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+
+    ordered = sorted(values)
+    rank = max(math.ceil(pct / 100 * len(ordered)) - 1, 0)
+
+    return ordered[rank]
+
+
+def load_prompts(path: Path) -> list[BatchPrompt]:
+    """Read one prompt per line: a JSON string or an object with `prompt`.
+
+    Raises ValueError naming the line when one is not valid JSON.
+    """
+    prompts = []
+
+    with open(path) as f:
+        for number, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError as error:
+                raise ValueError(
+                    f"{path}:{number}: invalid JSON ({error.msg})"
+                ) from error
+
+            if isinstance(entry, str):
+                prompts.append(BatchPrompt(id=number, prompt=entry))
+            else:
+                prompts.append(
+                    BatchPrompt(id=entry.get("id", number), prompt=entry["prompt"])
+                )
+
+    return prompts
+
+
+async def run_batch(
+    prompts: list[BatchPrompt],
+    output: TextIO,
+    concurrency: int = 4,
+    per_minute: float | None = None,
+    allow_tools: bool = False,
+) -> BatchReport:
+    """Answer every prompt in a fresh conversation, `concurrency` at a time.
+
+    Each worker keeps one HeadlessSession and starts a new conversation per
+    prompt, and all of them share the MCP servers and the rate limiter.
+    Results are written to `output` as JSON lines in completion order.
+    """
+    report = BatchReport()
+    pending: asyncio.Queue[BatchPrompt] = asyncio.Queue()
+
+    for prompt in prompts:
+        pending.put_nowait(prompt)
+
+    limiter = RateLimiter(per_minute, burst=concurrency) if per_minute else None
+    mcp_manager = MCPManager(get_available_servers())
+
+    def write(result: dict[str, Any]) -> None:
+        output.write(json.dumps(result) + "\n")
+        output.flush()
+
+    async def worker() -> None:
+        session: HeadlessSession | None = None
+
+        while not pending.empty():
+            item = pending.get_nowait()
+
+            if limiter is not None:
+                await limiter.acquire()
+
+            if session is None:
+                session = HeadlessSession(
+                    mcp_manager=mcp_manager, allow_tools=allow_tools
+                )
+            else:
+                await session.new_conversation()
+
+            started = time.perf_counter()
+
+            try:
+                response = await session.ask(item.prompt)
+            except Exception as error:
+                report.failed += 1
+                write({"id": item.id, "prompt": item.prompt, "error": str(error)})
+
+                # Start over with a fresh session for the next prompt
+                await session.close()
+                session = None
+                continue
+
+            latency = time.perf_counter() - started
+            report.completed += 1
+            report.latencies.append(latency)
+
+            write(
+                {
+                    "id": item.id,
+                    "prompt": item.prompt,
+                    "response": response,
+                    "session_id": session.agent_loop.session_id,
+                    "latency_ms": round(latency * 1000),
+                }
+            )
+
+        if session is not None:
+            await session.close()
+
+    started = time.perf_counter()
+
+    try:
+        await mcp_manager.start()
+
+        workers = min(max(concurrency, 1), len(prompts))
+        await asyncio.gather(*(worker() for _ in range(workers)))
+    finally:
+        await mcp_manager.stop()
+
+    report.elapsed = time.perf_counter() - started
+
+    return report
+
+
+def main(
+    prompts_path: Path,
+    out_path: Path,
+    concurrency: int,
+    per_minute: float | None,
+    allow_tools: bool,
+) -> None:
+    try:
+        prompts = load_prompts(prompts_path)
+    except ValueError as error:
+        print(f"chat: {error}", file=sys.stderr)
+        sys.exit(2)
+
+    with open(out_path, "w") as output:
+        report = asyncio.run(
+            run_batch(prompts, output, concurrency, per_minute, allow_tools)
+        )
+
+    print(report.summary(), file=sys.stderr)
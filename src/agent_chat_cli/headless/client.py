@@ -0,0 +1,126 @@
+import io
+import json
+import socket
+import sys
+from pathlib import Path
+from typing import Any, Callable
+
+# Only the standard library is imported here, so attaching costs milliseconds
+DAEMON_SOCKET_PATH = Path.home() / ".claude" / "agent-chat-cli" / "chat.sock"
+
+
+class DaemonError(Exception):
+    pass
+
+
+def connect(socket_path: Path = DAEMON_SOCKET_PATH) -> io.BufferedRWPair:
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+
+    try:
+        sock.connect(str(socket_path))
+    except OSError:
+        sock.close()
+        raise
+
+    stream = sock.makefile("rwb")
+    sock.close()
+
+    # The daemon greets once a warm session has been handed to this client
+    _read(stream, "ready")
+
+    return stream
+
+
+def send_prompt(
+    stream: io.BufferedRWPair, prompt: str, on_text: Callable[[str], None]
+) -> dict[str, Any]:
+    """Send a prompt, pass streamed text to `on_text`, and return the `done` message."""
+    _write(stream, {"type": "prompt", "text": prompt})
+
+    while True:
+        message = _read(stream, "text", "done")
+
+        if message["type"] == "done":
+            return message
+
+        on_text(message["text"])
+
+
+def new_conversation(stream: io.BufferedRWPair) -> None:
+    _write(stream, {"type": "new"})
+    _read(stream, "ready")
+
+
+def _write(stream: io.BufferedRWPair, message: dict[str, Any]) -> None:
+    stream.write(json.dumps(message).encode() + b"\n")
+    stream.flush()
+
+
+def _read(stream: io.BufferedRWPair, *types: str) -> dict[str, Any]:
+    line = stream.readline()
+
+    if not line:
+        raise DaemonError("daemon closed the connection")
+
+    message = json.loads(line)
+
+    if message["type"] == "error":
+        raise DaemonError(message["message"])
+
+    if message["type"] not in types:
+        raise DaemonError(f"unexpected {message['type']!r} message")
+
+    return message
+
+
+def _print_text(text: str) -> None:
+    sys.stdout.write(text)
+    sys.stdout.flush()
+
+
+def _repl(stream: io.BufferedRWPair) -> None:
+    while True:
+        try:
+            prompt = input("> ").strip()
+        except EOFError:
+            return
+
+        if not prompt:
+            continue
+
+        if prompt in ("/exit", "/quit"):
+            return
+
+        if prompt == "/new":
+            new_conversation(stream)
+            continue
+
+        send_prompt(stream, prompt, _print_text)
+        print()
+
+
+def main(prompt: str | None, socket_path: Path | None = None) -> None:
+    socket_path = socket_path or DAEMON_SOCKET_PATH
+
+    try:
+        stream = connect(socket_path)
+    except OSError:
+        print(
+            f"chat: no daemon listening on {socket_path}; start one with `chat serve`",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+
+    try:
+        if prompt is None:
+            _repl(stream)
+        else:
+            send_prompt(stream, prompt, _print_text)
+            print()
+    except KeyboardInterrupt:
+        sys.exit(130)
+    except DaemonError as error:
+        print(f"chat: {error}", file=sys.stderr)
+        sys.exit(1)
+    finally:
+        stream.close()
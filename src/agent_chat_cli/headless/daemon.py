@@ -0,0 +1,258 @@
+import asyncio
+import json
+import os
+import signal
+import socket
+import sys
+import time
+from pathlib import Path
+from typing import Any, Coroutine
+
+from agent_chat_cli.core.mcp_manager import MESSAGE_LIMIT, MCPManager
+from agent_chat_cli.headless.client import DAEMON_SOCKET_PATH
+from agent_chat_cli.headless.session import HeadlessSession
+from agent_chat_cli.utils.config import get_available_servers
+from agent_chat_cli.utils.logger import log_json
+
+
+class ChatDaemon:
+    """Hands warm HeadlessSessions to thin clients over a unix socket.
+
+    Config, the MCP servers and `pool_size` connected sessions are set up
+    once, so attaching skips all of it. A released session starts a new
+    conversation and goes back to the pool.
+
+    Protocol, one JSON object per line: the daemon greets with `ready`, then
+    answers each `prompt` with `text` chunks and a `done`, and each `new`
+    with `ready`. Failures are reported as `error`.
+    """
+
+    def __init__(
+        self,
+        socket_path: Path = DAEMON_SOCKET_PATH,
+        pool_size: int = 2,
+        allow_tools: bool = False,
+    ) -> None:
+        self.socket_path = socket_path
+        self.pool_size = pool_size
+        self.allow_tools = allow_tools
+
+        self.mcp_manager = MCPManager(get_available_servers())
+
+        self._pool: list[HeadlessSession] = []
+        self._warming = 0
+        self._sessions: set[HeadlessSession] = set()
+        self._server: asyncio.Server | None = None
+        self._background_tasks: set[asyncio.Task] = set()
+        self._connections: set[asyncio.Task] = set()
+
+    async def start(self) -> None:
+        self._claim_socket_path()
+
+        await self.mcp_manager.start()
+
+        self._server = await asyncio.start_unix_server(
+            self._handle_connection, path=str(self.socket_path), limit=MESSAGE_LIMIT
+        )
+        os.chmod(self.socket_path, 0o600)
+
+        self._refill()
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            self._server = None
+            self.socket_path.unlink(missing_ok=True)
+
+        tasks = [*self._connections, *self._background_tasks]
+
+        for task in tasks:
+            task.cancel()
+
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        await asyncio.gather(*(session.close() for session in self._sessions))
+        self._sessions.clear()
+        self._pool.clear()
+
+        await self.mcp_manager.stop()
+
+    @property
+    def idle_sessions(self) -> int:
+        return len(self._pool)
+
+    def _claim_socket_path(self) -> None:
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+
+        if not self.socket_path.exists():
+            return
+
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+
+        try:
+            probe.connect(str(self.socket_path))
+        except OSError:
+            # Left behind by a daemon that did not shut down cleanly
+            self.socket_path.unlink()
+            return
+        finally:
+            probe.close()
+
+        raise RuntimeError(f"a daemon is already listening on {self.socket_path}")
+
+    async def _new_session(self) -> HeadlessSession:
+        session = HeadlessSession(
+            mcp_manager=self.mcp_manager, allow_tools=self.allow_tools
+        )
+        self._sessions.add(session)
+
+        try:
+            await session.warm()
+        except BaseException:
+            await self._discard(session)
+            raise
+
+        return session
+
+    async def _acquire(self) -> HeadlessSession:
+        if self._pool:
+            session = self._pool.pop()
+        else:
+            session = await self._new_session()
+
+        self._refill()
+
+        return session
+
+    async def _release(self, session: HeadlessSession) -> None:
+        if len(self._pool) + self._warming >= self.pool_size:
+            await self._discard(session)
+            return
+
+        await session.new_conversation()
+        self._pool.append(session)
+
+    async def _discard(self, session: HeadlessSession) -> None:
+        self._sessions.discard(session)
+        await session.close()
+
+    def _refill(self) -> None:
+        while len(self._pool) + self._warming < self.pool_size:
+            self._warming += 1
+            self._run_in_background(self._warm_one())
+
+    async def _warm_one(self) -> None:
+        try:
+            self._pool.append(await self._new_session())
+        except Exception as error:
+            log_json({"event": "daemon_warm_failed", "error": str(error)})
+        finally:
+            self._warming -= 1
+
+    def _run_in_background(self, coroutine: Coroutine[Any, Any, None]) -> None:
+        task = asyncio.create_task(coroutine)
+
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        connection = asyncio.current_task()
+        assert connection is not None
+
+        self._connections.add(connection)
+        connection.add_done_callback(self._connections.discard)
+
+        started = time.perf_counter()
+        warm = bool(self._pool)
+
+        try:
+            session = await self._acquire()
+        except Exception as error:
+            _send(writer, {"type": "error", "message": str(error)})
+            writer.close()
+            return
+
+        log_json(
+            {
+                "event": "daemon_attach",
+                "warm": warm,
+                "ms": round((time.perf_counter() - started) * 1000, 1),
+            }
+        )
+
+        def forward(text: str) -> None:
+            _send(writer, {"type": "text", "text": text})
+
+        session.on_text = forward
+        _send(writer, {"type": "ready"})
+        healthy = True
+
+        try:
+            async for line in reader:
+                try:
+                    message = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+
+                if message.get("type") == "new":
+                    await session.new_conversation()
+                    _send(writer, {"type": "ready"})
+
+                elif message.get("type") == "prompt":
+                    await session.ask(message.get("text", ""))
+                    _send(
+                        writer,
+                        {"type": "done", "session_id": session.agent_loop.session_id},
+                    )
+
+                await writer.drain()
+        except ConnectionError:
+            pass
+        except Exception as error:
+            # A failed turn leaves the session unusable
+            healthy = False
+            _send(writer, {"type": "error", "message": str(error)})
+        finally:
+            writer.close()
+            session.on_text = None
+
+            if healthy and self._server is not None:
+                await self._release(session)
+            else:
+                await self._discard(session)
+
+
+def _send(writer: asyncio.StreamWriter, message: dict[str, Any]) -> None:
+    if not writer.is_closing():
+        writer.write(json.dumps(message).encode() + b"\n")
+
+
+async def serve(
+    socket_path: Path = DAEMON_SOCKET_PATH,
+    pool_size: int = 2,
+    allow_tools: bool = False,
+) -> None:
+    daemon = ChatDaemon(socket_path, pool_size, allow_tools)
+    stopping = asyncio.Event()
+
+    asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, stopping.set)
+
+    await daemon.start()
+    print(f"chat: serving on {socket_path}", file=sys.stderr)
+
+    try:
+        await stopping.wait()
+    finally:
+        await daemon.stop()
+
+
+def main(socket_path: Path | None, pool_size: int, allow_tools: bool) -> None:
+    try:
+        asyncio.run(serve(socket_path or DAEMON_SOCKET_PATH, pool_size, allow_tools))
+    except KeyboardInterrupt:
+        pass
+    except RuntimeError as error:
+        print(f"chat: {error}", file=sys.stderr)
+        sys.exit(1)
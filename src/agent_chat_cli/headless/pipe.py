@@ -0,0 +1,50 @@
+import asyncio
+import sys
+
+from agent_chat_cli.headless.session import HeadlessSession
+
+
+def _write(text: str) -> None:
+    sys.stdout.write(text)
+    sys.stdout.flush()
+
+
+def read_prompt(prompt: str | None) -> str:
+    # `chat -p` without a prompt (or with `-`) reads it from stdin
+    if prompt is None or prompt == "-":
+        return sys.stdin.read().strip()
+
+    return prompt.strip()
+
+
+async def run_pipe(prompt: str, allow_tools: bool = False) -> str:
+    session = HeadlessSession(allow_tools=allow_tools, on_text=_write)
+
+    try:
+        response = await session.ask(prompt)
+    finally:
+        await session.close()
+
+    if response and not response.endswith("\n"):
+        _write("\n")
+
+    return response
+
+
+def main(prompt: str | None, allow_tools: bool) -> None:
+    text = read_prompt(prompt)
+
+    if not text:
+        print("chat: no prompt given", file=sys.stderr)
+        sys.exit(2)
+
+    try:
+        asyncio.run(run_pipe(text, allow_tools))
+    except KeyboardInterrupt:
+        sys.exit(130)
+    except BrokenPipeError:
+        # The reader went away (e.g. `| head`); nothing left to do
+        sys.exit(0)
+    except Exception as error:
+        print(f"chat: {error}", file=sys.stderr)
+        sys.exit(1)
@@ -0,0 +1,34 @@
+import asyncio
+import time
+
+
+class RateLimiter:
+    """Token bucket shared by concurrent sessions.
+
+    Allows `per_minute` acquisitions per minute on average, and up to `burst`
+    at once after an idle period.
+    """
+
+    def __init__(self, per_minute: float, burst: int = 1) -> None:
+        self.rate = per_minute / 60
+        self.burst = max(burst, 1)
+
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        # Waiters queue on the lock, so they are served in arrival order
+        async with self._lock:
+            self._refill()
+
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+
+            self._tokens -= 1
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
@@ -0,0 +1,172 @@
+import asyncio
+import json
+from typing import Awaitable, Callable
+
+from agent_chat_cli.core.agent_loop import AgentLoop, AppEvent
+from agent_chat_cli.core.conversation_store import ConversationStore, Message
+from agent_chat_cli.core.event_queue import EventQueue
+from agent_chat_cli.core.mcp_manager import MCPManager
+from agent_chat_cli.utils.enums import (
+    AppEventType,
+    ContentType,
+    ControlCommand,
+    RoleType,
+)
+
+
+class HeadlessActions:
+    def __init__(self, session: "HeadlessSession") -> None:
+        self.session = session
+
+    async def post_app_event(self, event: AppEvent) -> None:
+        await self.session.events.put(event)
+
+    async def post_system_message(self, message: str, thinking: bool = True) -> None:
+        self.session.conversation.add(Message(type=RoleType.SYSTEM, content=message))
+
+
+class HeadlessSession:
+    """Runs an AgentLoop without Textual.
+
+    Stands in for the app AgentLoop reports to: events are recorded in
+    `conversation` the same way the Renderer does, and streamed text is also
+    handed to `on_text` as it arrives. With no one to ask, tool permission
+    requests are answered according to `allow_tools`.
+    """
+
+    def __init__(
+        self,
+        mcp_manager: MCPManager | None = None,
+        allow_tools: bool = False,
+        on_text: Callable[[str], None] | None = None,
+    ) -> None:
+        self.allow_tools = allow_tools
+        self.on_text = on_text
+
+        self.conversation = ConversationStore()
+        self.events = EventQueue()
+        self.actions = HeadlessActions(self)
+        self.agent_loop = AgentLoop(app=self, mcp_manager=mcp_manager)  # type: ignore[arg-type]
+
+        # Pipe turns are one-shot, and batch workers and the daemon pool
+        # already keep sessions warm; a standby client each would only double
+        # the SDK subprocesses
+        self.agent_loop.config.prewarm_client = False
+
+        self._task: asyncio.Task | None = None
+        self._agent_index: int | None = None
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self.agent_loop.start())
+
+    async def warm(self) -> None:
+        """Start the loop and wait until its client is connected."""
+        await self.start()
+        await self._until_stopped(self.agent_loop.ready.wait())
+
+    async def close(self) -> None:
+        if self._task is None:
+            return
+
+        self._task.cancel()
+
+        try:
+            await self._task
+        except (asyncio.CancelledError, Exception):
+            pass
+
+        self._task = None
+
+    async def new_conversation(self) -> None:
+        await self.agent_loop.query_queue.put(ControlCommand.NEW_CONVERSATION)
+        self.conversation.clear()
+
+    async def ask(self, prompt: str) -> str:
+        """Send one prompt and return the agent's text once the turn is over."""
+        await self.start()
+
+        first = len(self.conversation)
+        self.conversation.add(Message(type=RoleType.USER, content=prompt))
+        await self.agent_loop.query_queue.put(prompt)
+
+        await self._run_turn()
+
+        return "\n\n".join(
+            message.content
+            for message in self.conversation.messages[first:]
+            if message.type is RoleType.AGENT
+        )
+
+    async def _run_turn(self) -> None:
+        # Text blocks only count when nothing was streamed for that message
+        streamed = False
+
+        while True:
+            event = await self._next_event()
+
+            match event.type:
+                case AppEventType.STREAM_EVENT:
+                    streamed = self._add_text(event.data.get("text", "")) or streamed
+
+                case AppEventType.ASSISTANT:
+                    for block in event.data.get("content", []):
+                        if block.get("type") == ContentType.TEXT.value and not streamed:
+                            self._add_text(block.get("text", ""))
+
+                        elif block.get("type") == ContentType.TOOL_USE.value:
+                            self._add_tool_use(block)
+
+                    streamed = False
+
+                case AppEventType.TOOL_PERMISSION_REQUEST:
+                    response = "yes" if self.allow_tools else "no"
+                    await self.agent_loop.permission_response_queue.put(response)
+
+                case AppEventType.RESULT:
+                    self._agent_index = None
+                    return
+
+    async def _next_event(self) -> AppEvent:
+        return await self._until_stopped(self.events.get())
+
+    async def _until_stopped[T](self, awaitable: Awaitable[T]) -> T:
+        assert self._task is not None
+
+        waiter = asyncio.ensure_future(awaitable)
+        await asyncio.wait({waiter, self._task}, return_when=asyncio.FIRST_COMPLETED)
+
+        if waiter.done():
+            return waiter.result()
+
+        waiter.cancel()
+
+        # The loop only returns by failing, e.g. when the client cannot connect
+        self._task.result()
+        raise RuntimeError("Agent loop stopped")
+
+    def _add_text(self, text: str) -> bool:
+        if not text:
+            return False
+
+        if self._agent_index is None:
+            self._agent_index = self.conversation.add(
+                Message(type=RoleType.AGENT, content=text)
+            )
+        else:
+            self.conversation.append(self._agent_index, text)
+
+        if self.on_text is not None:
+            self.on_text(text)
+
+        return True
+
+    def _add_tool_use(self, block: dict) -> None:
+        self._agent_index = None
+        self.conversation.add(
+            Message(
+                type=RoleType.TOOL,
+                content=json.dumps(block.get("input", {})),
+                metadata={"tool_name": block.get("name", "unknown")},
+            )
+        )
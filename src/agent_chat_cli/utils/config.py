@@ -1,13 +1,24 @@
+import asyncio
+import hashlib
 import os
+import re
+import threading
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Any, Callable
 
-from claude_agent_sdk import AgentDefinition
 import yaml
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
+from agent_chat_cli.utils.enums import JournalFsync, MCPStartMode, PermissionAction
+from agent_chat_cli.utils.logger import log_json
 from agent_chat_cli.utils.system_prompt import build_system_prompt
 
 PROMPTS_DIR = Path(__file__).parent.parent / "prompts"
+CONFIG_PATH = "agent-chat-cli.config.yaml"
+
+# Seconds between checks of the config files for edits
+CONFIG_POLL_INTERVAL = 2.0
 
 
 class MCPServerConfig(BaseModel):
@@ -19,48 +30,306 @@ class MCPServerConfig(BaseModel):
     enabled: bool = True
     prompt: str | None = None
 
+    # `lazy` serves cached tool schemas and launches on the first tool call
+    start: MCPStartMode = MCPStartMode.EAGER
+
+    # Seconds a client waits for the server before continuing without it
+    connect_timeout: float = 10.0
+
+
+class AgentConfig(BaseModel):
+    description: str
+    prompt: str
+    tools: list[str] | None = None
+    model: str | None = None
+
+
+class StreamingConfig(BaseModel):
+    target_fps: int = 30
+    max_latency_ms: int = 50
+
+    # Events waiting to be rendered before AgentLoop is made to wait
+    queue_size: int = 256
+
+
+class PermissionRule(BaseModel):
+    action: PermissionAction
+
+    # Globs; `server` only matches MCP tools (`mcp__<server>__<tool>`)
+    server: str | None = None
+    tool: str = "*"
+
+    # Regexes searched in the named tool input fields, all of which must match
+    input: dict[str, str] = Field(default_factory=dict)
+
+    @field_validator("input")
+    @classmethod
+    def _compile_input_patterns(cls, patterns: dict[str, str]) -> dict[str, str]:
+        for field, pattern in patterns.items():
+            try:
+                re.compile(pattern)
+            except re.error as error:
+                raise ValueError(f"invalid pattern for {field!r}: {error}") from error
+
+        return patterns
+
+
+class PermissionsConfig(BaseModel):
+    # The first matching rule decides; anything unmatched gets `default`
+    rules: list[PermissionRule] = Field(default_factory=list)
+    default: PermissionAction = PermissionAction.ASK
+
 
 class AgentChatConfig(BaseModel):
     system_prompt: str
     model: str
     include_partial_messages: bool = True
-    agents: dict[str, AgentDefinition] = Field(default_factory=dict)
+    agents: dict[str, AgentConfig] = Field(default_factory=dict)
     mcp_servers: dict[str, MCPServerConfig] = Field(default_factory=dict)
     disallowed_tools: list[str] = Field(default_factory=list)
     permission_mode: str = "bypass_permissions"
+    streaming: StreamingConfig = Field(default_factory=StreamingConfig)
+
+    # Keep a connected client in reserve so /new does not wait on a cold start
+    prewarm_client: bool = True
+
+    # Merge messages sent while the agent is busy into a single turn
+    coalesce_queued_prompts: bool = False
+
+    permissions: PermissionsConfig = Field(default_factory=PermissionsConfig)
+
+    # When the session journal is fsynced: every record, every write batch, or never
+    journal_fsync: JournalFsync = JournalFsync.BATCH
 
+    # Log only 1 in N of these events, e.g. {"permission_policy_decision": 10}
+    log_sample_rates: dict[str, int] = Field(default_factory=dict)
 
-def load_prompt(prompt_value: str) -> str:
+    # Collect trace spans and write them to this Chrome trace file on exit
+    trace_file: str | None = None
+
+
+# App-only settings that must not be forwarded to ClaudeAgentOptions
+APP_CONFIG_FIELDS = {
+    "streaming",
+    "prewarm_client",
+    "coalesce_queued_prompts",
+    "permissions",
+    "journal_fsync",
+    "log_sample_rates",
+    "trace_file",
+}
+
+# App settings only read at startup; a reload asks for a restart instead
+RESTART_CONFIG_FIELDS = {"streaming", "trace_file"}
+
+
+def load_prompt(prompt_value: str, sources: list[Path] | None = None) -> str:
     try:
         prompt_path = PROMPTS_DIR / prompt_value
-        return prompt_path.read_text()
+        prompt = prompt_path.read_text()
     except (FileNotFoundError, OSError):
         # If it's not a file, treat it as a literal prompt string
         return prompt_value
 
+    if sources is not None:
+        sources.append(prompt_path)
+
+    return prompt
+
+
+@dataclass(frozen=True)
+class ConfigChange:
+    previous: AgentChatConfig
+    config: AgentChatConfig
+
+    # Top-level fields whose values differ, e.g. {"mcp_servers"}
+    sections: frozenset[str]
+
+
+@dataclass
+class _FileState:
+    mtime_ns: int
+    size: int
+    digest: str
+
+    @classmethod
+    def read(cls, path: Path) -> "_FileState":
+        stat = path.stat()
+        return cls(stat.st_mtime_ns, stat.st_size, _digest(path))
+
+    def changed(self, path: Path) -> bool:
+        try:
+            stat = path.stat()
+        except OSError:
+            return True
+
+        if (stat.st_mtime_ns, stat.st_size) == (self.mtime_ns, self.size):
+            return False
+
+        # Touched (e.g. by an editor or git checkout) but maybe not edited
+        digest = _digest(path)
+        self.mtime_ns, self.size = stat.st_mtime_ns, stat.st_size
+
+        if digest == self.digest:
+            return False
+
+        self.digest = digest
+        return True
+
+
+@dataclass
+class _CacheEntry:
+    config: AgentChatConfig
+    files: dict[Path, _FileState]
+
+    def changed(self) -> bool:
+        # Every file is checked, so each one's state is brought up to date
+        return any([state.changed(path) for path, state in self.files.items()])
 
-def load_config(
-    config_path: str | Path = "agent-chat-cli.config.yaml",
-) -> AgentChatConfig:
-    path = Path(config_path)
 
+class ConfigService:
+    """Process-wide cache of parsed config files.
+
+    A config is parsed once and served from memory for as long as its YAML
+    and every prompt file it references are unchanged. `refresh()` re-checks
+    them (stat first, content hash only when the stat differs) and `watch()`
+    tells subscribers which top-level sections changed, so they can re-apply
+    just those. Environment variables are only expanded when a file is parsed.
+    """
+
+    _entries: dict[Path, _CacheEntry] = {}
+    _callbacks: list[Callable[[ConfigChange], None]] = []
+
+    # refresh() runs on the watcher's thread as well as on the caller's
+    _lock = threading.Lock()
+
+    @classmethod
+    def get(cls, config_path: str | Path = CONFIG_PATH) -> AgentChatConfig:
+        cls.refresh(config_path)
+
+        # Callers get their own copy, so AgentLoop can switch `model` in place
+        return cls._entries[Path(config_path).absolute()].config.model_copy(deep=True)
+
+    @classmethod
+    def refresh(cls, config_path: str | Path = CONFIG_PATH) -> ConfigChange | None:
+        """Re-parse the config if it changed and return what changed.
+
+        Subscribers are not called here; `watch()` does that on the loop.
+        """
+        path = Path(config_path)
+        key = path.absolute()
+
+        with cls._lock:
+            entry = cls._entries.get(key)
+
+            if entry is not None and not entry.changed():
+                return None
+
+            try:
+                config, sources = _parse_config(path)
+            except Exception as error:
+                if entry is None:
+                    raise
+
+                # Keep serving the last good config while the file is mid-edit
+                log_json({"event": "config_reload_failed", "error": str(error)})
+                return None
+
+            cls._entries[key] = _CacheEntry(
+                config, {source: _FileState.read(source) for source in sources}
+            )
+
+        if entry is None:
+            return None
+
+        change = ConfigChange(
+            previous=entry.config,
+            config=config,
+            sections=_changed_sections(entry.config, config),
+        )
+
+        if not change.sections:
+            return None
+
+        log_json({"event": "config_reloaded", "sections": sorted(change.sections)})
+
+        return change
+
+    @classmethod
+    async def watch(cls, config_path: str | Path = CONFIG_PATH) -> None:
+        key = Path(config_path).absolute()
+        entry = cls._entries.get(key)
+        seen = entry.config if entry is not None else None
+
+        while True:
+            await asyncio.sleep(CONFIG_POLL_INTERVAL)
+
+            # Stat, hash and parse off the event loop
+            await asyncio.to_thread(cls.refresh, config_path)
+
+            # Compared with what subscribers last saw rather than taken from
+            # refresh(), since a load_config() may have picked up the edit first
+            entry = cls._entries.get(key)
+
+            if entry is None or entry.config is seen:
+                continue
+
+            previous, seen = seen, entry.config
+
+            if previous is None:
+                continue
+
+            sections = _changed_sections(previous, seen)
+
+            if sections:
+                cls._notify(
+                    ConfigChange(previous=previous, config=seen, sections=sections)
+                )
+
+    @classmethod
+    def subscribe(cls, callback: Callable[[ConfigChange], None]) -> None:
+        cls._callbacks.append(callback)
+
+    @classmethod
+    def unsubscribe(cls, callback: Callable[[ConfigChange], None]) -> None:
+        if callback in cls._callbacks:
+            cls._callbacks.remove(callback)
+
+    @classmethod
+    def _notify(cls, change: ConfigChange) -> None:
+        for callback in list(cls._callbacks):
+            callback(change)
+
+    @classmethod
+    def clear(cls) -> None:
+        cls._entries.clear()
+        cls._callbacks.clear()
+
+
+def load_config(config_path: str | Path = CONFIG_PATH) -> AgentChatConfig:
+    return ConfigService.get(config_path)
+
+
+def _parse_config(path: Path) -> tuple[AgentChatConfig, list[Path]]:
     if not path.exists():
         raise FileNotFoundError(f"Configuration file not found: {path}")
 
     with open(path) as f:
         raw_config = yaml.safe_load(f)
 
+    # The YAML and every prompt file it pulled in, checked by ConfigService
+    sources = [path]
     base_system_prompt = ""
 
     if raw_config.get("system_prompt"):
-        base_system_prompt = load_prompt(raw_config["system_prompt"])
+        base_system_prompt = load_prompt(raw_config["system_prompt"], sources)
 
     if raw_config.get("agents"):
         for agent_name, agent_config in raw_config["agents"].items():
             if agent_config.get("prompt"):
-                agent_config["prompt"] = load_prompt(agent_config["prompt"])
+                agent_config["prompt"] = load_prompt(agent_config["prompt"], sources)
 
-            raw_config["agents"][agent_name] = AgentDefinition(
+            raw_config["agents"][agent_name] = AgentConfig(
                 description=agent_config["description"],
                 prompt=agent_config["prompt"],
                 tools=agent_config.get("tools"),
@@ -80,7 +349,7 @@ def load_config(
 
         for server_config in enabled_servers.values():
             if server_config.get("prompt"):
-                loaded_prompt = load_prompt(server_config["prompt"])
+                loaded_prompt = load_prompt(server_config["prompt"], sources)
                 server_config["prompt"] = loaded_prompt
                 mcp_server_prompts.append(loaded_prompt)
 
@@ -97,15 +366,28 @@ def load_config(
         base_system_prompt, mcp_server_prompts
     )
 
-    return AgentChatConfig(**raw_config)
+    return AgentChatConfig(**raw_config), sources
 
 
 def get_available_servers(
-    config_path: str | Path = "agent-chat-cli.config.yaml",
+    config_path: str | Path = CONFIG_PATH,
 ) -> dict[str, MCPServerConfig]:
     config = load_config(config_path)
     return config.mcp_servers
 
 
-def get_sdk_config(config: AgentChatConfig) -> dict:
-    return config.model_dump()
+def get_sdk_config(config: AgentChatConfig) -> dict[str, Any]:
+    return config.model_dump(exclude=APP_CONFIG_FIELDS)
+
+
+def _changed_sections(
+    previous: AgentChatConfig, config: AgentChatConfig
+) -> frozenset[str]:
+    before: dict[str, Any] = previous.model_dump()
+    after: dict[str, Any] = config.model_dump()
+
+    return frozenset(name for name in after if before.get(name) != after[name])
+
+
+def _digest(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
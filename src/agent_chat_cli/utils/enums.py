@@ -19,11 +19,52 @@ class ContentType(Enum):
     TEXT_DELTA = "text_delta"
 
 
+class RoleType(Enum):
+    SYSTEM = "system"
+    USER = "user"
+    AGENT = "agent"
+    TOOL = "tool"
+
+
+class ConversationEventType(Enum):
+    ADDED = "added"
+    APPENDED = "appended"
+    CLEARED = "cleared"
+
+
+class MCPStartMode(Enum):
+    EAGER = "eager"
+    LAZY = "lazy"
+
+
+class PermissionAction(Enum):
+    ALLOW = "allow"
+    DENY = "deny"
+    ASK = "ask"
+
+
+class JournalFsync(Enum):
+    ALWAYS = "always"
+    BATCH = "batch"
+    NEVER = "never"
+
+
+class TimelineStatus(Enum):
+    RUNNING = "running"
+    OK = "ok"
+    LAZY = "lazy"
+    TIMEOUT = "timeout"
+    LATE = "late"
+    FAILED = "failed"
+
+
 class ControlCommand(Enum):
     NEW_CONVERSATION = "new_conversation"
     CHANGE_MODEL = "change_model"
     EXIT = "exit"
     CLEAR = "clear"
+    RESUME = "resume"
+    RECONNECT = "reconnect"
 
 
 class ModelChangeCommand(NamedTuple):
@@ -31,6 +72,11 @@ class ModelChangeCommand(NamedTuple):
     model: str
 
 
+class ResumeCommand(NamedTuple):
+    command: ControlCommand
+    session_id: str
+
+
 class Key(Enum):
     ENTER = "enter"
     ESCAPE = "escape"
@@ -0,0 +1,228 @@
+import json
+import os
+import queue
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, TextIO
+
+from agent_chat_cli.core.conversation_store import (
+    ConversationEvent,
+    ConversationStore,
+    Message,
+)
+from agent_chat_cli.utils.enums import ConversationEventType, JournalFsync, RoleType
+from agent_chat_cli.utils.logger import log_json
+
+JOURNAL_DIR = Path.home() / ".claude" / "agent-chat-cli" / "journal"
+
+# Journals kept on disk; older ones are removed when a new session starts
+JOURNAL_KEEP = 20
+
+
+@dataclass
+class JournalSnapshot:
+    path: Path
+    session_id: str | None = None
+    messages: list[Message] = field(default_factory=list)
+
+    # False when the app never closed the journal, i.e. it crashed or was killed
+    finished: bool = False
+
+
+class Journal:
+    """Append-only JSONL record of a session, written as the conversation changes.
+
+    Records are handed to a writer thread, which owns the file, so the event
+    loop never waits on disk; each batch it picks up is written with one
+    flush, and fsynced according to `fsync`.
+    """
+
+    def __init__(
+        self,
+        store: ConversationStore,
+        path: Path,
+        fsync: JournalFsync = JournalFsync.BATCH,
+    ) -> None:
+        self.path = path
+        self.fsync = fsync
+
+        self._store = store
+        self._records: queue.SimpleQueue[dict[str, Any] | None] = queue.SimpleQueue()
+        self._closed = False
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._thread = threading.Thread(
+            target=self._write_loop, name="journal-writer", daemon=True
+        )
+        self._thread.start()
+
+        store.subscribe(self._on_event)
+
+    @classmethod
+    def create(
+        cls,
+        store: ConversationStore,
+        fsync: JournalFsync = JournalFsync.BATCH,
+    ) -> "Journal":
+        _prune()
+
+        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        path = JOURNAL_DIR / f"session-{timestamp}-{os.getpid()}.jsonl"
+
+        return cls(store, path, fsync)
+
+    def record_session(self, session_id: str) -> None:
+        self._put({"type": "session", "session_id": session_id})
+
+    def close(self, finished: bool = True) -> None:
+        """Stop recording; a journal not `finished` is offered for /restore."""
+        if self._closed:
+            return
+
+        self._store.unsubscribe(self._on_event)
+
+        if finished:
+            self._put({"type": "closed"})
+
+        self._closed = True
+        self._records.put(None)
+        self._thread.join()
+
+    def _on_event(self, event: ConversationEvent) -> None:
+        match event.type:
+            case ConversationEventType.ADDED:
+                message = self._store[event.index]
+                self._put(
+                    {
+                        "type": "added",
+                        "index": event.index,
+                        "role": message.type.value,
+                        "content": message.content,
+                        "metadata": message.metadata,
+                    }
+                )
+            case ConversationEventType.APPENDED:
+                self._put(
+                    {"type": "appended", "index": event.index, "text": event.text}
+                )
+            case ConversationEventType.CLEARED:
+                self._put({"type": "cleared"})
+
+    def _put(self, record: dict[str, Any]) -> None:
+        if not self._closed:
+            self._records.put(record)
+
+    def _write_loop(self) -> None:
+        try:
+            with open(self.path, "a", encoding="utf-8") as file:
+                while self._write_batch(file):
+                    pass
+        except OSError as error:
+            # Nothing more can be recorded; the session just is not journaled
+            self._closed = True
+            log_json({"event": "journal_write_failed", "error": str(error)})
+
+    def _write_batch(self, file: TextIO) -> bool:
+        """Write what is queued; False once the journal is closed."""
+        batch = [self._records.get()]
+
+        # Everything queued while the last batch was written goes out at once
+        while not self._records.empty():
+            batch.append(self._records.get_nowait())
+
+        try:
+            for record in batch:
+                if record is None:
+                    _sync(file)
+                    return False
+
+                file.write(json.dumps(record, default=str) + "\n")
+
+                if self.fsync is JournalFsync.ALWAYS:
+                    _sync(file)
+
+            if self.fsync is JournalFsync.BATCH:
+                _sync(file)
+            else:
+                file.flush()
+        except OSError as error:
+            log_json({"event": "journal_write_failed", "error": str(error)})
+
+        return None not in batch
+
+
+def read_journal(path: Path) -> JournalSnapshot:
+    snapshot = JournalSnapshot(path=path)
+
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                # The last line of a crashed session may be cut short
+                continue
+
+            match record.get("type"):
+                case "session":
+                    snapshot.session_id = record["session_id"]
+                case "added":
+                    snapshot.messages.append(
+                        Message(
+                            type=RoleType(record["role"]),
+                            content=record["content"],
+                            metadata=record.get("metadata"),
+                        )
+                    )
+                case "appended":
+                    snapshot.messages[record["index"]].append(record["text"])
+                case "cleared":
+                    snapshot.messages.clear()
+                    snapshot.session_id = None
+                case "closed":
+                    snapshot.finished = True
+
+    return snapshot
+
+
+def find_unfinished_session() -> JournalSnapshot | None:
+    """The most recent session, if it ended without closing its journal."""
+    journals = sorted(JOURNAL_DIR.glob("session-*.jsonl"))
+
+    if not journals:
+        return None
+
+    try:
+        snapshot = read_journal(journals[-1])
+    except (OSError, KeyError, IndexError, ValueError):
+        return None
+
+    if snapshot.finished or not snapshot.messages:
+        return None
+
+    return snapshot
+
+
+def mark_finished(path: Path) -> None:
+    """Stop offering a journal for restore once it was restored or dismissed."""
+    try:
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(json.dumps({"type": "closed"}) + "\n")
+    except OSError as error:
+        log_json(
+            {"event": "journal_write_failed", "path": str(path), "error": str(error)}
+        )
+
+
+def _sync(file: TextIO) -> None:
+    file.flush()
+    os.fsync(file.fileno())
+
+
+def _prune() -> None:
+    journals = sorted(JOURNAL_DIR.glob("session-*.jsonl"))
+
+    for path in journals[: max(len(journals) - JOURNAL_KEEP + 1, 0)]:
+        path.unlink(missing_ok=True)
@@ -1,23 +1,161 @@
+import atexit
 import json
 import logging
 import os
+import queue
+from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from pathlib import Path
 from typing import Any
 
-from textual.logging import TextualHandler
+LOG_PATH = Path.home() / ".claude" / "agent-chat-cli" / "logs" / "chat.jsonl"
 
+# Rotated at LOG_MAX_BYTES, keeping LOG_BACKUPS older files
+LOG_MAX_BYTES = 5 * 1024 * 1024
+LOG_BACKUPS = 3
 
-def setup_logging():
-    level = os.getenv("LOG_LEVEL", "INFO").upper()
+logger = logging.getLogger("agent_chat_cli")
 
-    logging.basicConfig(
-        level=level,
-        handlers=[TextualHandler()],
+_listener: QueueListener | None = None
+_handlers: list[logging.Handler] = []
+
+# Event name -> write 1 in N, and how many of each were seen so far
+_sample_rates: dict[str, int] = {}
+_sample_counts: dict[str, int] = {}
+
+
+class JsonFormatter(logging.Formatter):
+    """One compact JSON object per record, serialized where it is written."""
+
+    def __init__(self, indent: int | None = None) -> None:
+        super().__init__()
+        self.indent = indent
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: dict[str, Any] = {
+            "ts": datetime.fromtimestamp(record.created).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+        }
+
+        if isinstance(record.msg, dict):
+            entry.update(record.msg)
+        else:
+            entry["message"] = record.getMessage()
+
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+
+        separators = None if self.indent else (",", ":")
+        return json.dumps(entry, indent=self.indent, separators=separators, default=str)
+
+
+class _DeferredQueueHandler(QueueHandler):
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # QueueHandler would format here, on the caller's thread; the
+        # listener's handlers do it instead
+        return record
+
+
+def setup_logging(
+    path: Path | None = None,
+    sample_rates: dict[str, int] | None = None,
+    console: bool | None = None,
+    max_bytes: int = LOG_MAX_BYTES,
+) -> None:
+    """Write logs as JSONL to a rotating file, from a background thread.
+
+    `console` mirrors them to the Textual dev console (`make console`); it
+    defaults to the LOG_CONSOLE environment variable. That handler has to
+    run on the app's thread, so it is opt-in.
+    """
+    global _listener
+
+    shutdown_logging()
+
+    path = path or LOG_PATH
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    file_handler = RotatingFileHandler(
+        path, maxBytes=max_bytes, backupCount=LOG_BACKUPS, encoding="utf-8"
     )
+    file_handler.setFormatter(JsonFormatter())
+
+    records: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    _listener = QueueListener(records, file_handler)
+    _listener.start()
+    _handlers.append(_DeferredQueueHandler(records))
+
+    if console is None:
+        console = os.getenv("LOG_CONSOLE", "") not in ("", "0")
+
+    if console:
+        # Imported here so headless modes can log without loading Textual
+        from textual.logging import TextualHandler
+
+        console_handler = TextualHandler()
+        console_handler.setFormatter(JsonFormatter(indent=2))
+        _handlers.append(console_handler)
+
+    root = logging.getLogger()
+    root.setLevel(os.getenv("LOG_LEVEL", "INFO").upper())
+
+    for handler in _handlers:
+        root.addHandler(handler)
+
+    set_sample_rates(sample_rates or {})
+
+    atexit.unregister(shutdown_logging)
+    atexit.register(shutdown_logging)
+
+
+def set_sample_rates(sample_rates: dict[str, int]) -> None:
+    """Log only 1 in N of the named events from here on."""
+    _sample_rates.clear()
+    _sample_rates.update(sample_rates)
+    _sample_counts.clear()
+
+
+def shutdown_logging() -> None:
+    """Detach the handlers and write out whatever is still queued."""
+    global _listener
+
+    root = logging.getLogger()
+
+    for handler in _handlers:
+        root.removeHandler(handler)
+
+    _handlers.clear()
+
+    if _listener is not None:
+        _listener.stop()
+
+        for handler in _listener.handlers:
+            handler.close()
+
+        _listener = None
 
 
 def log(message: str):
-    logging.info(message)
+    logger.info(message)
+
+
+def log_json(message: dict[str, Any]):
+    # Nothing is serialized unless the record will be written, and then only
+    # on the listener thread, so the dict must not be changed after the call
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
+    event = message.get("event")
+    name = event if isinstance(event, str) else None
+
+    if name is not None and (rate := _sample_rates.get(name, 1)) > 1:
+        seen = _sample_counts.get(name, 0)
+        _sample_counts[name] = seen + 1
+
+        if seen % rate:
+            return
 
+        message = {**message, "sampled": rate}
 
-def log_json(message: Any):
-    logging.info(json.dumps(message, indent=2))
+    logger.info(message)
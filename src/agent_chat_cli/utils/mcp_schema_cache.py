@@ -0,0 +1,62 @@
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, NotRequired, TypedDict, cast
+
+from agent_chat_cli.utils.config import MCPServerConfig
+from agent_chat_cli.utils.logger import log_json
+
+MCP_SCHEMA_CACHE_DIR = Path.home() / ".claude" / "agent-chat-cli" / "mcp_cache"
+
+
+class MCPSchema(TypedDict):
+    # Only stored in the cache file, to tell whether the launch changed
+    fingerprint: NotRequired[str]
+    initialize: dict[str, Any]
+    tools: list[dict[str, Any]]
+
+
+def _fingerprint(config: MCPServerConfig) -> str:
+    # Hashed, since args and env routinely carry expanded secrets
+    launch = json.dumps([config.command, config.args, config.env], sort_keys=True)
+    return hashlib.sha256(launch.encode()).hexdigest()
+
+
+def load_schema(name: str, config: MCPServerConfig) -> MCPSchema | None:
+    """Return the handshake and tools cached for a server, if still current."""
+    try:
+        schema = json.loads((MCP_SCHEMA_CACHE_DIR / f"{name}.json").read_text())
+    except (OSError, json.JSONDecodeError):
+        return None
+
+    if (
+        not isinstance(schema, dict)
+        or schema.get("fingerprint") != _fingerprint(config)
+        or not isinstance(schema.get("initialize"), dict)
+        or not isinstance(schema.get("tools"), list)
+    ):
+        return None
+
+    return cast(MCPSchema, schema)
+
+
+def save_schema(
+    name: str,
+    config: MCPServerConfig,
+    initialize_result: dict[str, Any],
+    tools: list[dict[str, Any]],
+) -> None:
+    schema: MCPSchema = {
+        "fingerprint": _fingerprint(config),
+        "initialize": initialize_result,
+        "tools": tools,
+    }
+
+    try:
+        MCP_SCHEMA_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        (MCP_SCHEMA_CACHE_DIR / f"{name}.json").write_text(json.dumps(schema))
+    except OSError as error:
+        # Only costs the next start its head start
+        log_json(
+            {"event": "mcp_schema_save_failed", "server": name, "error": str(error)}
+        )
@@ -2,8 +2,9 @@ from typing import Any, Callable
 
 
 class MCPServerStatus:
-    # After the first query is sent, claude agent sdk sends back an init payload which
-    # with various statuses. In it, we can see mcp connection success or failure.
+    # MCPManager reports its servers as they start, fail or are restarted. For
+    # anything else, the init payload the claude agent sdk sends back after the
+    # first query carries the mcp connection success or failure.
     _mcp_servers: list[dict[str, Any]] = []
 
     # Register component callbacks that need access to the status
@@ -16,6 +17,21 @@ class MCPServerStatus:
         for callback in cls._callbacks:
             callback()
 
+    @classmethod
+    def set_status(cls, server_name: str, status: str) -> None:
+        servers = [s for s in cls._mcp_servers if s.get("name") != server_name]
+        servers.append({"name": server_name, "status": status})
+
+        cls.update(servers)
+
+    @classmethod
+    def get_status(cls, server_name: str) -> str | None:
+        for server in cls._mcp_servers:
+            if server.get("name") == server_name:
+                return server.get("status")
+
+        return None
+
     @classmethod
     def is_connected(cls, server_name: str) -> bool:
         for server in cls._mcp_servers:
@@ -0,0 +1,74 @@
+import json
+import re
+from typing import Any
+
+# Answers to the permission prompt, besides a question for the agent
+ALLOW_RESPONSES = ("y", "yes", "allow", "")
+ALLOW_CALL_RESPONSES = ("s", "session")
+ALLOW_TOOL_RESPONSES = ("a", "always")
+DENY_RESPONSES = ("n", "no", "deny")
+
+# Numbers picking which tools of a batched prompt to allow, e.g. "1 3" or "1,3"
+SELECTION_PATTERN = re.compile(r"\d+(?:[\s,]+\d+)*")
+
+
+def is_approval(response: str) -> bool:
+    return response in (*ALLOW_RESPONSES, *ALLOW_CALL_RESPONSES, *ALLOW_TOOL_RESPONSES)
+
+
+def parse_selection(response: str, batch_size: int) -> set[int] | None:
+    """The 1-based positions picked from a batch of `batch_size` tools.
+
+    None unless the prompt listed several tools and every number in `response`
+    is one of them, so e.g. "42" is sent to the agent as a message instead.
+    """
+    if batch_size < 2 or not SELECTION_PATTERN.fullmatch(response):
+        return None
+
+    selection = {int(number) for number in re.findall(r"\d+", response)}
+
+    if not all(1 <= position <= batch_size for position in selection):
+        return None
+
+    return selection
+
+
+class PermissionCache:
+    """Tool permissions granted for the rest of the session.
+
+    A tool is either allowed outright, or only for the exact input it was
+    approved with (compared with keys sorted, so order does not matter).
+    """
+
+    def __init__(self) -> None:
+        self._tools: set[str] = set()
+        self._calls: set[tuple[str, str]] = set()
+        self.hits = 0
+
+    def allow_tool(self, tool_name: str) -> None:
+        self._tools.add(tool_name)
+
+    def allow_call(self, tool_name: str, tool_input: dict[str, Any]) -> None:
+        self._calls.add((tool_name, _normalize(tool_input)))
+
+    def is_allowed(self, tool_name: str, tool_input: dict[str, Any]) -> bool:
+        allowed = (
+            tool_name in self._tools
+            or (tool_name, _normalize(tool_input)) in self._calls
+        )
+
+        if allowed:
+            self.hits += 1
+
+        return allowed
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "hits": self.hits,
+            "tools": len(self._tools),
+            "calls": len(self._calls),
+        }
+
+
+def _normalize(tool_input: dict[str, Any]) -> str:
+    return json.dumps(tool_input, sort_keys=True, separators=(",", ":"), default=str)
@@ -0,0 +1,94 @@
+import fnmatch
+import json
+import re
+from dataclasses import dataclass
+from typing import Any
+
+from agent_chat_cli.utils.config import PermissionRule, PermissionsConfig
+from agent_chat_cli.utils.enums import PermissionAction
+
+MCP_TOOL_PREFIX = "mcp__"
+
+
+@dataclass(frozen=True)
+class PermissionDecision:
+    action: PermissionAction
+
+    # Index of the rule that matched, or None when the default applied
+    rule: int | None = None
+
+
+@dataclass(frozen=True)
+class _CompiledRule:
+    action: PermissionAction
+    server: re.Pattern[str] | None
+    tool: re.Pattern[str]
+    input: tuple[tuple[str, re.Pattern[str]], ...]
+
+    @classmethod
+    def compile(cls, rule: PermissionRule) -> "_CompiledRule":
+        return cls(
+            action=rule.action,
+            server=_glob(rule.server) if rule.server is not None else None,
+            tool=_glob(rule.tool),
+            input=tuple(
+                (field, re.compile(pattern)) for field, pattern in rule.input.items()
+            ),
+        )
+
+    def matches(
+        self, server: str | None, tool: str, tool_input: dict[str, Any]
+    ) -> bool:
+        if self.server is not None:
+            if server is None or not self.server.match(server):
+                return False
+
+        if not self.tool.match(tool):
+            return False
+
+        for field, pattern in self.input:
+            if field not in tool_input:
+                return False
+
+            if not pattern.search(_as_text(tool_input[field])):
+                return False
+
+        return True
+
+
+class PermissionPolicy:
+    """The `permissions` rules, compiled once and checked before any prompt."""
+
+    def __init__(self, config: PermissionsConfig) -> None:
+        self.default = config.default
+        self._rules = [_CompiledRule.compile(rule) for rule in config.rules]
+
+    def evaluate(
+        self, tool_name: str, tool_input: dict[str, Any]
+    ) -> PermissionDecision:
+        server, tool = split_tool_name(tool_name)
+
+        for index, rule in enumerate(self._rules):
+            if rule.matches(server, tool, tool_input):
+                return PermissionDecision(rule.action, index)
+
+        return PermissionDecision(self.default)
+
+
+def split_tool_name(tool_name: str) -> tuple[str | None, str]:
+    """Split `mcp__<server>__<tool>` into its parts; built-in tools have no server."""
+    if tool_name.startswith(MCP_TOOL_PREFIX):
+        server, separator, tool = tool_name[len(MCP_TOOL_PREFIX) :].partition("__")
+
+        if separator:
+            return server, tool
+
+    return None, tool_name
+
+
+def _glob(pattern: str) -> re.Pattern[str]:
+    return re.compile(fnmatch.translate(pattern))
+
+
+def _as_text(value: Any) -> str:
+    return value if isinstance(value, str) else json.dumps(value)
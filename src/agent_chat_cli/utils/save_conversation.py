@@ -1,34 +1,27 @@
 from datetime import datetime
 from pathlib import Path
-from textual.widgets import Markdown
 
-from agent_chat_cli.components.messages import (
-    SystemMessage,
-    UserMessage,
-    AgentMessage,
-    ToolMessage,
-)
-from agent_chat_cli.components.chat_history import ChatHistory
+from agent_chat_cli.core.conversation_store import ConversationStore
+from agent_chat_cli.utils.enums import RoleType
 
 CONVERSATION_OUTPUT_DIR = Path.home() / ".claude" / "agent-chat-cli"
 
 
-def save_conversation(chat_history: ChatHistory) -> str:
+def save_conversation(conversation: ConversationStore) -> str:
     messages = []
 
-    for widget in chat_history.children:
-        match widget:
-            case SystemMessage():
-                messages.append(f"# System\n\n{widget.message}\n")
-            case UserMessage():
-                messages.append(f"# You\n\n{widget.message}\n")
-            case AgentMessage():
-                markdown_widget = widget.query_one(Markdown)
-                messages.append(f"# Agent\n\n{markdown_widget.source}\n")
-            case ToolMessage():
-                tool_input_str = str(widget.tool_input)
+    for message in conversation.messages:
+        match message.type:
+            case RoleType.SYSTEM:
+                messages.append(f"# System\n\n{message.content}\n")
+            case RoleType.USER:
+                messages.append(f"# You\n\n{message.content}\n")
+            case RoleType.AGENT:
+                messages.append(f"# Agent\n\n{message.content}\n")
+            case RoleType.TOOL:
+                tool_name = (message.metadata or {}).get("tool_name", "")
                 messages.append(
-                    f"# Tool: {widget.tool_name}\n\n```json\n{tool_input_str}\n```\n"
+                    f"# Tool: {tool_name}\n\n```json\n{message.content}\n```\n"
                 )
 
     content = "\n---\n\n".join(messages)
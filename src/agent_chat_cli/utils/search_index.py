@@ -0,0 +1,197 @@
+import hashlib
+import sqlite3
+import sys
+from collections.abc import Iterator
+from contextlib import closing, contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+from agent_chat_cli.utils import journal
+from agent_chat_cli.utils import save_conversation
+from agent_chat_cli.utils.enums import RoleType
+
+SEARCH_INDEX_PATH = Path.home() / ".claude" / "agent-chat-cli" / "search.db"
+
+# Wrapped around matched terms in `SearchHit.snippet`, for callers to style
+MATCH_START = "\x02"
+MATCH_END = "\x03"
+
+# Section headings written by `save_conversation`
+MARKDOWN_ROLES = {
+    "# You": RoleType.USER,
+    "# Agent": RoleType.AGENT,
+    "# System": RoleType.SYSTEM,
+    "# Tool": RoleType.TOOL,
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    digest TEXT NOT NULL
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS messages USING fts5(
+    path UNINDEXED,
+    role UNINDEXED,
+    content,
+    tokenize = 'porter unicode61'
+);
+"""
+
+
+@dataclass(frozen=True)
+class SearchHit:
+    path: str
+    role: str
+    snippet: str
+    rank: float
+
+
+@dataclass
+class IndexUpdate:
+    indexed: int = 0
+    unchanged: int = 0
+    removed: int = 0
+
+
+class SearchIndex:
+    """SQLite FTS5 index over saved conversations and session journals.
+
+    Files are only re-read when their mtime or size changed, and only
+    re-indexed when their content hash did too. Every call opens its own
+    connection, so updates can run in a worker thread while searching.
+    """
+
+    def __init__(self, path: Path | None = None) -> None:
+        self.path = path or SEARCH_INDEX_PATH
+
+    def update(self) -> IndexUpdate:
+        result = IndexUpdate()
+        sources = {str(path): path for path in _conversation_files()}
+
+        with self._connect() as db:
+            known = {
+                row[0]: row[1:]
+                for row in db.execute("SELECT path, mtime_ns, size, digest FROM files")
+            }
+
+            for name in known.keys() - sources.keys():
+                self._forget(db, name)
+                result.removed += 1
+
+            for name, path in sources.items():
+                try:
+                    stat = path.stat()
+                    previous = known.get(name)
+
+                    if previous is not None and previous[:2] == (
+                        stat.st_mtime_ns,
+                        stat.st_size,
+                    ):
+                        result.unchanged += 1
+                        continue
+
+                    data = path.read_bytes()
+                except OSError:
+                    continue
+
+                digest = hashlib.sha256(data).hexdigest()
+
+                if previous is None or previous[2] != digest:
+                    if previous is not None:
+                        self._forget(db, name)
+
+                    db.executemany(
+                        "INSERT INTO messages (path, role, content) VALUES (?, ?, ?)",
+                        (
+                            (name, role.value, content)
+                            for role, content in _read_messages(path, data)
+                        ),
+                    )
+                    result.indexed += 1
+                else:
+                    result.unchanged += 1
+
+                db.execute(
+                    "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?)",
+                    (name, stat.st_mtime_ns, stat.st_size, digest),
+                )
+
+        return result
+
+    def search(self, query: str, limit: int = 20) -> list[SearchHit]:
+        match = _match_expression(query)
+
+        if not match:
+            return []
+
+        with self._connect() as db:
+            rows = db.execute(
+                "SELECT path, role, "
+                "snippet(messages, 2, ?, ?, '…', 12), bm25(messages) AS rank "
+                "FROM messages WHERE messages MATCH ? ORDER BY rank LIMIT ?",
+                (MATCH_START, MATCH_END, match, limit),
+            ).fetchall()
+
+        return [SearchHit(*row) for row in rows]
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        with closing(sqlite3.connect(self.path)) as db:
+            # Readers are not blocked while the background update writes
+            db.execute("PRAGMA journal_mode = WAL")
+            db.executescript(SCHEMA)
+
+            with db:
+                yield db
+
+    def _forget(self, db: sqlite3.Connection, name: str) -> None:
+        db.execute("DELETE FROM messages WHERE path = ?", (name,))
+        db.execute("DELETE FROM files WHERE path = ?", (name,))
+
+
+def _conversation_files() -> list[Path]:
+    return [
+        *save_conversation.CONVERSATION_OUTPUT_DIR.glob("convo-*.md"),
+        *journal.JOURNAL_DIR.glob("session-*.jsonl"),
+    ]
+
+
+def _read_messages(path: Path, data: bytes) -> list[tuple[RoleType, str]]:
+    if path.suffix == ".jsonl":
+        snapshot = journal.read_journal(path)
+        return [(message.type, message.content) for message in snapshot.messages]
+
+    messages = []
+
+    for section in data.decode("utf-8", errors="replace").split("\n---\n\n"):
+        heading, _, content = section.partition("\n\n")
+        role = MARKDOWN_ROLES.get(heading.split(":")[0].strip(), RoleType.SYSTEM)
+        messages.append((role, content.strip()))
+
+    return messages
+
+
+def _match_expression(query: str) -> str:
+    # Each word is quoted, so FTS5 operators and punctuation are taken literally
+    return " ".join('"' + term.replace('"', '""') + '"' for term in query.split())
+
+
+def main(query: str, limit: int = 20) -> None:
+    index = SearchIndex()
+    index.update()
+    hits = index.search(query, limit)
+
+    if not hits:
+        print(f"No matches for {query!r}", file=sys.stderr)
+        raise SystemExit(1)
+
+    bold, reset = ("\033[1m", "\033[0m") if sys.stdout.isatty() else ("", "")
+
+    for hit in hits:
+        snippet = " ".join(hit.snippet.split())
+        print(f"{hit.path} ({hit.role})")
+        print(f"  {snippet.replace(MATCH_START, bold).replace(MATCH_END, reset)}")
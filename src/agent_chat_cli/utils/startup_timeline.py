@@ -0,0 +1,88 @@
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from agent_chat_cli.utils.enums import TimelineStatus
+from agent_chat_cli.utils.logger import log_json
+
+
+@dataclass(slots=True)
+class TimelineEntry:
+    name: str
+    started_ms: float
+    duration_ms: float | None = None
+    status: TimelineStatus = TimelineStatus.RUNNING
+    phases: dict[str, float] = field(default_factory=dict)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "started_ms": round(self.started_ms, 1),
+            "duration_ms": (
+                round(self.duration_ms, 1) if self.duration_ms is not None else None
+            ),
+            "status": self.status.value,
+            "phases": {name: round(ms, 1) for name, ms in self.phases.items()},
+        }
+
+
+class StartupTimeline:
+    # Milestones of the cold start (config parse, each MCP server, client
+    # connect), with times in ms relative to when the app was launched
+    _origin = time.perf_counter()
+    _entries: dict[str, TimelineEntry] = {}
+
+    # Register component callbacks that need access to the timeline
+    _callbacks: list[Callable[[], None]] = []
+
+    @classmethod
+    def begin(cls, name: str) -> None:
+        if name in cls._entries:
+            return
+
+        cls._entries[name] = TimelineEntry(name=name, started_ms=cls._now())
+        cls._notify()
+
+    @classmethod
+    def end(
+        cls,
+        name: str,
+        status: TimelineStatus = TimelineStatus.OK,
+        phases: dict[str, float] | None = None,
+    ) -> None:
+        entry = cls._entries.get(name)
+        if entry is None:
+            return
+
+        entry.duration_ms = cls._now() - entry.started_ms
+        entry.status = status
+        entry.phases.update(phases or {})
+
+        log_json({"event": "startup_timeline", **entry.as_dict()})
+        cls._notify()
+
+    @classmethod
+    def entries(cls) -> list[TimelineEntry]:
+        return list(cls._entries.values())
+
+    @classmethod
+    def as_dicts(cls) -> list[dict[str, Any]]:
+        return [entry.as_dict() for entry in cls._entries.values()]
+
+    @classmethod
+    def subscribe(cls, callback: Callable[[], None]) -> None:
+        cls._callbacks.append(callback)
+
+    @classmethod
+    def unsubscribe(cls, callback: Callable[[], None]) -> None:
+        if callback in cls._callbacks:
+            cls._callbacks.remove(callback)
+
+    @classmethod
+    def _now(cls) -> float:
+        return (time.perf_counter() - cls._origin) * 1000
+
+    @classmethod
+    def _notify(cls) -> None:
+        for callback in cls._callbacks:
+            callback()
@@ -0,0 +1,266 @@
+import asyncio
+import atexit
+import json
+import os
+import time
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from itertools import count
+from pathlib import Path
+from typing import Any
+
+from agent_chat_cli.utils.logger import log_json
+
+# Finished spans kept in memory until export; the oldest are dropped past this
+TRACE_BUFFER_SIZE = 20_000
+
+
+@dataclass(slots=True)
+class Span:
+    name: str
+    category: str
+    span_id: int
+    parent_id: int | None
+    started_us: float
+    ended_us: float | None = None
+    attributes: dict[str, Any] = field(default_factory=dict)
+
+    # False for the stand-in handed out while tracing is off
+    recording: bool = True
+
+    @property
+    def duration_us(self) -> float | None:
+        if self.ended_us is None:
+            return None
+
+        return self.ended_us - self.started_us
+
+    def set(self, **attributes: Any) -> None:
+        if self.recording:
+            self.attributes.update(attributes)
+
+    def end(self, **attributes: Any) -> None:
+        if not self.recording or self.ended_us is not None:
+            return
+
+        self.attributes.update(attributes)
+        self.ended_us = Tracer._now_us()
+        Tracer._record(self)
+
+
+_NOOP_SPAN = Span(
+    name="", category="", span_id=0, parent_id=None, started_us=0.0, recording=False
+)
+
+
+class Tracer:
+    # In-process span collector, off unless `trace_file` is configured. The
+    # current span follows asyncio tasks through a ContextVar, so spans started
+    # in a task created inside another span become its children
+    _enabled = False
+    _path: Path | None = None
+    _origin = time.perf_counter()
+    _ids = count(1)
+    _spans: deque[Span] = deque(maxlen=TRACE_BUFFER_SIZE)
+    _dropped = 0
+    _current: ContextVar[Span | None] = ContextVar("current_span", default=None)
+
+    @classmethod
+    def enable(
+        cls, path: Path | None = None, buffer_size: int = TRACE_BUFFER_SIZE
+    ) -> None:
+        """Start collecting spans, written to `path` (if given) at exit."""
+        cls._enabled = True
+        cls._path = path
+        cls._spans = deque(maxlen=buffer_size)
+        cls._dropped = 0
+
+        if path is not None:
+            atexit.unregister(cls.export)
+            atexit.register(cls.export)
+
+    @classmethod
+    def disable(cls) -> None:
+        atexit.unregister(cls.export)
+
+        cls._enabled = False
+        cls._path = None
+        cls._spans = deque(maxlen=TRACE_BUFFER_SIZE)
+        cls._dropped = 0
+
+    @classmethod
+    def enabled(cls) -> bool:
+        return cls._enabled
+
+    @classmethod
+    def start(
+        cls, name: str, category: str, parent: Span | None = None, **attributes: Any
+    ) -> Span:
+        """Open a span that is ended explicitly, e.g. across messages.
+
+        It is a child of `parent`, or else of the current span, but does not
+        become the current span itself.
+        """
+        if not cls._enabled:
+            return _NOOP_SPAN
+
+        parent = parent or cls._current.get()
+
+        return Span(
+            name=name,
+            category=category,
+            span_id=next(cls._ids),
+            parent_id=parent.span_id if parent and parent.recording else None,
+            started_us=cls._now_us(),
+            attributes=attributes,
+        )
+
+    @classmethod
+    @contextmanager
+    def span(
+        cls, name: str, category: str, parent: Span | None = None, **attributes: Any
+    ) -> Iterator[Span]:
+        """Time the block as a span that is current while it runs."""
+        if not cls._enabled:
+            yield _NOOP_SPAN
+            return
+
+        span = cls.start(name, category, parent, **attributes)
+        token = cls._current.set(span)
+
+        try:
+            yield span
+        except asyncio.CancelledError:
+            span.set(cancelled=True)
+            raise
+        except Exception as error:
+            span.set(error=repr(error))
+            raise
+        finally:
+            cls._current.reset(token)
+            span.end()
+
+    @classmethod
+    def spans(cls) -> list[Span]:
+        return list(cls._spans)
+
+    @classmethod
+    def chrome_trace(cls) -> dict[str, Any]:
+        """Finished spans as Chrome trace events (Perfetto, chrome://tracing)."""
+        pid = os.getpid()
+        # Outer spans first when they start together, so children nest in them
+        spans = sorted(
+            cls._spans, key=lambda span: (span.started_us, -(span.duration_us or 0))
+        )
+        lanes = _assign_lanes(spans)
+
+        events: list[dict[str, Any]] = [
+            {
+                "name": "process_name",
+                "ph": "M",
+                "pid": pid,
+                "args": {"name": "agent-chat-cli"},
+            }
+        ]
+
+        for lane in sorted(set(lanes.values())):
+            events.append(
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": pid,
+                    "tid": lane,
+                    "args": {"name": f"lane {lane}"},
+                }
+            )
+
+        for span in spans:
+            events.append(
+                {
+                    "name": span.name,
+                    "cat": span.category,
+                    "ph": "X",
+                    "ts": round(span.started_us, 1),
+                    "dur": round(span.duration_us or 0.0, 1),
+                    "pid": pid,
+                    "tid": lanes[span.span_id],
+                    "args": {
+                        "span_id": span.span_id,
+                        "parent_id": span.parent_id,
+                        **span.attributes,
+                    },
+                }
+            )
+
+        return {
+            "traceEvents": events,
+            "displayTimeUnit": "ms",
+            "otherData": {"dropped_spans": cls._dropped},
+        }
+
+    @classmethod
+    def export(cls, path: Path | None = None) -> None:
+        path = path or cls._path
+
+        if path is None or not cls._enabled:
+            return
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(cls.chrome_trace(), default=str))
+
+        log_json(
+            {
+                "event": "trace_exported",
+                "path": str(path),
+                "spans": len(cls._spans),
+                "dropped": cls._dropped,
+            }
+        )
+
+    @classmethod
+    def _record(cls, span: Span) -> None:
+        if not cls._enabled:
+            return
+
+        if len(cls._spans) == cls._spans.maxlen:
+            cls._dropped += 1
+
+        cls._spans.append(span)
+
+    @classmethod
+    def _now_us(cls) -> float:
+        return (time.perf_counter() - cls._origin) * 1_000_000
+
+
+def _assign_lanes(spans: list[Span]) -> dict[int, int]:
+    # Trace viewers draw one row per thread and expect the spans on a row to
+    # nest. A span goes on its parent's row when it fits inside what is open
+    # there, and otherwise (concurrent tool calls, the renderer) on a free row
+    lanes: list[list[float]] = []
+    assigned: dict[int, int] = {}
+
+    for span in spans:
+        end = span.ended_us or span.started_us
+
+        for open_ends in lanes:
+            while open_ends and open_ends[-1] <= span.started_us:
+                open_ends.pop()
+
+        lane = assigned.get(span.parent_id) if span.parent_id else None
+
+        if lane is None or not lanes[lane - 1] or lanes[lane - 1][-1] < end:
+            lane = next(
+                (index for index, ends in enumerate(lanes, start=1) if not ends), None
+            )
+
+        if lane is None:
+            lanes.append([])
+            lane = len(lanes)
+
+        lanes[lane - 1].append(end)
+        assigned[span.span_id] = lane
+
+    return assigned
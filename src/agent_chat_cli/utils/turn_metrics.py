@@ -0,0 +1,222 @@
+import math
+import time
+from collections import deque
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+# Turns kept for /stats; older ones fall out of the percentiles
+METRICS_HISTORY = 200
+
+
+@dataclass
+class TurnMetrics:
+    """Where the time went in one query, from `query()` to its result."""
+
+    started: float = field(default_factory=time.perf_counter)
+    first_chunk_at: float | None = None
+    last_chunk_at: float | None = None
+    finished_at: float | None = None
+
+    chunks: int = 0
+    gaps_ms: list[float] = field(default_factory=list)
+
+    # Spent with a permission prompt on screen, waiting for the user
+    permission_wait_ms: float = 0.0
+    interrupted: bool = False
+
+    # Reported by the SDK's ResultMessage
+    input_tokens: int | None = None
+    output_tokens: int | None = None
+    cost_usd: float | None = None
+    api_ms: float | None = None
+    num_turns: int | None = None
+
+    def chunk(self) -> None:
+        now = time.perf_counter()
+
+        if self.last_chunk_at is None:
+            self.first_chunk_at = now
+        else:
+            self.gaps_ms.append((now - self.last_chunk_at) * 1000)
+
+        self.last_chunk_at = now
+        self.chunks += 1
+
+    def record_result(
+        self,
+        usage: dict[str, Any] | None,
+        cost_usd: float | None,
+        api_ms: float | None,
+        num_turns: int | None,
+    ) -> None:
+        usage = usage or {}
+
+        self.input_tokens = usage.get("input_tokens")
+        self.output_tokens = usage.get("output_tokens")
+        self.cost_usd = cost_usd
+        self.api_ms = api_ms
+        self.num_turns = num_turns
+
+    def finish(self, interrupted: bool = False) -> None:
+        self.finished_at = time.perf_counter()
+        self.interrupted = interrupted
+
+    @property
+    def ttft_ms(self) -> float | None:
+        if self.first_chunk_at is None:
+            return None
+
+        return (self.first_chunk_at - self.started) * 1000
+
+    @property
+    def stream_ms(self) -> float | None:
+        if self.first_chunk_at is None or self.last_chunk_at is None:
+            return None
+
+        return (self.last_chunk_at - self.first_chunk_at) * 1000
+
+    @property
+    def total_ms(self) -> float | None:
+        if self.finished_at is None:
+            return None
+
+        return (self.finished_at - self.started) * 1000
+
+    @property
+    def tokens_per_second(self) -> float | None:
+        # API time leaves out tool runs and permission prompts mid-turn
+        duration_ms = self.api_ms or self.stream_ms
+
+        if not self.output_tokens or not duration_ms:
+            return None
+
+        return self.output_tokens / (duration_ms / 1000)
+
+    def summary(self) -> str:
+        parts = []
+
+        if self.ttft_ms is not None:
+            parts.append(f"{format_ms(self.ttft_ms)} to first token")
+
+        if self.total_ms is not None:
+            parts.append(f"{format_ms(self.total_ms)} total")
+
+        if self.tokens_per_second is not None:
+            parts.append(f"{self.tokens_per_second:.0f} tok/s")
+
+        if self.permission_wait_ms:
+            parts.append(f"{format_ms(self.permission_wait_ms)} awaiting permission")
+
+        if self.cost_usd is not None:
+            parts.append(f"${self.cost_usd:.4f}")
+
+        if self.interrupted:
+            parts.append("interrupted")
+
+        return " · ".join(parts)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "ttft_ms": _round(self.ttft_ms),
+            "stream_ms": _round(self.stream_ms),
+            "total_ms": _round(self.total_ms),
+            "chunks": self.chunks,
+            "max_gap_ms": _round(max(self.gaps_ms, default=None)),
+            "tokens_per_second": _round(self.tokens_per_second),
+            "permission_wait_ms": _round(self.permission_wait_ms),
+            "input_tokens": self.input_tokens,
+            "output_tokens": self.output_tokens,
+            "cost_usd": self.cost_usd,
+            "num_turns": self.num_turns,
+            "interrupted": self.interrupted,
+        }
+
+
+class SessionMetrics:
+    """The last METRICS_HISTORY turns, summarized as p50 / p95 by /stats."""
+
+    def __init__(self, history: int = METRICS_HISTORY) -> None:
+        self.turns: deque[TurnMetrics] = deque(maxlen=history)
+        self.total_turns = 0
+        self.total_cost_usd = 0.0
+        self.total_output_tokens = 0
+
+    def add(self, turn: TurnMetrics) -> None:
+        self.turns.append(turn)
+
+        # Totals cover the whole session, not just the turns still kept
+        self.total_turns += 1
+        self.total_cost_usd += turn.cost_usd or 0.0
+        self.total_output_tokens += turn.output_tokens or 0
+
+    def percentiles(self) -> dict[str, tuple[float, float]]:
+        """p50 and p95 of each measurement, leaving out turns without it."""
+        series = {
+            "time to first token": [turn.ttft_ms for turn in self.turns],
+            "gap between chunks": [gap for turn in self.turns for gap in turn.gaps_ms],
+            "stream duration": [turn.stream_ms for turn in self.turns],
+            "turn duration": [turn.total_ms for turn in self.turns],
+            "awaiting permission": [
+                turn.permission_wait_ms
+                for turn in self.turns
+                if turn.permission_wait_ms
+            ],
+        }
+
+        result = {
+            name: (percentile(values, 50), percentile(values, 95))
+            for name, values in series.items()
+            if any(value is not None for value in values)
+        }
+
+        # A rate rather than a duration, so `report` formats it apart
+        throughput = [turn.tokens_per_second for turn in self.turns]
+
+        if any(value is not None for value in throughput):
+            result["output tokens/s"] = (
+                percentile(throughput, 50),
+                percentile(throughput, 95),
+            )
+
+        return result
+
+    def report(self) -> str:
+        if not self.turns:
+            return "No turns yet"
+
+        lines = [
+            f"Last {len(self.turns)} of {self.total_turns} turns "
+            f"(${self.total_cost_usd:.4f}, {self.total_output_tokens} output tokens):"
+        ]
+
+        for name, (p50, p95) in self.percentiles().items():
+            if name == "output tokens/s":
+                lines.append(f"  {name}: p50 {p50:.0f}, p95 {p95:.0f}")
+            else:
+                lines.append(f"  {name}: p50 {format_ms(p50)}, p95 {format_ms(p95)}")
+
+        return "\n".join(lines)
+
+
+def percentile(values: Iterable[float | None], q: float) -> float:
+    """Nearest-rank percentile of the values that are not None."""
+    ordered = sorted(value for value in values if value is not None)
+
+    if not ordered:
+        return math.nan
+
+    rank = math.ceil(q / 100 * len(ordered))
+    return ordered[max(rank, 1) - 1]
+
+
+def format_ms(ms: float) -> str:
+    """A duration as e.g. "850ms" or "1.2s"."""
+    if ms < 1000:
+        return f"{ms:.0f}ms"
+
+    return f"{ms / 1000:.1f}s"
+
+
+def _round(value: float | None) -> float | None:
+    return None if value is None else round(value, 1)
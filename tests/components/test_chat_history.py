@@ -1,7 +1,9 @@
 import pytest
 from textual.app import App, ComposeResult
+from textual.containers import VerticalScroll
 
 from agent_chat_cli.components.chat_history import ChatHistory
+from agent_chat_cli.core.conversation_store import ConversationStore
 from agent_chat_cli.components.messages import (
     Message,
     RoleType,
@@ -17,6 +19,27 @@ class ChatHistoryApp(App):
         yield ChatHistory()
 
 
+class ScrollingChatHistoryApp(App):
+    CSS = """
+    ChatHistory, UserMessage {
+        height: auto;
+    }
+
+    UserMessage {
+        margin-bottom: 1;
+    }
+    """
+
+    def compose(self) -> ComposeResult:
+        with VerticalScroll():
+            yield ChatHistory()
+
+
+def fill(chat_history: ChatHistory, count: int) -> None:
+    for index in range(count):
+        chat_history.store.add(Message(type=RoleType.USER, content=f"Message {index}"))
+
+
 class TestChatHistoryAddMessage:
     @pytest.fixture
     def app(self):
@@ -90,3 +113,98 @@ class TestChatHistoryAddMessage:
             chat_history.add_message(Message(type=RoleType.USER, content="Third"))
 
             assert len(chat_history.children) == 3
+
+
+class TestChatHistoryVirtualization:
+    async def test_only_mounts_messages_near_viewport(self):
+        app = ScrollingChatHistoryApp()
+        async with app.run_test(size=(80, 24)) as pilot:
+            chat_history = app.query_one(ChatHistory)
+            scroller = app.query_one(VerticalScroll)
+
+            fill(chat_history, 200)
+            await pilot.pause()
+            scroller.scroll_end(animate=False, immediate=True)
+            await pilot.pause()
+            await pilot.pause()
+
+            mounted = chat_history.query(UserMessage)
+            assert len(chat_history.messages) == 200
+            assert 0 < len(mounted) < 2 * ChatHistory.OVERSCAN + 24
+            assert mounted.last().message == "Message 199"
+
+    async def test_remounts_messages_when_scrolling_up(self):
+        app = ScrollingChatHistoryApp()
+        async with app.run_test(size=(80, 24)) as pilot:
+            chat_history = app.query_one(ChatHistory)
+            scroller = app.query_one(VerticalScroll)
+
+            fill(chat_history, 200)
+            await pilot.pause()
+            scroller.scroll_end(animate=False, immediate=True)
+            await pilot.pause()
+            await pilot.pause()
+
+            scroller.scroll_home(animate=False, immediate=True)
+            await pilot.pause()
+            await pilot.pause()
+
+            mounted = chat_history.query(UserMessage)
+            assert mounted.first().message == "Message 0"
+            assert len(mounted) < 2 * ChatHistory.OVERSCAN + 24
+
+    async def test_reserves_height_for_unmounted_messages(self):
+        app = ScrollingChatHistoryApp()
+        async with app.run_test(size=(80, 24)) as pilot:
+            chat_history = app.query_one(ChatHistory)
+            scroller = app.query_one(VerticalScroll)
+
+            fill(chat_history, 200)
+            await pilot.pause()
+            scroller.scroll_end(animate=False, immediate=True)
+            await pilot.pause()
+            await pilot.pause()
+
+            assert chat_history.styles.padding.top > 0
+            assert scroller.max_scroll_y > 200
+
+
+class TestChatHistoryStore:
+    async def test_renders_appended_text(self):
+        app = ChatHistoryApp()
+        async with app.run_test() as pilot:
+            chat_history = app.query_one(ChatHistory)
+
+            index = chat_history.store.add(
+                Message(type=RoleType.AGENT, content="Hello")
+            )
+            await pilot.pause()
+            chat_history.store.append(index, " world")
+            await pilot.pause()
+
+            assert chat_history.query_one(AgentMessage).source == "Hello world"
+
+    async def test_renders_messages_already_in_store(self):
+        store = ConversationStore()
+        store.add(Message(type=RoleType.USER, content="Earlier"))
+
+        class PrefilledApp(App):
+            def compose(self) -> ComposeResult:
+                yield ChatHistory(store=store)
+
+        app = PrefilledApp()
+        async with app.run_test():
+            widgets = app.query_one(ChatHistory).query(UserMessage)
+
+            assert widgets.first().message == "Earlier"
+
+    async def test_clear_removes_widgets(self):
+        app = ChatHistoryApp()
+        async with app.run_test() as pilot:
+            chat_history = app.query_one(ChatHistory)
+
+            fill(chat_history, 3)
+            chat_history.store.clear()
+            await pilot.pause()
+
+            assert len(chat_history.children) == 0
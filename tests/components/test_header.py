@@ -5,7 +5,10 @@ from textual.app import App, ComposeResult
 from textual.widgets import Label
 
 from agent_chat_cli.components.header import Header
+from agent_chat_cli.utils.config import ConfigChange
+from agent_chat_cli.utils.enums import TimelineStatus
 from agent_chat_cli.utils.mcp_server_status import MCPServerStatus
+from agent_chat_cli.utils.startup_timeline import StartupTimeline
 
 
 @pytest.fixture(autouse=True)
@@ -58,3 +61,47 @@ class TestHeaderMCPServerStatus:
 
             assert "filesystem" in rendered
             assert "github" in rendered
+
+    async def test_lists_servers_added_to_the_config(self, mock_config):
+        app = HeaderApp()
+        async with app.run_test():
+            config = MagicMock(mcp_servers={"filesystem": None, "slack": None})
+            header = app.query_one(Header)
+            header._handle_config_change(
+                ConfigChange(MagicMock(), config, frozenset({"mcp_servers"}))
+            )
+
+            rendered = str(app.query_one("#header-mcp-servers", Label).render())
+
+            assert "slack" in rendered
+            assert "github" not in rendered
+
+
+class TestHeaderStartupTimeline:
+    @pytest.fixture(autouse=True)
+    def reset_timeline(self):
+        StartupTimeline._entries = {}
+        StartupTimeline._callbacks = []
+        yield
+        StartupTimeline._entries = {}
+        StartupTimeline._callbacks = []
+
+    async def test_shows_each_startup_step(self, mock_config):
+        app = HeaderApp()
+        async with app.run_test():
+            StartupTimeline.begin("config")
+            StartupTimeline.end("config")
+            StartupTimeline.begin("github")
+            StartupTimeline.end("github", TimelineStatus.TIMEOUT)
+
+            rendered = str(app.query_one("#header-startup", Label).render())
+
+            assert "config" in rendered
+            assert "github timeout" in rendered
+
+    async def test_unsubscribes_on_unmount(self, mock_config):
+        app = HeaderApp()
+        async with app.run_test():
+            assert len(StartupTimeline._callbacks) == 1
+
+        assert StartupTimeline._callbacks == []
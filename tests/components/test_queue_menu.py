@@ -0,0 +1,50 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from textual.app import App, ComposeResult
+from textual.widgets import OptionList
+
+from agent_chat_cli.components.queue_menu import QueueMenu
+
+
+class QueueMenuApp(App):
+    def __init__(self):
+        super().__init__()
+        self.mock_actions = MagicMock()
+        self.mock_actions.cancel_queued_prompt = AsyncMock()
+
+    def compose(self) -> ComposeResult:
+        yield QueueMenu(actions=self.mock_actions)
+
+
+class TestQueueMenu:
+    @pytest.fixture
+    def app(self):
+        return QueueMenuApp()
+
+    async def test_hidden_by_default(self, app):
+        async with app.run_test():
+            assert app.query_one(QueueMenu).is_visible is False
+
+    async def test_lists_queued_prompts(self, app):
+        async with app.run_test():
+            menu = app.query_one(QueueMenu)
+            menu.show(["first", "second\nline", "x" * 100])
+
+            option_list = menu.query_one(OptionList)
+
+            assert menu.is_visible is True
+            assert option_list.option_count == 3
+            assert str(option_list.get_option_at_index(1).prompt) == "2. second line"
+            assert str(option_list.get_option_at_index(2).prompt).endswith("…")
+
+    async def test_selecting_cancels_the_prompt(self, app):
+        async with app.run_test() as pilot:
+            menu = app.query_one(QueueMenu)
+            menu.show(["first", "second"])
+
+            await pilot.press("down")
+            await pilot.press("enter")
+
+            app.mock_actions.cancel_queued_prompt.assert_called_once_with(1)
+            assert menu.is_visible is False
@@ -16,6 +16,10 @@ class SlashCommandMenuApp(App):
         self.mock_actions.new = AsyncMock()
         self.mock_actions.save = AsyncMock()
         self.mock_actions.show_model_menu = MagicMock()
+        self.mock_actions.show_queue_menu = AsyncMock()
+        self.mock_actions.restore = AsyncMock()
+        self.mock_actions.start_search = MagicMock()
+        self.mock_actions.show_stats = AsyncMock()
 
     def compose(self) -> ComposeResult:
         yield SlashCommandMenu(actions=self.mock_actions)
@@ -91,7 +95,7 @@ class TestSlashCommandMenuSelection:
 
             app.mock_actions.show_model_menu.assert_called_once()
 
-    async def test_exit_command_calls_quit(self, app):
+    async def test_queue_command_calls_show_queue_menu(self, app):
         async with app.run_test() as pilot:
             menu = app.query_one(SlashCommandMenu)
             menu.show()
@@ -102,6 +106,50 @@ class TestSlashCommandMenuSelection:
             await pilot.press("down")
             await pilot.press("enter")
 
+            app.mock_actions.show_queue_menu.assert_called_once()
+
+    async def test_restore_command_calls_restore(self, app):
+        async with app.run_test() as pilot:
+            menu = app.query_one(SlashCommandMenu)
+            menu.show()
+
+            for _ in range(5):
+                await pilot.press("down")
+            await pilot.press("enter")
+
+            app.mock_actions.restore.assert_called_once()
+
+    async def test_search_command_calls_start_search(self, app):
+        async with app.run_test() as pilot:
+            menu = app.query_one(SlashCommandMenu)
+            menu.show()
+
+            for _ in range(6):
+                await pilot.press("down")
+            await pilot.press("enter")
+
+            app.mock_actions.start_search.assert_called_once()
+
+    async def test_stats_command_calls_show_stats(self, app):
+        async with app.run_test() as pilot:
+            menu = app.query_one(SlashCommandMenu)
+            menu.show()
+
+            for _ in range(7):
+                await pilot.press("down")
+            await pilot.press("enter")
+
+            app.mock_actions.show_stats.assert_called_once()
+
+    async def test_exit_command_calls_quit(self, app):
+        async with app.run_test() as pilot:
+            menu = app.query_one(SlashCommandMenu)
+            menu.show()
+
+            for _ in range(8):
+                await pilot.press("down")
+            await pilot.press("enter")
+
             app.mock_actions.quit.assert_called_once()
 
     async def test_selection_hides_menu(self, app):
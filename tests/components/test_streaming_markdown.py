@@ -0,0 +1,143 @@
+from textual.app import App, ComposeResult
+from textual.widgets import Markdown
+
+from agent_chat_cli.components import streaming_markdown
+from agent_chat_cli.components.streaming_markdown import (
+    BlockSplitter,
+    StreamingMarkdown,
+    split_blocks,
+)
+
+DOCUMENT = (
+    "# Title\n\nIntro paragraph\nwrapped.\n\n- one\n\n- two\n  more\n\n"
+    "```python\nprint('hi')\n\n```\nAfter the fence\n\n~~~\n```\n~~~\n\n"
+    "1. one\n\n12. twelve\n\nEnd"
+)
+
+
+class StreamingMarkdownApp(App):
+    def __init__(self, markdown: str = ""):
+        super().__init__()
+        self.markdown = markdown
+
+    def compose(self) -> ComposeResult:
+        yield StreamingMarkdown(self.markdown)
+
+
+class TestSplitBlocks:
+    def test_keeps_single_paragraph_open(self):
+        assert split_blocks("Hello world") == ([], "Hello world")
+
+    def test_finalizes_paragraph_once_next_block_starts(self):
+        blocks, open_block = split_blocks("First para\n\nSecond")
+
+        assert blocks == ["First para\n\n"]
+        assert open_block == "Second"
+
+    def test_waits_for_next_line_after_blank(self):
+        assert split_blocks("First para\n\n") == ([], "First para\n\n")
+
+    def test_does_not_split_inside_code_fence(self):
+        text = "```python\na = 1\n\nb = 2\n"
+
+        assert split_blocks(text) == ([], text)
+
+    def test_finalizes_closed_code_fence(self):
+        blocks, open_block = split_blocks("```\ncode\n```\nAfter")
+
+        assert blocks == ["```\ncode\n```\n"]
+        assert open_block == "After"
+
+    def test_keeps_indented_continuation_in_block(self):
+        text = "- item\n\n  continued\n"
+
+        assert split_blocks(text) == ([], text)
+
+    def test_keeps_loose_list_items_together(self):
+        text = "1. one\n\n2. two"
+
+        assert split_blocks(text) == ([], text)
+
+    def test_finalizes_list_once_followed_by_paragraph(self):
+        blocks, open_block = split_blocks("- one\n\n- two\n\nAfter")
+
+        assert blocks == ["- one\n\n- two\n\n"]
+        assert open_block == "After"
+
+
+class TestBlockSplitter:
+    def test_fragments_split_like_the_whole_text(self):
+        for size in (1, 2, 3, 7, 64):
+            splitter = BlockSplitter()
+            blocks = []
+
+            for start in range(0, len(DOCUMENT), size):
+                blocks.extend(splitter.feed(DOCUMENT[start : start + size]))
+
+            assert (blocks, splitter.open_block) == split_blocks(DOCUMENT)
+
+    def test_waits_for_a_partial_list_marker(self):
+        splitter = BlockSplitter()
+        splitter.feed("1. a\n\n")
+
+        assert splitter.feed("1") == []
+        assert splitter.feed("0. b\n") == []
+        assert splitter.open_block == "1. a\n\n10. b\n"
+
+    def test_scans_each_line_of_an_open_fence_once(self, monkeypatch):
+        scanned = []
+        pattern = streaming_markdown.FENCE_PATTERN
+
+        class CountingPattern:
+            def match(self, line):
+                scanned.append(line)
+                return pattern.match(line)
+
+        monkeypatch.setattr(streaming_markdown, "FENCE_PATTERN", CountingPattern())
+
+        splitter = BlockSplitter()
+        splitter.feed("```\n")
+
+        for _ in range(500):
+            splitter.feed("x = 1")
+            splitter.feed("\n")
+
+        assert len(scanned) == 501
+        assert splitter.open_block.count("\n") == 501
+
+
+class TestStreamingMarkdown:
+    async def test_renders_initial_markdown(self):
+        app = StreamingMarkdownApp("Intro\n\nBody")
+        async with app.run_test():
+            widget = app.query_one(StreamingMarkdown)
+
+            assert widget.source == "Intro\n\nBody"
+            assert len(widget.query(Markdown)) == 2
+
+    async def test_append_accumulates_source(self):
+        app = StreamingMarkdownApp()
+        async with app.run_test():
+            widget = app.query_one(StreamingMarkdown)
+
+            for chunk in ["Hel", "lo ", "world"]:
+                await widget.append(chunk)
+
+            assert widget.source == "Hello world"
+
+    async def test_finalized_blocks_are_mounted_once(self):
+        app = StreamingMarkdownApp()
+        async with app.run_test():
+            widget = app.query_one(StreamingMarkdown)
+
+            await widget.append("First paragraph\n\n")
+            await widget.append("Second")
+            first_block = widget.query(Markdown).first()
+
+            await widget.append(" paragraph\n\nThird")
+
+            blocks = widget.query("Markdown.block")
+            assert blocks.first() is first_block
+            assert first_block.source == "First paragraph\n\n"
+            assert len(blocks) == 2
+            assert widget.source == "First paragraph\n\nSecond paragraph\n\nThird"
@@ -1,5 +1,6 @@
 import pytest
 from textual.app import App, ComposeResult
+from textual.widgets import Label
 
 from agent_chat_cli.components.thinking_indicator import ThinkingIndicator
 
@@ -33,3 +34,14 @@ class TestThinkingIndicator:
             indicator.is_thinking = False
 
             assert indicator.display is False
+
+    async def test_shows_queued_count(self, app):
+        async with app.run_test():
+            indicator = app.query_one(ThinkingIndicator)
+            label = indicator.query_one("#thinking-label", Label)
+
+            indicator.queued = 2
+            assert "2 queued" in str(label.render())
+
+            indicator.queued = 0
+            assert str(label.render()) == "Agent is thinking..."
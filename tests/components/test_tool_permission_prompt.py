@@ -53,7 +53,9 @@ class TestToolPermissionPromptToolDisplay:
     async def test_displays_mcp_tool_with_server_name(self, app):
         async with app.run_test():
             prompt = app.query_one(ToolPermissionPrompt)
-            prompt.tool_name = "mcp__filesystem__read_file"
+            prompt.requests = [
+                {"tool_name": "mcp__filesystem__read_file", "tool_input": {}}
+            ]
 
             label = prompt.query_one("#tool-display", Label)
             rendered = str(label.render())
@@ -64,13 +66,29 @@ class TestToolPermissionPromptToolDisplay:
     async def test_displays_non_mcp_tool(self, app):
         async with app.run_test():
             prompt = app.query_one(ToolPermissionPrompt)
-            prompt.tool_name = "bash"
+            prompt.requests = [{"tool_name": "bash", "tool_input": {}}]
 
             label = prompt.query_one("#tool-display", Label)
             rendered = str(label.render())
 
             assert "bash" in rendered
 
+    async def test_lists_every_tool_of_a_batch(self, app):
+        async with app.run_test():
+            prompt = app.query_one(ToolPermissionPrompt)
+            prompt.requests = [
+                {"tool_name": "mcp__github__get_issue", "tool_input": {}},
+                {"tool_name": "Bash", "tool_input": {}},
+            ]
+
+            rendered = str(prompt.query_one("#tool-display", Label).render())
+            hint = str(prompt.query_one("#permission-hint", Label).render())
+
+            assert "Confirm 2 Tools" in rendered
+            assert "1. [github] get_issue" in rendered
+            assert "2. Bash" in rendered
+            assert "Allow all?" in hint
+
 
 class TestToolPermissionPromptSubmit:
     @pytest.fixture
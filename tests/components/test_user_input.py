@@ -18,6 +18,7 @@ class UserInputApp(App):
         self.mock_actions.clear = AsyncMock()
         self.mock_actions.save = AsyncMock()
         self.mock_actions.post_user_message = AsyncMock()
+        self.mock_actions.search = AsyncMock()
 
     def compose(self) -> ComposeResult:
         yield UserInput(actions=self.mock_actions)
@@ -55,6 +56,36 @@ class TestUserInputSubmit:
             assert text_area.text == ""
 
 
+class TestUserInputSearchMode:
+    @pytest.fixture
+    def app(self):
+        return UserInputApp()
+
+    async def test_submits_a_search_instead_of_a_message(self, app):
+        async with app.run_test() as pilot:
+            user_input = app.query_one(UserInput)
+            user_input.search_mode = True
+            user_input.query_one(TextArea).insert("signing keys")
+
+            await pilot.press("enter")
+
+            app.mock_actions.search.assert_called_once_with("signing keys")
+            app.mock_actions.post_user_message.assert_not_called()
+            assert user_input.search_mode is False
+            assert user_input.message_history == []
+
+    async def test_escape_leaves_search_mode(self, app):
+        async with app.run_test() as pilot:
+            user_input = app.query_one(UserInput)
+            user_input.search_mode = True
+            user_input.query_one(TextArea).insert("signing")
+
+            await pilot.press("escape")
+
+            assert user_input.search_mode is False
+            assert user_input.query_one(TextArea).text == ""
+
+
 class TestUserInputNewlines:
     @pytest.fixture
     def app(self):
@@ -17,7 +17,7 @@ def test_config_path():
 
 @pytest.fixture
 def mock_claude_sdk():
-    with patch("agent_chat_cli.core.agent_loop.ClaudeSDKClient") as mock_client:
+    with patch("claude_agent_sdk.ClaudeSDKClient") as mock_client:
         instance = MagicMock()
         instance.connect = AsyncMock()
         instance.disconnect = AsyncMock()
@@ -39,3 +39,15 @@ class AsyncIteratorMock:
         if not self.items:
             raise StopAsyncIteration
         return self.items.pop(0)
+
+
+@pytest.fixture(autouse=True)
+def isolated_data_dirs(tmp_path, monkeypatch):
+    # Keep saved conversations, journals and the search index out of $HOME
+    from agent_chat_cli.utils import journal, save_conversation, search_index
+
+    monkeypatch.setattr(
+        save_conversation, "CONVERSATION_OUTPUT_DIR", tmp_path / "conversations"
+    )
+    monkeypatch.setattr(journal, "JOURNAL_DIR", tmp_path / "journal")
+    monkeypatch.setattr(search_index, "SEARCH_INDEX_PATH", tmp_path / "search.db")
@@ -1,6 +1,8 @@
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
+from textual.widgets import Label
+
 from agent_chat_cli.app import AgentChatCLIApp
 from agent_chat_cli.components.chat_history import ChatHistory
 from agent_chat_cli.components.messages import (
@@ -10,8 +12,11 @@ from agent_chat_cli.components.messages import (
     AgentMessage,
 )
 from agent_chat_cli.components.tool_permission_prompt import ToolPermissionPrompt
+from agent_chat_cli.components.user_input import UserInput
+from agent_chat_cli.core.conversation_store import ConversationStore, Message
 from agent_chat_cli.utils.enums import ControlCommand
 from agent_chat_cli.utils import save_conversation
+from agent_chat_cli.utils.journal import JournalSnapshot, read_journal
 
 
 @pytest.fixture
@@ -26,6 +31,7 @@ def mock_agent_loop():
         instance.permission_response_queue.put = AsyncMock()
         instance.client = MagicMock()
         instance.client.interrupt = AsyncMock()
+        instance.interrupt = AsyncMock()
         mock.return_value = instance
         yield instance
 
@@ -81,10 +87,11 @@ class TestActionsAddMessageToChat:
 class TestActionsPostSystemMessage:
     async def test_adds_system_message_to_chat(self, mock_agent_loop, mock_config):
         app = AgentChatCLIApp()
-        async with app.run_test():
+        async with app.run_test() as pilot:
             chat_history = app.query_one(ChatHistory)
 
             await app.actions.post_system_message("Connection established")
+            await pilot.pause()
 
             widgets = chat_history.query(SystemMessage)
             assert len(widgets) == 1
@@ -122,31 +129,25 @@ class TestActionsSubmitUserMessage:
 
 
 class TestActionsInterrupt:
-    async def test_sets_interrupting_flag(self, mock_agent_loop, mock_config):
-        app = AgentChatCLIApp()
-        async with app.run_test():
-            await app.actions.interrupt()
-
-            assert app.ui_state.interrupting is True
-
-    async def test_calls_client_interrupt(self, mock_agent_loop, mock_config):
+    async def test_calls_agent_loop_interrupt(self, mock_agent_loop, mock_config):
         app = AgentChatCLIApp()
         async with app.run_test():
             await app.actions.interrupt()
 
-            mock_agent_loop.client.interrupt.assert_called_once()
+            mock_agent_loop.interrupt.assert_called_once()
 
     async def test_blocked_when_permission_prompt_visible(
         self, mock_agent_loop, mock_config
     ):
         app = AgentChatCLIApp()
         async with app.run_test():
-            app.ui_state.show_permission_prompt(tool_name="test", tool_input={})
+            app.ui_state.show_permission_prompt(
+                [{"tool_name": "test", "tool_input": {}}]
+            )
 
             await app.actions.interrupt()
 
-            assert app.ui_state.interrupting is False
-            mock_agent_loop.client.interrupt.assert_not_called()
+            mock_agent_loop.interrupt.assert_not_called()
 
 
 class TestActionsNew:
@@ -174,7 +175,9 @@ class TestActionsRespondToToolPermission:
     async def test_queues_response(self, mock_agent_loop, mock_config):
         app = AgentChatCLIApp()
         async with app.run_test():
-            app.ui_state.show_permission_prompt(tool_name="test", tool_input={})
+            app.ui_state.show_permission_prompt(
+                [{"tool_name": "test", "tool_input": {}}]
+            )
 
             await app.actions.respond_to_tool_permission("yes")
 
@@ -183,7 +186,9 @@ class TestActionsRespondToToolPermission:
     async def test_hides_permission_prompt(self, mock_agent_loop, mock_config):
         app = AgentChatCLIApp()
         async with app.run_test():
-            app.ui_state.show_permission_prompt(tool_name="test", tool_input={})
+            app.ui_state.show_permission_prompt(
+                [{"tool_name": "test", "tool_input": {}}]
+            )
 
             await app.actions.respond_to_tool_permission("yes")
 
@@ -193,13 +198,149 @@ class TestActionsRespondToToolPermission:
     async def test_deny_response_queries_agent(self, mock_agent_loop, mock_config):
         app = AgentChatCLIApp()
         async with app.run_test():
-            app.ui_state.show_permission_prompt(tool_name="test", tool_input={})
+            app.ui_state.show_permission_prompt(
+                [{"tool_name": "test", "tool_input": {}}]
+            )
 
             await app.actions.respond_to_tool_permission("no")
 
             calls = mock_agent_loop.query_queue.put.call_args_list
             assert any("denied" in str(call).lower() for call in calls)
 
+    async def test_session_approval_does_not_query_agent(
+        self, mock_agent_loop, mock_config
+    ):
+        app = AgentChatCLIApp()
+        async with app.run_test():
+            app.ui_state.show_permission_prompt(
+                [{"tool_name": "test", "tool_input": {}}]
+            )
+
+            await app.actions.respond_to_tool_permission("always")
+
+            mock_agent_loop.permission_response_queue.put.assert_called_with("always")
+            mock_agent_loop.query_queue.put.assert_not_called()
+
+    async def test_picking_tools_does_not_query_agent(
+        self, mock_agent_loop, mock_config
+    ):
+        app = AgentChatCLIApp()
+        async with app.run_test():
+            app.ui_state.show_permission_prompt(
+                [
+                    {"tool_name": "Read", "tool_input": {}},
+                    {"tool_name": "Bash", "tool_input": {}},
+                ]
+            )
+
+            await app.actions.respond_to_tool_permission("1")
+
+            mock_agent_loop.permission_response_queue.put.assert_called_with("1")
+            mock_agent_loop.query_queue.put.assert_not_called()
+
+    async def test_out_of_range_numbers_are_sent_as_a_message(
+        self, mock_agent_loop, mock_config
+    ):
+        app = AgentChatCLIApp()
+        async with app.run_test():
+            app.ui_state.show_permission_prompt(
+                [
+                    {"tool_name": "Read", "tool_input": {}},
+                    {"tool_name": "Bash", "tool_input": {}},
+                ]
+            )
+
+            await app.actions.respond_to_tool_permission("42")
+
+            mock_agent_loop.query_queue.put.assert_called_once_with("42")
+
+    async def test_number_for_a_single_tool_is_sent_as_a_message(
+        self, mock_agent_loop, mock_config
+    ):
+        app = AgentChatCLIApp()
+        async with app.run_test():
+            app.ui_state.show_permission_prompt(
+                [{"tool_name": "Read", "tool_input": {}}]
+            )
+
+            await app.actions.respond_to_tool_permission("1")
+
+            mock_agent_loop.query_queue.put.assert_called_once_with("1")
+
+
+class TestActionsRestore:
+    async def test_restores_messages_and_resumes_the_session(
+        self, mock_agent_loop, mock_config, tmp_path
+    ):
+        mock_agent_loop.resume = AsyncMock()
+        mock_agent_loop.unfinished_session = JournalSnapshot(
+            path=tmp_path / "session-1.jsonl",
+            session_id="crashed-session",
+            messages=[Message(RoleType.USER, "Hi"), Message(RoleType.AGENT, "Hello")],
+        )
+
+        app = AgentChatCLIApp()
+        async with app.run_test():
+            await app.actions.restore()
+
+            contents = [message.content for message in app.conversation.messages]
+            assert contents[:2] == ["Hi", "Hello"]
+            mock_agent_loop.resume.assert_called_once_with("crashed-session")
+            assert mock_agent_loop.unfinished_session is None
+            assert read_journal(tmp_path / "session-1.jsonl").finished
+
+    async def test_nothing_to_restore(self, mock_agent_loop, mock_config):
+        mock_agent_loop.resume = AsyncMock()
+        mock_agent_loop.unfinished_session = None
+
+        app = AgentChatCLIApp()
+        async with app.run_test() as pilot:
+            await app.actions.restore()
+            await pilot.pause()
+
+            assert app.conversation[0].content == "Nothing to restore"
+            mock_agent_loop.resume.assert_not_called()
+
+
+class TestActionsSearch:
+    async def test_posts_ranked_hits(self, mock_agent_loop, mock_config):
+        store = ConversationStore()
+        store.add(Message(RoleType.USER, "How do I rotate the [signing] keys?"))
+        save_conversation.save_conversation(store)
+
+        app = AgentChatCLIApp()
+        async with app.run_test() as pilot:
+            await app.actions.search("signing")
+            await pilot.pause()
+
+            message = app.conversation[-1].content
+            assert message.startswith("Found 1 for 'signing'")
+            assert (
+                "(user): How do I rotate the \\[[bold]signing[/bold]] keys?" in message
+            )
+
+            widget = app.query_one(ChatHistory).query(SystemMessage).last()
+            assert "rotate the [signing] keys" in str(
+                widget.query(Label).last().render()
+            )
+
+    async def test_reports_no_matches(self, mock_agent_loop, mock_config):
+        app = AgentChatCLIApp()
+        async with app.run_test() as pilot:
+            await app.actions.search("nothing")
+            await pilot.pause()
+
+            assert app.conversation[-1].content == "No matches for 'nothing'"
+
+    async def test_start_search_puts_input_in_search_mode(
+        self, mock_agent_loop, mock_config
+    ):
+        app = AgentChatCLIApp()
+        async with app.run_test():
+            app.actions.start_search()
+
+            assert app.query_one(UserInput).search_mode is True
+
 
 class TestActionsSave:
     async def test_saves_conversation_to_file(
@@ -226,11 +367,12 @@ class TestActionsSave:
         monkeypatch.setattr(save_conversation, "CONVERSATION_OUTPUT_DIR", output_dir)
 
         app = AgentChatCLIApp()
-        async with app.run_test():
+        async with app.run_test() as pilot:
             chat_history = app.query_one(ChatHistory)
             initial_count = len(chat_history.children)
 
             await app.actions.save()
+            await pilot.pause()
 
             system_messages = chat_history.query(SystemMessage)
             assert len(system_messages) == initial_count + 1
@@ -247,10 +389,11 @@ class TestActionsSave:
         monkeypatch.setattr(save_conversation, "CONVERSATION_OUTPUT_DIR", output_dir)
 
         app = AgentChatCLIApp()
-        async with app.run_test():
+        async with app.run_test() as pilot:
             app.ui_state.stop_thinking()
 
             await app.actions.save()
+            await pilot.pause()
 
             thinking_indicator = app.query_one(ThinkingIndicator)
             assert thinking_indicator.is_thinking is False
@@ -266,3 +409,63 @@ class TestActionsShowModelMenu:
 
             model_menu = app.query_one(ModelSelectionMenu)
             assert model_menu.is_visible is True
+
+
+class TestActionsQueue:
+    async def test_shows_queued_prompts(self, mock_agent_loop, mock_config):
+        from agent_chat_cli.components.queue_menu import QueueMenu
+
+        mock_agent_loop.query_queue.pending_prompts = MagicMock(
+            return_value=["first", "second"]
+        )
+
+        app = AgentChatCLIApp()
+        async with app.run_test():
+            await app.actions.show_queue_menu()
+
+            queue_menu = app.query_one(QueueMenu)
+            assert queue_menu.is_visible is True
+
+    async def test_reports_an_empty_queue(self, mock_agent_loop, mock_config):
+        mock_agent_loop.query_queue.pending_prompts = MagicMock(return_value=[])
+
+        app = AgentChatCLIApp()
+        async with app.run_test() as pilot:
+            await app.actions.show_queue_menu()
+            await pilot.pause()
+
+            widgets = app.query_one(ChatHistory).query(SystemMessage)
+            assert widgets.first().message == "No queued messages"
+
+    async def test_cancels_a_queued_prompt(self, mock_agent_loop, mock_config):
+        mock_agent_loop.query_queue.cancel_prompt = MagicMock(return_value="second")
+
+        app = AgentChatCLIApp()
+        async with app.run_test() as pilot:
+            await app.actions.cancel_queued_prompt(1)
+            await pilot.pause()
+
+            mock_agent_loop.query_queue.cancel_prompt.assert_called_once_with(1)
+            widgets = app.query_one(ChatHistory).query(SystemMessage)
+            assert widgets.first().message == "Cancelled queued message: second"
+
+
+class TestActionsStats:
+    async def test_reports_session_metrics(self, mock_agent_loop, mock_config):
+        from agent_chat_cli.utils.permission_cache import PermissionCache
+        from agent_chat_cli.utils.turn_metrics import SessionMetrics
+
+        mock_agent_loop.metrics = SessionMetrics()
+        mock_agent_loop.permission_cache = PermissionCache()
+        mock_agent_loop.permission_cache.allow_tool("Read")
+
+        app = AgentChatCLIApp()
+        async with app.run_test() as pilot:
+            await app.actions.show_stats()
+            await pilot.pause()
+
+            widgets = app.query_one(ChatHistory).query(SystemMessage)
+            assert widgets.first().message == (
+                "No turns yet\n"
+                "Permissions remembered: 1 tools, 0 calls (0 prompts skipped)"
+            )
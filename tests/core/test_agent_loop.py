@@ -1,19 +1,45 @@
 import asyncio
+import time
 
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
+from claude_agent_sdk import AgentDefinition
 from claude_agent_sdk.types import (
     AssistantMessage,
+    ResultMessage,
     StreamEvent,
     SystemMessage,
     TextBlock,
+    ToolResultBlock,
     ToolUseBlock,
+    UserMessage,
 )
 
 from agent_chat_cli.core.agent_loop import AgentLoop
-from agent_chat_cli.utils.enums import AppEventType, ContentType, ControlCommand
+from agent_chat_cli.core.conversation_store import ConversationStore, Message
+from agent_chat_cli.utils import journal, logger
+from agent_chat_cli.utils.config import (
+    AgentChatConfig,
+    ConfigChange,
+    ConfigService,
+    MCPServerConfig,
+    PermissionRule,
+    PermissionsConfig,
+)
+from agent_chat_cli.utils.enums import (
+    AppEventType,
+    ContentType,
+    ControlCommand,
+    JournalFsync,
+    PermissionAction,
+    RoleType,
+)
+from agent_chat_cli.utils.journal import read_journal
 from agent_chat_cli.utils.mcp_server_status import MCPServerStatus
+from agent_chat_cli.utils.permission_policy import PermissionPolicy
+from agent_chat_cli.utils.tracing import Tracer
+from agent_chat_cli.utils.turn_metrics import TurnMetrics
 
 
 @pytest.fixture
@@ -28,7 +54,7 @@ def mock_app():
 
 @pytest.fixture
 def mock_sdk_client():
-    with patch("agent_chat_cli.core.agent_loop.ClaudeSDKClient") as mock:
+    with patch("claude_agent_sdk.ClaudeSDKClient") as mock:
         instance = MagicMock()
         instance.connect = AsyncMock()
         instance.disconnect = AsyncMock()
@@ -58,6 +84,8 @@ def mock_config():
         load_mock.return_value = MagicMock(
             system_prompt="test",
             model="test-model",
+            coalesce_queued_prompts=False,
+            permissions=PermissionsConfig(),
         )
         with patch(
             "agent_chat_cli.core.agent_loop.get_available_servers"
@@ -105,6 +133,291 @@ class TestAgentLoopNewConversation:
             pass
 
 
+class TestConnectClient:
+    async def test_passes_agents_as_sdk_definitions(
+        self, mock_app, mock_sdk_client, mock_config
+    ):
+        agent = {"description": "Research", "prompt": "Research things"}
+        agent_loop = AgentLoop(app=mock_app)
+
+        with patch(
+            "agent_chat_cli.core.agent_loop.get_sdk_config",
+            return_value={"agents": {"researcher": {**agent, "tools": None}}},
+        ):
+            await agent_loop._connect_client()
+
+        options = mock_sdk_client.call_args.kwargs["options"]
+        assert options.agents == {"researcher": AgentDefinition(**agent)}
+
+
+class TestAgentLoopStandbyClient:
+    @pytest.fixture
+    def clients(self, mock_sdk_client):
+        created = []
+
+        def create_client(options):
+            client = MagicMock()
+            client.options = options
+            client.connect = AsyncMock()
+            client.disconnect = AsyncMock()
+            client.set_model = AsyncMock()
+            created.append(client)
+            return client
+
+        mock_sdk_client.side_effect = create_client
+        return created
+
+    async def test_warms_standby_client_on_start(self, mock_app, mock_config, clients):
+        agent_loop = AgentLoop(app=mock_app)
+        loop_task = asyncio.create_task(agent_loop.start())
+        await asyncio.sleep(0.05)
+
+        assert len(clients) == 2
+        assert agent_loop.client is clients[0]
+        clients[1].connect.assert_called_once()
+
+        await stop_loop(loop_task)
+
+    async def test_clients_share_managed_mcp_servers(
+        self, mock_app, mock_config, clients
+    ):
+        agent_loop = AgentLoop(app=mock_app)
+        relay = {"fake": {"type": "stdio", "command": "python", "args": []}}
+        agent_loop.mcp_manager = MagicMock(
+            start=AsyncMock(),
+            stop=AsyncMock(),
+            sdk_servers=MagicMock(return_value=relay),
+        )
+
+        loop_task = asyncio.create_task(agent_loop.start())
+        await asyncio.sleep(0.05)
+
+        await agent_loop.query_queue.put(ControlCommand.NEW_CONVERSATION)
+        await asyncio.sleep(0.05)
+
+        assert len(clients) == 3
+        assert all(client.options.mcp_servers == relay for client in clients)
+        agent_loop.mcp_manager.start.assert_called_once()
+
+        await stop_loop(loop_task)
+        agent_loop.mcp_manager.stop.assert_called_once()
+
+    async def test_new_conversation_swaps_in_standby(
+        self, mock_app, mock_config, clients
+    ):
+        agent_loop = AgentLoop(app=mock_app)
+        agent_loop.session_id = "existing-session-123"
+        loop_task = asyncio.create_task(agent_loop.start())
+        await asyncio.sleep(0.05)
+
+        await agent_loop.query_queue.put(ControlCommand.NEW_CONVERSATION)
+        await asyncio.sleep(0.05)
+
+        assert agent_loop.client is clients[1]
+        assert clients[1].options.resume is None
+        clients[0].disconnect.assert_called_once()
+
+        # The next spare is warmed right away
+        assert len(clients) == 3
+
+        await stop_loop(loop_task)
+
+    async def test_standby_follows_model_change(self, mock_app, mock_config, clients):
+        agent_loop = AgentLoop(app=mock_app)
+        loop_task = asyncio.create_task(agent_loop.start())
+        await asyncio.sleep(0.05)
+
+        await agent_loop.change_model("opus")
+        await agent_loop.query_queue.put(ControlCommand.NEW_CONVERSATION)
+        await asyncio.sleep(0.05)
+
+        clients[0].set_model.assert_called_once_with("opus")
+        clients[1].set_model.assert_called_once_with("opus")
+        assert agent_loop.client is clients[1]
+
+        await stop_loop(loop_task)
+
+    async def test_resume_reconnects_to_the_session(
+        self, mock_app, mock_config, clients
+    ):
+        agent_loop = AgentLoop(app=mock_app)
+        loop_task = asyncio.create_task(agent_loop.start())
+        await asyncio.sleep(0.05)
+
+        await agent_loop.resume("crashed-session")
+        await asyncio.sleep(0.05)
+
+        clients[0].disconnect.assert_called_once()
+        assert agent_loop.session_id == "crashed-session"
+        assert agent_loop.client.options.resume == "crashed-session"
+
+        await stop_loop(loop_task)
+
+    async def test_falls_back_when_standby_fails(self, mock_app, mock_config, clients):
+        agent_loop = AgentLoop(app=mock_app)
+        loop_task = asyncio.create_task(agent_loop.start())
+        await asyncio.sleep(0.05)
+
+        standby_task = asyncio.get_running_loop().create_future()
+        standby_task.set_exception(RuntimeError("boom"))
+        agent_loop._standby_task = standby_task
+
+        await agent_loop.query_queue.put(ControlCommand.NEW_CONVERSATION)
+        await asyncio.sleep(0.05)
+
+        clients[0].disconnect.assert_called_once()
+        assert agent_loop.client is clients[2]
+
+        await stop_loop(loop_task)
+
+    async def test_prewarm_can_be_disabled(self, mock_app, mock_config, clients):
+        agent_loop = AgentLoop(app=mock_app)
+        agent_loop.config.prewarm_client = False
+        loop_task = asyncio.create_task(agent_loop.start())
+        await asyncio.sleep(0.05)
+
+        assert len(clients) == 1
+
+        await stop_loop(loop_task)
+
+
+class SlowStream:
+    """Fake response stream that yields a message every `delay` seconds until
+    the SDK is asked to interrupt."""
+
+    def __init__(self, delay: float = 1.0):
+        self.delay = delay
+        self.interrupted = asyncio.Event()
+
+    async def interrupt(self):
+        self.interrupted.set()
+
+    async def receive_response(self):
+        while not self.interrupted.is_set():
+            await asyncio.sleep(self.delay)
+            yield MagicMock()
+
+
+async def stop_loop(loop_task: asyncio.Task) -> None:
+    loop_task.cancel()
+    try:
+        await loop_task
+    except asyncio.CancelledError:
+        pass
+
+
+class TestAgentLoopInterrupt:
+    @pytest.fixture
+    def slow_stream(self, mock_sdk_client):
+        stream = SlowStream()
+        client = mock_sdk_client.return_value
+        client.interrupt = AsyncMock(side_effect=stream.interrupt)
+        client.receive_response = MagicMock(side_effect=stream.receive_response)
+        return stream
+
+    async def test_interrupt_abandons_in_flight_response(
+        self, mock_app, mock_sdk_client, mock_config, slow_stream
+    ):
+        agent_loop = AgentLoop(app=mock_app)
+        loop_task = asyncio.create_task(agent_loop.start())
+
+        await agent_loop.query_queue.put("first")
+        await asyncio.sleep(0.05)
+
+        started = time.perf_counter()
+        await agent_loop.interrupt()
+
+        while not mock_app.actions.post_app_event.called:
+            await asyncio.sleep(0.001)
+
+        assert time.perf_counter() - started < 0.1
+
+        call_arg = mock_app.actions.post_app_event.call_args[0][0]
+        assert call_arg.type == AppEventType.RESULT
+
+        await stop_loop(loop_task)
+
+    async def test_next_query_starts_after_interrupt(
+        self, mock_app, mock_sdk_client, mock_config, slow_stream
+    ):
+        agent_loop = AgentLoop(app=mock_app)
+        loop_task = asyncio.create_task(agent_loop.start())
+
+        await agent_loop.query_queue.put("first")
+        await asyncio.sleep(0.05)
+        await agent_loop.interrupt()
+
+        started = time.perf_counter()
+        await agent_loop.query_queue.put("second")
+
+        while mock_sdk_client.return_value.query.call_count < 2:
+            await asyncio.sleep(0.001)
+
+        assert time.perf_counter() - started < 0.1
+        mock_sdk_client.return_value.interrupt.assert_called_once()
+
+        await stop_loop(loop_task)
+
+    async def test_failed_drain_keeps_the_loop_running(
+        self, mock_app, mock_sdk_client, mock_config, slow_stream
+    ):
+        client = mock_sdk_client.return_value
+        client.interrupt = AsyncMock(side_effect=RuntimeError("CLI exited"))
+        agent_loop = AgentLoop(app=mock_app)
+        loop_task = asyncio.create_task(agent_loop.start())
+
+        await agent_loop.query_queue.put("first")
+        await asyncio.sleep(0.05)
+        await agent_loop.interrupt()
+        await agent_loop.query_queue.put("second")
+
+        async with asyncio.timeout(1):
+            while client.query.call_count < 2:
+                await asyncio.sleep(0.001)
+
+        assert not loop_task.done()
+
+        await stop_loop(loop_task)
+
+    async def test_drain_timeout_replaces_the_client(
+        self, mock_app, mock_sdk_client, mock_config, slow_stream
+    ):
+        # The response never ends, so its rest would be read as the next one
+        client = mock_sdk_client.return_value
+        client.interrupt = AsyncMock()
+        agent_loop = AgentLoop(app=mock_app)
+        agent_loop.DRAIN_TIMEOUT = 0.01
+        loop_task = asyncio.create_task(agent_loop.start())
+
+        await agent_loop.query_queue.put("first")
+        await asyncio.sleep(0.05)
+        connects = mock_sdk_client.call_count
+        await agent_loop.interrupt()
+        await agent_loop.query_queue.put("second")
+
+        async with asyncio.timeout(1):
+            while client.query.call_count < 2:
+                await asyncio.sleep(0.001)
+
+        client.disconnect.assert_called()
+        assert mock_sdk_client.call_count == connects + 1
+
+        await stop_loop(loop_task)
+
+    async def test_interrupt_without_query_is_ignored(
+        self, mock_app, mock_sdk_client, mock_config
+    ):
+        agent_loop = AgentLoop(app=mock_app)
+        loop_task = asyncio.create_task(agent_loop.start())
+        await asyncio.sleep(0.01)
+
+        await agent_loop.interrupt()
+
+        mock_sdk_client.return_value.interrupt.assert_not_called()
+
+        await stop_loop(loop_task)
+
+
 class TestHandleMessageSystemMessage:
     async def test_stores_session_id_from_init_message(self, mock_app, mock_config):
         agent_loop = AgentLoop(app=mock_app)
@@ -120,6 +433,7 @@ class TestHandleMessageSystemMessage:
         await agent_loop._handle_message(message)
 
         assert agent_loop.session_id == "new-session-456"
+        assert mock_app.conversation.session_id == "new-session-456"
 
     async def test_updates_mcp_server_status_from_init_message(
         self, mock_app, mock_config
@@ -137,6 +451,24 @@ class TestHandleMessageSystemMessage:
 
         assert MCPServerStatus.is_connected("filesystem") is True
 
+    async def test_leaves_managed_server_status_to_mcp_manager(
+        self, mock_app, mock_config
+    ):
+        agent_loop = AgentLoop(app=mock_app)
+        agent_loop.mcp_manager.servers = {"github": MagicMock()}
+        MCPServerStatus.set_status("github", "pending")
+
+        message = MagicMock(spec=SystemMessage)
+        message.subtype = AppEventType.INIT.value
+        message.data = {
+            "session_id": "session-123",
+            "mcp_servers": [{"name": "github", "status": "connected"}],
+        }
+
+        await agent_loop._handle_message(message)
+
+        assert MCPServerStatus.get_status("github") == "pending"
+
 
 class TestHandleMessageStreamEvent:
     async def test_handles_text_delta_stream_event(self, mock_app, mock_config):
@@ -219,6 +551,65 @@ class TestHandleMessageAssistantMessage:
         assert call_arg.data["content"][0]["name"] == "read_file"
 
 
+class TestAgentLoopJournal:
+    @pytest.fixture
+    def journal_dir(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(journal, "JOURNAL_DIR", tmp_path)
+        return tmp_path
+
+    @pytest.fixture
+    def app(self, mock_app):
+        mock_app.conversation = ConversationStore()
+        return mock_app
+
+    async def test_offers_to_restore_a_crashed_session(
+        self, app, mock_config, mock_sdk_client, journal_dir
+    ):
+        (journal_dir / "session-1.jsonl").write_text(
+            '{"type": "added", "index": 0, "role": "user", "content": "Hi"}\n'
+        )
+
+        agent_loop = AgentLoop(app=app, journal=True)
+        loop_task = asyncio.create_task(agent_loop.start())
+        await asyncio.sleep(0.05)
+
+        assert agent_loop.unfinished_session is not None
+        message = app.actions.post_system_message.call_args[0][0]
+        assert "/restore" in message
+
+        await stop_loop(loop_task)
+
+    async def test_journals_the_session_until_shutdown(
+        self, app, mock_config, mock_sdk_client, journal_dir
+    ):
+        agent_loop = AgentLoop(app=app, journal=True)
+        loop_task = asyncio.create_task(agent_loop.start())
+        await asyncio.sleep(0.05)
+
+        app.conversation.add(Message(RoleType.USER, "Hi"))
+        await stop_loop(loop_task)
+
+        snapshot = read_journal(agent_loop.journal.path)
+        assert snapshot.finished
+        assert [message.content for message in snapshot.messages] == ["Hi"]
+        app.actions.post_system_message.assert_not_called()
+
+    async def test_leaves_the_journal_open_after_a_crash(
+        self, app, mock_config, mock_sdk_client, journal_dir
+    ):
+        agent_loop = AgentLoop(app=app, journal=True)
+        assert agent_loop.journal is None
+
+        with (
+            patch.object(agent_loop, "_run", side_effect=RuntimeError("boom")),
+            pytest.raises(RuntimeError),
+        ):
+            await agent_loop.start()
+
+        assert agent_loop.journal is not None
+        assert not read_journal(agent_loop.journal.path).finished
+
+
 class TestCanUseTool:
     async def test_allows_tool_on_yes_response(self, mock_app, mock_config):
         agent_loop = AgentLoop(app=mock_app)
@@ -290,4 +681,546 @@ class TestCanUseTool:
         mock_app.actions.post_app_event.assert_called_once()
         call_arg = mock_app.actions.post_app_event.call_args[0][0]
         assert call_arg.type == AppEventType.TOOL_PERMISSION_REQUEST
-        assert call_arg.data["tool_name"] == "write_file"
+        assert call_arg.data["requests"] == [
+            {
+                "tool_name": "write_file",
+                "tool_input": {"path": "/tmp/out.txt", "content": "data"},
+            }
+        ]
+
+
+class TestCanUseToolBatching:
+    def can_use(self, agent_loop, tool_name, **tool_input):
+        return asyncio.create_task(
+            agent_loop._can_use_tool(
+                tool_name=tool_name, tool_input=tool_input, _context=MagicMock()
+            )
+        )
+
+    async def test_calls_in_the_same_window_share_one_prompt(
+        self, mock_app, mock_config
+    ):
+        agent_loop = AgentLoop(app=mock_app)
+        calls = [
+            self.can_use(agent_loop, "Read", file_path="a"),
+            self.can_use(agent_loop, "Bash", command="ls"),
+        ]
+        await agent_loop.permission_response_queue.put("yes")
+
+        results = await asyncio.gather(*calls)
+
+        assert [result.behavior for result in results] == ["allow", "allow"]
+        mock_app.actions.post_app_event.assert_called_once()
+        requests = mock_app.actions.post_app_event.call_args[0][0].data["requests"]
+        assert [request["tool_name"] for request in requests] == ["Read", "Bash"]
+
+    async def test_picked_tools_are_allowed_and_the_rest_denied(
+        self, mock_app, mock_config
+    ):
+        agent_loop = AgentLoop(app=mock_app)
+        calls = [
+            self.can_use(agent_loop, "Read", file_path="a"),
+            self.can_use(agent_loop, "Bash", command="ls"),
+            self.can_use(agent_loop, "Write", file_path="b"),
+        ]
+        await agent_loop.permission_response_queue.put("1, 3")
+
+        results = await asyncio.gather(*calls)
+
+        assert [result.behavior for result in results] == ["allow", "deny", "allow"]
+        assert results[1].interrupt is False
+        mock_app.actions.post_system_message.assert_called_once_with(
+            "Permission denied for Bash"
+        )
+
+    async def test_out_of_range_numbers_are_a_message(self, mock_app, mock_config):
+        agent_loop = AgentLoop(app=mock_app)
+        calls = [
+            self.can_use(agent_loop, "Read", file_path="a"),
+            self.can_use(agent_loop, "Bash", command="ls"),
+        ]
+        await agent_loop.permission_response_queue.put("42")
+
+        results = await asyncio.gather(*calls)
+
+        assert [result.behavior for result in results] == ["deny", "deny"]
+        assert all(result.message == "42" for result in results)
+        assert all(result.interrupt for result in results)
+
+    async def test_denying_a_batch_denies_every_call(self, mock_app, mock_config):
+        agent_loop = AgentLoop(app=mock_app)
+        calls = [
+            self.can_use(agent_loop, "Read", file_path="a"),
+            self.can_use(agent_loop, "Bash", command="ls"),
+        ]
+        await agent_loop.permission_response_queue.put("no")
+
+        results = await asyncio.gather(*calls)
+
+        assert [result.behavior for result in results] == ["deny", "deny"]
+        assert all(result.interrupt for result in results)
+
+    async def test_calls_after_the_window_get_the_next_prompt(
+        self, mock_app, mock_config
+    ):
+        agent_loop = AgentLoop(app=mock_app)
+        first = self.can_use(agent_loop, "Read", file_path="a")
+        await asyncio.sleep(AgentLoop.PERMISSION_BATCH_WINDOW * 2)
+        second = self.can_use(agent_loop, "Bash", command="ls")
+
+        await agent_loop.permission_response_queue.put("yes")
+        await agent_loop.permission_response_queue.put("no")
+
+        assert (await first).behavior == "allow"
+        assert (await second).behavior == "deny"
+        assert mock_app.actions.post_app_event.call_count == 2
+
+    async def test_unanswered_calls_are_denied_when_the_prompt_is_cancelled(
+        self, mock_app, mock_config
+    ):
+        agent_loop = AgentLoop(app=mock_app)
+        call = self.can_use(agent_loop, "Read", file_path="a")
+        await asyncio.sleep(0)
+        flush = agent_loop._permission_flush
+        assert flush is not None
+
+        await asyncio.sleep(AgentLoop.PERMISSION_BATCH_WINDOW * 2)
+        flush.cancel()
+        result = await call
+
+        assert result.behavior == "deny"
+        assert result.message == "cancelled"
+
+
+class TestCanUseToolSessionCache:
+    async def test_session_answer_allows_the_same_call_again(
+        self, mock_app, mock_config
+    ):
+        agent_loop = AgentLoop(app=mock_app)
+        await agent_loop.permission_response_queue.put("s")
+
+        for _ in range(2):
+            result = await agent_loop._can_use_tool(
+                tool_name="Read", tool_input={"file_path": "a"}, _context=MagicMock()
+            )
+            assert result.behavior == "allow"
+
+        mock_app.actions.post_app_event.assert_called_once()
+        assert agent_loop.permission_cache.hits == 1
+
+    async def test_session_answer_still_asks_for_other_input(
+        self, mock_app, mock_config
+    ):
+        agent_loop = AgentLoop(app=mock_app)
+        await agent_loop.permission_response_queue.put("s")
+        await agent_loop.permission_response_queue.put("yes")
+
+        await agent_loop._can_use_tool(
+            tool_name="Read", tool_input={"file_path": "a"}, _context=MagicMock()
+        )
+        await agent_loop._can_use_tool(
+            tool_name="Read", tool_input={"file_path": "b"}, _context=MagicMock()
+        )
+
+        assert mock_app.actions.post_app_event.call_count == 2
+
+    async def test_always_answer_allows_the_tool_with_any_input(
+        self, mock_app, mock_config
+    ):
+        agent_loop = AgentLoop(app=mock_app)
+        await agent_loop.permission_response_queue.put("always")
+
+        for path in ("a", "b", "c"):
+            result = await agent_loop._can_use_tool(
+                tool_name="Read", tool_input={"file_path": path}, _context=MagicMock()
+            )
+            assert result.behavior == "allow"
+
+        mock_app.actions.post_app_event.assert_called_once()
+        assert agent_loop.permission_cache.hits == 2
+
+    async def test_waiting_call_uses_the_answer_to_the_open_prompt(
+        self, mock_app, mock_config
+    ):
+        agent_loop = AgentLoop(app=mock_app)
+
+        calls = [
+            asyncio.create_task(
+                agent_loop._can_use_tool(
+                    tool_name="Read",
+                    tool_input={"file_path": path},
+                    _context=MagicMock(),
+                )
+            )
+            for path in ("a", "b")
+        ]
+        await asyncio.sleep(0.01)
+        await agent_loop.permission_response_queue.put("a")
+
+        results = await asyncio.gather(*calls)
+
+        assert [result.behavior for result in results] == ["allow", "allow"]
+        mock_app.actions.post_app_event.assert_called_once()
+
+
+class TestCanUseToolPolicy:
+    @pytest.fixture
+    def agent_loop(self, mock_app, mock_config):
+        agent_loop = AgentLoop(app=mock_app)
+        agent_loop.permission_policy = PermissionPolicy(
+            PermissionsConfig(
+                rules=[
+                    PermissionRule(
+                        action=PermissionAction.ALLOW, server="github", tool="get_*"
+                    ),
+                    PermissionRule(
+                        action=PermissionAction.DENY,
+                        tool="Bash",
+                        input={"command": r"\brm\b"},
+                    ),
+                ]
+            )
+        )
+        return agent_loop
+
+    async def test_allowed_tool_skips_the_prompt(self, agent_loop, mock_app):
+        result = await agent_loop._can_use_tool(
+            tool_name="mcp__github__get_issue",
+            tool_input={"number": 1},
+            _context=MagicMock(),
+        )
+
+        assert result.behavior == "allow"
+        mock_app.actions.post_app_event.assert_not_called()
+
+    async def test_denied_tool_skips_the_prompt(self, agent_loop, mock_app):
+        result = await agent_loop._can_use_tool(
+            tool_name="Bash",
+            tool_input={"command": "rm -rf build"},
+            _context=MagicMock(),
+        )
+
+        assert result.behavior == "deny"
+        assert result.interrupt is False
+        mock_app.actions.post_app_event.assert_not_called()
+        mock_app.actions.post_system_message.assert_called_once()
+
+    async def test_unmatched_tool_asks(self, agent_loop, mock_app):
+        await agent_loop.permission_response_queue.put("yes")
+
+        result = await agent_loop._can_use_tool(
+            tool_name="Bash",
+            tool_input={"command": "ls"},
+            _context=MagicMock(),
+        )
+
+        assert result.behavior == "allow"
+        mock_app.actions.post_app_event.assert_called_once()
+
+
+class TestAgentLoopCoalescing:
+    async def test_sends_queued_prompts_separately_by_default(
+        self, mock_app, mock_sdk_client, mock_config
+    ):
+        agent_loop = AgentLoop(app=mock_app)
+
+        for prompt in ("first", "second", "third"):
+            await agent_loop.query_queue.put(prompt)
+
+        loop_task = asyncio.create_task(agent_loop.start())
+        await asyncio.sleep(0.05)
+
+        query = mock_sdk_client.return_value.query
+        assert [call.args[0] for call in query.call_args_list] == [
+            "first",
+            "second",
+            "third",
+        ]
+
+        await stop_loop(loop_task)
+
+    async def test_merges_queued_prompts_into_one_turn(
+        self, mock_app, mock_sdk_client, mock_config
+    ):
+        agent_loop = AgentLoop(app=mock_app)
+        agent_loop.config.coalesce_queued_prompts = True
+
+        await agent_loop.query_queue.put("first")
+        await agent_loop.query_queue.put("second")
+        await agent_loop.query_queue.put(ControlCommand.NEW_CONVERSATION)
+        await agent_loop.query_queue.put("third")
+
+        loop_task = asyncio.create_task(agent_loop.start())
+        await asyncio.sleep(0.05)
+
+        query = mock_sdk_client.return_value.query
+        [merged, after_new] = [call.args[0] for call in query.call_args_list]
+
+        assert "[Message 1]\nfirst" in merged
+        assert "[Message 2]\nsecond" in merged
+        assert after_new == "third"
+
+        await stop_loop(loop_task)
+
+
+def text_delta(text: str) -> StreamEvent:
+    return StreamEvent(
+        uuid="test-uuid",
+        session_id="test-session",
+        event={
+            "type": ContentType.CONTENT_BLOCK_DELTA.value,
+            "delta": {"type": ContentType.TEXT_DELTA.value, "text": text},
+        },
+    )
+
+
+class TestAgentLoopTurnMetrics:
+    async def test_records_each_turn(self, mock_app, mock_sdk_client, mock_config):
+        result = ResultMessage(
+            subtype="success",
+            duration_ms=1500,
+            duration_api_ms=1000,
+            is_error=False,
+            num_turns=1,
+            session_id="test-session",
+            total_cost_usd=0.0123,
+            usage={"input_tokens": 10, "output_tokens": 50},
+        )
+        mock_sdk_client.return_value.receive_response = MagicMock(
+            return_value=AsyncIterator(
+                [text_delta("Hello"), text_delta(" world"), result]
+            )
+        )
+
+        agent_loop = AgentLoop(app=mock_app)
+        await agent_loop.query_queue.put("hi")
+
+        loop_task = asyncio.create_task(agent_loop.start())
+        await asyncio.sleep(0.05)
+
+        [turn] = agent_loop.metrics.turns
+        assert turn.chunks == 2
+        assert turn.ttft_ms is not None
+        assert len(turn.gaps_ms) == 1
+        assert turn.output_tokens == 50
+        assert turn.tokens_per_second == 50
+        assert turn.cost_usd == 0.0123
+        assert agent_loop._turn is None
+
+        event = mock_app.actions.post_app_event.call_args[0][0]
+        assert event.type == AppEventType.RESULT
+        assert event.data == {"summary": turn.summary()}
+        assert "50 tok/s" in event.data["summary"]
+
+        await stop_loop(loop_task)
+
+    async def test_counts_time_waiting_for_permission(self, mock_app, mock_config):
+        agent_loop = AgentLoop(app=mock_app)
+        agent_loop._turn = TurnMetrics()
+
+        async def answer_later():
+            await asyncio.sleep(0.1)
+            await agent_loop.permission_response_queue.put("yes")
+
+        answer = asyncio.create_task(answer_later())
+
+        await agent_loop._can_use_tool(
+            tool_name="read_file",
+            tool_input={"path": "/tmp/test.txt"},
+            _context=MagicMock(),
+        )
+        await answer
+
+        # Answered 100ms in, less the batching window before the prompt
+        assert 0 < agent_loop._turn.permission_wait_ms < 100
+
+    async def test_stream_events_without_a_turn_are_not_counted(
+        self, mock_app, mock_config
+    ):
+        agent_loop = AgentLoop(app=mock_app)
+
+        await agent_loop._handle_message(text_delta("Hello"))
+
+        assert agent_loop._turn is None
+        assert not agent_loop.metrics.turns
+
+
+class TestAgentLoopTracing:
+    @pytest.fixture(autouse=True)
+    def tracer(self):
+        Tracer.enable()
+        yield
+        Tracer.disable()
+
+    async def test_traces_query_stream_and_tool_calls(
+        self, mock_app, mock_sdk_client, mock_config
+    ):
+        tool_use = AssistantMessage(
+            content=[
+                ToolUseBlock(id="read", name="Read", input={}),
+                ToolUseBlock(id="grep", name="Grep", input={}),
+            ],
+            model="test-model",
+        )
+        tool_result = UserMessage(
+            content=[ToolResultBlock(tool_use_id="read", content="...")]
+        )
+        mock_sdk_client.return_value.receive_response = MagicMock(
+            return_value=AsyncIterator([text_delta("Hi"), tool_use, tool_result])
+        )
+
+        agent_loop = AgentLoop(app=mock_app)
+        await agent_loop.query_queue.put("hi")
+
+        loop_task = asyncio.create_task(agent_loop.start())
+        await asyncio.sleep(0.05)
+
+        # Tool calls by tool name, the rest by span name
+        spans = {
+            span.attributes.get("tool", span.name): span for span in Tracer.spans()
+        }
+        query, stream = spans["query"], spans["stream"]
+
+        assert spans["client_connect"].parent_id is None
+        assert stream.parent_id == query.span_id
+        assert spans["Read"].parent_id == stream.span_id
+        assert spans["Read"].attributes["is_error"] is False
+
+        # Never answered, so it is closed with the turn
+        assert spans["Grep"].attributes["finished"] is False
+        assert query.attributes == {"chars": 2, "interrupted": False}
+        assert agent_loop._tool_spans == {}
+
+        await stop_loop(loop_task)
+
+    async def test_permission_wait_belongs_to_the_turn(self, mock_app, mock_config):
+        agent_loop = AgentLoop(app=mock_app)
+
+        with Tracer.span("query", "agent_loop") as query:
+            agent_loop._query_span = query
+
+        await agent_loop.permission_response_queue.put("yes")
+        await agent_loop._can_use_tool(
+            tool_name="read_file",
+            tool_input={"path": "/tmp/test.txt"},
+            _context=MagicMock(),
+        )
+
+        [wait] = [span for span in Tracer.spans() if span.name == "permission_wait"]
+        assert wait.parent_id == query.span_id
+        assert wait.attributes == {"tools": ["read_file"]}
+
+
+class TestAgentLoopConfigReload:
+    def change(self, sections, **fields):
+        previous = AgentChatConfig(system_prompt="test", model="test-model")
+        config = previous.model_copy(update=fields)
+
+        return ConfigChange(previous, config, frozenset(sections))
+
+    async def test_applies_permissions_without_reconnecting(
+        self, mock_app, mock_sdk_client, mock_config
+    ):
+        agent_loop = AgentLoop(app=mock_app)
+        rule = PermissionRule(tool="Bash", action=PermissionAction.DENY)
+        change = self.change(
+            {"permissions"}, permissions=PermissionsConfig(rules=[rule])
+        )
+
+        await agent_loop._apply_config(change)
+
+        assert agent_loop.config.permissions.rules == [rule]
+        decision = agent_loop.permission_policy.evaluate("Bash", {})
+        assert decision.action is PermissionAction.DENY
+        assert agent_loop.query_queue.empty()
+
+    async def test_updates_mcp_servers_and_reconnects(
+        self, mock_app, mock_sdk_client, mock_config
+    ):
+        agent_loop = AgentLoop(app=mock_app)
+        agent_loop.mcp_manager = MagicMock(update_servers=AsyncMock())
+        servers = {"slack": MCPServerConfig(description="Slack", command="npx")}
+
+        await agent_loop._apply_config(
+            self.change({"mcp_servers"}, mcp_servers=servers)
+        )
+
+        agent_loop.mcp_manager.update_servers.assert_called_once_with(servers)
+        assert agent_loop.available_servers == servers
+        assert agent_loop.query_queue.get_nowait() == ControlCommand.RECONNECT
+
+    async def test_switches_model_in_place(
+        self, mock_app, mock_sdk_client, mock_config
+    ):
+        agent_loop = AgentLoop(app=mock_app)
+
+        await agent_loop._apply_config(self.change({"model"}, model="opus"))
+
+        command = agent_loop.query_queue.get_nowait()
+        assert command.command == ControlCommand.CHANGE_MODEL
+        assert command.model == "opus"
+        assert agent_loop.query_queue.empty()
+
+    async def test_applies_journal_and_log_settings_in_place(
+        self, mock_app, mock_sdk_client, mock_config, monkeypatch
+    ):
+        monkeypatch.setattr(logger, "_sample_rates", {})
+        agent_loop = AgentLoop(app=mock_app)
+        agent_loop.journal = MagicMock()
+
+        await agent_loop._apply_config(
+            self.change(
+                {"journal_fsync", "log_sample_rates"},
+                journal_fsync=JournalFsync.ALWAYS,
+                log_sample_rates={"permission_policy_decision": 10},
+            )
+        )
+
+        assert agent_loop.journal.fsync is JournalFsync.ALWAYS
+        assert logger._sample_rates == {"permission_policy_decision": 10}
+        assert agent_loop.query_queue.empty()
+        mock_app.actions.post_system_message.assert_not_called()
+
+    async def test_asks_for_a_restart_for_startup_settings(
+        self, mock_app, mock_sdk_client, mock_config
+    ):
+        agent_loop = AgentLoop(app=mock_app)
+
+        await agent_loop._apply_config(
+            self.change({"streaming", "trace_file"}, trace_file="trace.json")
+        )
+
+        mock_app.actions.post_system_message.assert_called_once_with(
+            "Restart the app to apply streaming, trace_file", thinking=False
+        )
+        assert agent_loop.query_queue.empty()
+
+    async def test_reconnect_resumes_the_session(
+        self, mock_app, mock_sdk_client, mock_config
+    ):
+        agent_loop = AgentLoop(app=mock_app)
+        loop_task = asyncio.create_task(agent_loop.start())
+        await asyncio.sleep(0.05)
+
+        agent_loop.session_id = "session-123"
+        await agent_loop.query_queue.put(ControlCommand.RECONNECT)
+        await asyncio.sleep(0.05)
+
+        options = mock_sdk_client.call_args_list[-2].kwargs["options"]
+        assert options.resume == "session-123"
+        assert mock_sdk_client.return_value.disconnect.called
+
+        await stop_loop(loop_task)
+
+    async def test_subscribes_to_config_changes_while_running(
+        self, mock_app, mock_sdk_client, mock_config
+    ):
+        agent_loop = AgentLoop(app=mock_app)
+        loop_task = asyncio.create_task(agent_loop.start())
+        await asyncio.sleep(0.05)
+
+        assert agent_loop._on_config_change in ConfigService._callbacks
+
+        await stop_loop(loop_task)
+
+        assert agent_loop._on_config_change not in ConfigService._callbacks
@@ -0,0 +1,78 @@
+from agent_chat_cli.core.conversation_store import (
+    ConversationEvent,
+    ConversationStore,
+    Message,
+)
+from agent_chat_cli.utils.enums import ConversationEventType, RoleType
+
+
+class TestMessage:
+    def test_append_joins_chunks(self):
+        message = Message(type=RoleType.AGENT, content="Hello")
+
+        message.append(" there")
+        message.append(", world")
+
+        assert message.content == "Hello there, world"
+
+    def test_empty_message_has_empty_content(self):
+        message = Message(type=RoleType.AGENT)
+
+        assert message.content == ""
+
+
+class TestConversationStore:
+    def test_add_returns_index(self):
+        store = ConversationStore()
+
+        first = store.add(Message(type=RoleType.USER, content="Hi"))
+        second = store.add(Message(type=RoleType.AGENT, content="Hello"))
+
+        assert (first, second) == (0, 1)
+        assert store[1].content == "Hello"
+        assert len(store) == 2
+
+    def test_append_extends_message(self):
+        store = ConversationStore()
+        index = store.add(Message(type=RoleType.AGENT, content="Hello"))
+
+        store.append(index, " world")
+
+        assert store.messages[0].content == "Hello world"
+
+    def test_notifies_subscribers(self):
+        store = ConversationStore()
+        events: list[ConversationEvent] = []
+        store.subscribe(events.append)
+
+        index = store.add(Message(type=RoleType.AGENT, content="Hello"))
+        store.append(index, " world")
+        store.append(index, "")
+        store.clear()
+
+        assert [event.type for event in events] == [
+            ConversationEventType.ADDED,
+            ConversationEventType.APPENDED,
+            ConversationEventType.CLEARED,
+        ]
+        assert events[1].text == " world"
+
+    def test_unsubscribe_stops_notifications(self):
+        store = ConversationStore()
+        events: list[ConversationEvent] = []
+        store.subscribe(events.append)
+        store.unsubscribe(events.append)
+
+        store.add(Message(type=RoleType.USER, content="Hi"))
+
+        assert events == []
+
+    def test_clear_resets_session(self):
+        store = ConversationStore()
+        store.session_id = "session-123"
+        store.add(Message(type=RoleType.USER, content="Hi"))
+
+        store.clear()
+
+        assert store.messages == []
+        assert store.session_id is None
@@ -0,0 +1,89 @@
+import asyncio
+
+from agent_chat_cli.core.agent_loop import AppEvent
+from agent_chat_cli.core.event_queue import EventQueue
+from agent_chat_cli.utils.enums import AppEventType
+
+
+def stream(text: str) -> AppEvent:
+    return AppEvent(type=AppEventType.STREAM_EVENT, data={"text": text})
+
+
+class TestEventQueue:
+    async def test_delivers_events_in_order(self):
+        queue = EventQueue()
+
+        await queue.put(stream("Hello"))
+        await queue.put(AppEvent(type=AppEventType.RESULT, data=None))
+
+        assert (await queue.get()).type == AppEventType.STREAM_EVENT
+        assert (await queue.get()).type == AppEventType.RESULT
+
+    async def test_merges_pending_stream_events(self):
+        queue = EventQueue()
+
+        await queue.put(stream("Hello"))
+        await queue.put(stream(" there"))
+        await queue.put(stream(", world"))
+
+        event = await queue.get()
+
+        assert event.data == {"text": "Hello there, world"}
+        assert queue.depth == 0
+        assert queue.merged == 2
+
+    async def test_does_not_merge_across_other_events(self):
+        queue = EventQueue()
+
+        await queue.put(stream("Hello"))
+        await queue.put(AppEvent(type=AppEventType.ASSISTANT, data={"content": []}))
+        await queue.put(stream("world"))
+
+        assert queue.depth == 3
+
+    async def test_blocks_producer_when_full(self):
+        queue = EventQueue(max_size=1)
+        await queue.put(AppEvent(type=AppEventType.SYSTEM, data="first"))
+
+        producer = asyncio.create_task(
+            queue.put(AppEvent(type=AppEventType.SYSTEM, data="second"))
+        )
+        await asyncio.sleep(0.01)
+
+        assert not producer.done()
+        assert (await queue.get()).data == "first"
+
+        await asyncio.wait_for(producer, timeout=1)
+
+        assert (await queue.get()).data == "second"
+        assert queue.producer_waits == 1
+
+    async def test_stream_events_merge_even_when_full(self):
+        queue = EventQueue(max_size=1)
+        await queue.put(stream("Hello"))
+
+        await asyncio.wait_for(queue.put(stream(" world")), timeout=1)
+
+        assert (await queue.get()).data == {"text": "Hello world"}
+
+    async def test_consumer_waits_for_events(self):
+        queue = EventQueue()
+        consumer = asyncio.create_task(queue.get())
+        await asyncio.sleep(0.01)
+
+        assert not consumer.done()
+
+        await queue.put(stream("Hello"))
+
+        assert (await asyncio.wait_for(consumer, timeout=1)).data == {"text": "Hello"}
+
+    async def test_tracks_high_water(self):
+        queue = EventQueue()
+
+        for index in range(5):
+            await queue.put(AppEvent(type=AppEventType.SYSTEM, data=str(index)))
+
+        await queue.get()
+
+        assert queue.stats()["high_water"] == 5
+        assert queue.stats()["depth"] == 4
@@ -0,0 +1,371 @@
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+from agent_chat_cli.core.mcp_manager import RELAY_SCRIPT, MCPManager
+from agent_chat_cli.utils import mcp_schema_cache
+from agent_chat_cli.utils.config import MCPServerConfig
+from agent_chat_cli.utils.enums import MCPStartMode, TimelineStatus
+from agent_chat_cli.utils.mcp_server_status import MCPServerStatus
+from agent_chat_cli.utils.startup_timeline import StartupTimeline
+
+FAKE_SERVER = Path(__file__).parent.parent / "fixtures" / "fake_mcp_server.py"
+
+
+class RelayClient:
+    """Talks to a managed server the way the Claude CLI does: via the relay."""
+
+    def __init__(self, config: dict) -> None:
+        self.config = config
+        self.process: asyncio.subprocess.Process
+        self._ids = 0
+
+    async def __aenter__(self) -> "RelayClient":
+        self.process = await asyncio.create_subprocess_exec(
+            self.config["command"],
+            *self.config["args"],
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+        )
+        return self
+
+    async def __aexit__(self, *_) -> None:
+        assert self.process.stdin is not None
+        self.process.stdin.close()
+        await self.process.wait()
+
+    def send(self, method: str, params: dict | None = None) -> int:
+        assert self.process.stdin is not None
+
+        self._ids += 1
+        message = {"jsonrpc": "2.0", "id": self._ids, "method": method}
+        self.process.stdin.write(
+            json.dumps({**message, "params": params or {}}).encode() + b"\n"
+        )
+        return self._ids
+
+    async def request(self, method: str, params: dict | None = None) -> dict:
+        request_id = self.send(method, params)
+        response = await self.read()
+
+        assert response["id"] == request_id
+        return response
+
+    async def read(self) -> dict:
+        assert self.process.stdout is not None
+
+        async with asyncio.timeout(10):
+            return json.loads(await self.process.stdout.readline())
+
+    async def call_tool(self, name: str) -> dict:
+        return await self.request("tools/call", {"name": name, "arguments": {}})
+
+
+def fake_server(
+    start: MCPStartMode = MCPStartMode.EAGER,
+    delay: float = 0,
+    connect_timeout: float = 10.0,
+) -> MCPServerConfig:
+    return MCPServerConfig(
+        description="Fake server",
+        command=sys.executable,
+        args=[str(FAKE_SERVER)],
+        env={"FAKE_MCP_DELAY": str(delay)},
+        start=start,
+        connect_timeout=connect_timeout,
+    )
+
+
+@pytest.fixture(autouse=True)
+def reset_status():
+    MCPServerStatus._mcp_servers = []
+    StartupTimeline._entries = {}
+    yield
+    MCPServerStatus._mcp_servers = []
+    StartupTimeline._entries = {}
+
+
+@pytest.fixture(autouse=True)
+def schema_cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(mcp_schema_cache, "MCP_SCHEMA_CACHE_DIR", tmp_path / "cache")
+    return tmp_path / "cache"
+
+
+@pytest.fixture
+async def manager():
+    manager = MCPManager({"fake": fake_server()})
+
+    await manager.start()
+    await manager.wait_connected()
+    yield manager
+    await manager.stop()
+
+
+class TestMCPManager:
+    async def test_starts_each_server_once(self, manager):
+        server = manager.servers["fake"]
+
+        assert server.is_ready
+        assert server.initialize_result["serverInfo"]["name"] == "fake"
+
+    async def test_points_clients_at_the_relay(self, manager):
+        config = manager.sdk_servers()["fake"]
+
+        assert config["type"] == "stdio"
+        assert config["args"] == [RELAY_SCRIPT, manager.socket_path, "fake"]
+
+    async def test_clients_share_the_running_server(self, manager):
+        config = manager.sdk_servers()["fake"]
+        pid = str(manager.servers["fake"].pid)
+
+        for _ in range(2):
+            async with RelayClient(config) as client:
+                response = await client.request(
+                    "initialize", {"protocolVersion": "2025-06-18"}
+                )
+                assert response["result"]["serverInfo"]["name"] == "fake"
+
+                response = await client.call_tool("pid")
+                assert response["result"]["content"][0]["text"] == pid
+
+        assert manager.servers["fake"].restarts == 0
+
+    async def test_concurrent_clients_keep_their_own_ids(self, manager):
+        config = manager.sdk_servers()["fake"]
+
+        async with RelayClient(config) as first, RelayClient(config) as second:
+            await first.request("initialize")
+            await second.request("initialize")
+
+            responses = await asyncio.gather(
+                first.request("tools/list"), second.request("tools/list")
+            )
+
+        assert all(len(response["result"]["tools"]) == 2 for response in responses)
+
+    async def test_restarts_a_crashed_server(self, manager):
+        server = manager.servers["fake"]
+        server.RESTART_DELAY = 0
+        pid = server.pid
+
+        async with RelayClient(manager.sdk_servers()["fake"]) as client:
+            await client.request("initialize")
+
+            response = await client.call_tool("crash")
+            assert "error" in response
+
+            response = await client.call_tool("pid")
+            assert response["result"]["content"][0]["text"] != str(pid)
+
+        assert server.restarts == 1
+
+    async def test_stable_uptime_resets_the_restart_count(self, manager):
+        server = manager.servers["fake"]
+        server.RESTART_DELAY = 0
+        server.STABLE_UPTIME = 0
+        server.restarts = server.MAX_RESTARTS
+
+        async with RelayClient(manager.sdk_servers()["fake"]) as client:
+            await client.request("initialize")
+            await client.call_tool("crash")
+
+            response = await client.call_tool("pid")
+            assert response["result"]["content"][0]["text"] == str(server.pid)
+
+        assert server.restarts == 1
+
+    async def test_stop_terminates_servers(self, manager):
+        server = manager.servers["fake"]
+
+        await manager.stop()
+
+        assert server.pid is None
+        assert manager.sdk_servers() == {}
+
+    async def test_update_servers_keeps_unchanged_servers_running(self, manager):
+        server = manager.servers["fake"]
+        pid = server.pid
+
+        await manager.update_servers({"fake": fake_server(), "other": fake_server()})
+        await manager.wait_connected()
+
+        assert manager.servers["fake"] is server
+        assert server.pid == pid
+        assert manager.servers["other"].is_ready
+        assert set(manager.sdk_servers()) == {"fake", "other"}
+
+    async def test_update_servers_stops_removed_and_changed_servers(self, manager):
+        server = manager.servers["fake"]
+
+        await manager.update_servers({"fake": fake_server(delay=0.01)})
+        await manager.wait_connected()
+
+        assert server.pid is None
+        assert manager.servers["fake"] is not server
+        assert manager.servers["fake"].is_ready
+
+        await manager.update_servers({})
+
+        assert manager.sdk_servers() == {}
+
+    async def test_unavailable_server_fails_initialize(self):
+        manager = MCPManager(
+            {
+                "missing": MCPServerConfig(
+                    description="Missing server", command="definitely-not-a-command"
+                )
+            }
+        )
+
+        await manager.start()
+
+        try:
+            async with RelayClient(manager.sdk_servers()["missing"]) as client:
+                response = await client.request("initialize")
+        finally:
+            await manager.stop()
+
+        assert response["error"]["message"] == "missing is unavailable"
+
+
+class TestMCPManagerLazyStart:
+    async def test_first_run_starts_and_caches_schema(self, schema_cache_dir):
+        manager = MCPManager({"fake": fake_server(MCPStartMode.LAZY)})
+
+        await manager.start()
+        await manager.wait_connected()
+        server = manager.servers["fake"]
+        await server._schema_task
+
+        try:
+            assert server.pid is not None
+            assert (schema_cache_dir / "fake.json").exists()
+        finally:
+            await manager.stop()
+
+    async def test_serves_cached_schema_without_launching(self):
+        # A previous run records the schema
+        manager = MCPManager({"fake": fake_server()})
+        await manager.start()
+        await manager.wait_connected()
+        await manager.servers["fake"]._schema_task
+        await manager.stop()
+        StartupTimeline._entries = {}
+
+        manager = MCPManager({"fake": fake_server(MCPStartMode.LAZY)})
+        await manager.start()
+        server = manager.servers["fake"]
+
+        try:
+            async with RelayClient(manager.sdk_servers()["fake"]) as client:
+                response = await client.request("initialize")
+                assert response["result"]["serverInfo"]["name"] == "fake"
+
+                response = await client.request("tools/list")
+                assert [tool["name"] for tool in response["result"]["tools"]] == [
+                    "pid",
+                    "crash",
+                ]
+
+                assert server.pid is None
+
+                response = await client.call_tool("pid")
+                assert response["result"]["content"][0]["text"] == str(server.pid)
+        finally:
+            await manager.stop()
+
+        assert server.first_call_ms is not None and server.first_call_ms > 0
+        assert StartupTimeline.entries()[0].status is TimelineStatus.LAZY
+
+    async def test_launch_does_not_hold_up_later_messages(self):
+        manager = MCPManager({"fake": fake_server(delay=0.5)})
+        await manager.start()
+        await manager.wait_connected()
+        await manager.servers["fake"]._schema_task
+        await manager.stop()
+
+        manager = MCPManager({"fake": fake_server(MCPStartMode.LAZY, delay=0.5)})
+        await manager.start()
+
+        try:
+            async with RelayClient(manager.sdk_servers()["fake"]) as client:
+                await client.request("initialize")
+
+                # The call launches the server; the ping behind it is answered
+                # from the cache before the launch is done
+                call_id = client.send("tools/call", {"name": "pid", "arguments": {}})
+                ping = await client.request("ping")
+                call = await client.read()
+
+                assert ping["result"] == {}
+                assert call["id"] == call_id and "result" in call
+        finally:
+            await manager.stop()
+
+
+class TestMCPManagerStartup:
+    async def test_starts_servers_concurrently(self):
+        manager = MCPManager(
+            {name: fake_server(delay=0.5) for name in ("first", "second", "third")}
+        )
+
+        started = asyncio.get_running_loop().time()
+        await manager.start()
+        await manager.wait_connected()
+        elapsed = asyncio.get_running_loop().time() - started
+
+        try:
+            assert all(server.is_ready for server in manager.servers.values())
+            assert elapsed < 1.2
+        finally:
+            await manager.stop()
+
+    async def test_stop_cancels_a_launch_in_progress(self):
+        manager = MCPManager({"slow": fake_server(delay=5)})
+        server = manager.servers["slow"]
+
+        # Stopped before the process has even been spawned
+        await manager.start()
+        await manager.stop()
+
+        assert server._launch_task is not None and server._launch_task.done()
+        assert server.pid is None
+
+    async def test_records_startup_timeline(self, manager):
+        [entry] = StartupTimeline.entries()
+
+        assert entry.name == "fake"
+        assert entry.status is TimelineStatus.OK
+        assert set(entry.phases) == {"spawn", "handshake"}
+        assert MCPServerStatus.is_connected("fake")
+
+    async def test_degrades_slow_server_and_attaches_it_later(self):
+        manager = MCPManager({"slow": fake_server(delay=1, connect_timeout=0.2)})
+        await manager.start()
+        server = manager.servers["slow"]
+
+        try:
+            async with RelayClient(manager.sdk_servers()["slow"]) as client:
+                response = await client.request("initialize")
+                assert response["result"]["capabilities"]["tools"]["listChanged"]
+
+                response = await client.request("tools/list")
+                assert response["result"]["tools"] == []
+
+                assert server.degraded
+                assert MCPServerStatus.get_status("slow") == "pending"
+                assert StartupTimeline.entries()[0].status is TimelineStatus.TIMEOUT
+
+                notification = await client.read()
+                assert notification["method"] == "notifications/tools/list_changed"
+
+                response = await client.request("tools/list")
+                assert len(response["result"]["tools"]) == 2
+        finally:
+            await manager.stop()
+
+        assert MCPServerStatus.is_connected("slow")
+        assert StartupTimeline.entries()[0].status is TimelineStatus.LATE
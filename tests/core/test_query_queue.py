@@ -0,0 +1,87 @@
+import asyncio
+
+import pytest
+
+from agent_chat_cli.core.query_queue import QueryQueue, coalesce_prompts
+from agent_chat_cli.utils.enums import ControlCommand
+
+
+class TestQueryQueue:
+    async def test_lists_pending_prompts_only(self):
+        queue = QueryQueue()
+        await queue.put("first")
+        await queue.put(ControlCommand.NEW_CONVERSATION)
+        await queue.put("second")
+
+        assert queue.pending_prompts() == ["first", "second"]
+
+    async def test_cancels_a_prompt_by_position(self):
+        queue = QueryQueue()
+        for prompt in ("same", "same", "other"):
+            await queue.put(prompt)
+
+        assert queue.cancel_prompt(1) == "same"
+        assert queue.pending_prompts() == ["same", "other"]
+        assert queue.qsize() == 2
+
+    async def test_cancel_out_of_range_is_ignored(self):
+        queue = QueryQueue()
+        await queue.put("only")
+
+        assert queue.cancel_prompt(3) is None
+        assert queue.pending_prompts() == ["only"]
+
+    async def test_takes_prompts_up_to_the_next_command(self):
+        queue = QueryQueue()
+        await queue.put("first")
+        await queue.put("second")
+        await queue.put(ControlCommand.NEW_CONVERSATION)
+        await queue.put("third")
+
+        assert queue.take_prompts() == ["first", "second"]
+        assert await queue.get() is ControlCommand.NEW_CONVERSATION
+        assert queue.take_prompts() == ["third"]
+
+    async def test_get_waits_for_the_next_item(self):
+        queue = QueryQueue()
+        getter = asyncio.create_task(queue.get())
+        await asyncio.sleep(0)
+
+        assert not getter.done()
+
+        await queue.put("first")
+
+        assert await getter == "first"
+        assert queue.empty()
+
+        with pytest.raises(asyncio.QueueEmpty):
+            queue.get_nowait()
+
+    async def test_notifies_subscribers_of_changes(self):
+        queue = QueryQueue()
+        sizes = []
+
+        def callback():
+            sizes.append(len(queue.pending_prompts()))
+
+        queue.subscribe(callback)
+        await queue.put("first")
+        await queue.put("second")
+        queue.cancel_prompt(0)
+        await queue.get()
+        queue.unsubscribe(callback)
+        await queue.put("ignored")
+
+        assert sizes == [1, 2, 1, 0]
+
+
+class TestCoalescePrompts:
+    def test_single_prompt_is_unchanged(self):
+        assert coalesce_prompts(["hello"]) == "hello"
+
+    def test_keeps_order_and_boundaries(self):
+        merged = coalesce_prompts(["first", "second\nline"])
+
+        assert merged.index("[Message 1]\nfirst") < merged.index(
+            "[Message 2]\nsecond\nline"
+        )
@@ -2,6 +2,7 @@ import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from agent_chat_cli.app import AgentChatCLIApp
+from agent_chat_cli.components.thinking_indicator import ThinkingIndicator
 from agent_chat_cli.core.agent_loop import AppEvent
 from agent_chat_cli.utils.enums import AppEventType, ContentType
 
@@ -24,6 +25,59 @@ def mock_config():
         yield mock
 
 
+def streamed_text(app: AgentChatCLIApp) -> str:
+    stream = app.renderer._stream
+
+    if stream.index is None:
+        return ""
+
+    return app.conversation[stream.index].content + "".join(stream.chunks)
+
+
+class TestRendererConsumer:
+    async def test_keeps_rendering_after_an_event_fails(
+        self, mock_agent_loop, mock_config
+    ):
+        app = AgentChatCLIApp()
+        async with app.run_test() as pilot:
+            with (
+                patch("agent_chat_cli.core.renderer.log_json") as log_json,
+                patch.object(
+                    app.renderer,
+                    "_render_system_message",
+                    side_effect=RuntimeError("boom"),
+                ),
+            ):
+                await app.renderer.events.put(
+                    AppEvent(type=AppEventType.SYSTEM, data="Hello")
+                )
+                await app.renderer.events.put(
+                    AppEvent(type=AppEventType.STREAM_EVENT, data={"text": "Hi"})
+                )
+                await pilot.pause()
+
+            assert streamed_text(app) == "Hi"
+            log_json.assert_any_call(
+                {
+                    "event": "render_failed",
+                    "type": "system",
+                    "error": "RuntimeError('boom')",
+                }
+            )
+
+    async def test_background_tasks_are_kept_until_unmount(
+        self, mock_agent_loop, mock_config
+    ):
+        app = AgentChatCLIApp()
+        async with app.run_test():
+            tasks = set(app._tasks)
+
+            # The renderer and config watch run for as long as the app does
+            assert len([task for task in tasks if not task.done()]) == 2
+
+        assert all(task.done() for task in tasks)
+
+
 class TestRendererRenderMessage:
     async def test_handles_stream_event(self, mock_agent_loop, mock_config):
         app = AgentChatCLIApp()
@@ -35,7 +89,7 @@ class TestRendererRenderMessage:
 
             await app.renderer.handle_app_event(message)
 
-            assert app.renderer._stream.text == "Hello"
+            assert streamed_text(app) == "Hello"
 
     async def test_accumulates_stream_chunks(self, mock_agent_loop, mock_config):
         app = AgentChatCLIApp()
@@ -47,14 +101,18 @@ class TestRendererRenderMessage:
                 AppEvent(type=AppEventType.STREAM_EVENT, data={"text": "world"})
             )
 
-            assert app.renderer._stream.text == "Hello world"
+            assert streamed_text(app) == "Hello world"
 
     async def test_handles_tool_permission_request(self, mock_agent_loop, mock_config):
         app = AgentChatCLIApp()
         async with app.run_test():
             message = AppEvent(
                 type=AppEventType.TOOL_PERMISSION_REQUEST,
-                data={"tool_name": "read_file", "tool_input": {"path": "/tmp"}},
+                data={
+                    "requests": [
+                        {"tool_name": "read_file", "tool_input": {"path": "/tmp"}}
+                    ]
+                },
             )
 
             await app.renderer.handle_app_event(message)
@@ -78,8 +136,43 @@ class TestRendererRenderMessage:
                 AppEvent(type=AppEventType.RESULT, data=None)
             )
 
-            assert app.renderer._stream.widget is None
-            assert app.renderer._stream.text == ""
+            assert app.renderer._stream.index is None
+            assert streamed_text(app) == ""
+
+    async def test_result_shows_turn_summary(self, mock_agent_loop, mock_config):
+        from agent_chat_cli.components.turn_summary import TurnSummary
+
+        app = AgentChatCLIApp()
+        async with app.run_test():
+            turn_summary = app.query_one(TurnSummary)
+            assert turn_summary.display is False
+
+            app.ui_state.start_thinking()
+            await app.renderer.handle_app_event(
+                AppEvent(type=AppEventType.RESULT, data={"summary": "1.2s total"})
+            )
+
+            assert turn_summary.text == "1.2s total"
+            assert turn_summary.display is True
+
+            app.ui_state.start_thinking()
+
+            assert turn_summary.display is False
+
+    async def test_turn_summary_is_shown_before_a_queued_prompt(
+        self, mock_agent_loop, mock_config
+    ):
+        from agent_chat_cli.components.turn_summary import TurnSummary
+
+        mock_agent_loop.query_queue.empty.return_value = False
+
+        app = AgentChatCLIApp()
+        async with app.run_test():
+            await app.renderer.handle_app_event(
+                AppEvent(type=AppEventType.RESULT, data={"summary": "1.2s total"})
+            )
+
+            assert app.query_one(TurnSummary).text == "1.2s total"
 
     async def test_handles_assistant_with_tool_use(self, mock_agent_loop, mock_config):
         app = AgentChatCLIApp()
@@ -99,7 +192,7 @@ class TestRendererRenderMessage:
 
             await app.renderer.handle_app_event(message)
 
-            assert app.renderer._stream.widget is None
+            assert app.renderer._stream.index is None
 
     async def test_ignores_empty_stream_chunks(self, mock_agent_loop, mock_config):
         app = AgentChatCLIApp()
@@ -108,5 +201,97 @@ class TestRendererRenderMessage:
                 AppEvent(type=AppEventType.STREAM_EVENT, data={"text": ""})
             )
 
-            assert app.renderer._stream.text == ""
-            assert app.renderer._stream.widget is None
+            assert streamed_text(app) == ""
+            assert app.renderer._stream.index is None
+
+
+class TestRendererEventQueue:
+    async def test_renders_events_posted_through_actions(
+        self, mock_agent_loop, mock_config
+    ):
+        app = AgentChatCLIApp()
+        async with app.run_test() as pilot:
+            await app.actions.post_app_event(
+                AppEvent(type=AppEventType.STREAM_EVENT, data={"text": "Hello"})
+            )
+            await pilot.pause()
+
+            assert streamed_text(app) == "Hello"
+            assert app.renderer.events.depth == 0
+
+    async def test_system_messages_keep_their_place_in_the_stream(
+        self, mock_agent_loop, mock_config
+    ):
+        app = AgentChatCLIApp()
+        async with app.run_test() as pilot:
+            await app.actions.post_app_event(
+                AppEvent(type=AppEventType.STREAM_EVENT, data={"text": "Before"})
+            )
+            await app.actions.post_system_message("Notice", thinking=False)
+            await app.actions.post_app_event(
+                AppEvent(type=AppEventType.STREAM_EVENT, data={"text": "After"})
+            )
+            await pilot.pause()
+
+            assert [message.content for message in app.conversation.messages] == [
+                "Before",
+                "Notice",
+                "After",
+            ]
+            assert app.query_one(ThinkingIndicator).is_thinking is False
+
+
+class TestRendererStreamCoalescing:
+    async def test_renders_first_chunk_immediately(self, mock_agent_loop, mock_config):
+        app = AgentChatCLIApp()
+        async with app.run_test():
+            await app.renderer.handle_app_event(
+                AppEvent(type=AppEventType.STREAM_EVENT, data={"text": "Hello"})
+            )
+
+            assert streamed_text(app) == "Hello"
+
+    async def test_coalesces_chunks_until_next_frame(
+        self, mock_agent_loop, mock_config
+    ):
+        app = AgentChatCLIApp()
+        async with app.run_test() as pilot:
+            await app.renderer.handle_app_event(
+                AppEvent(type=AppEventType.STREAM_EVENT, data={"text": "Hello"})
+            )
+
+            with patch.object(
+                app.renderer, "_flush_stream", wraps=app.renderer._flush_stream
+            ) as flush:
+                app.renderer._coalescer._flush = flush
+
+                for chunk in [" there", ",", " world"]:
+                    await app.renderer.handle_app_event(
+                        AppEvent(type=AppEventType.STREAM_EVENT, data={"text": chunk})
+                    )
+
+                message = app.conversation[app.renderer._stream.index]
+                assert message.content == "Hello"
+
+                await pilot.pause(0.1)
+
+                assert flush.call_count == 1
+                assert message.content == "Hello there, world"
+
+    async def test_result_flushes_pending_chunks(self, mock_agent_loop, mock_config):
+        app = AgentChatCLIApp()
+        async with app.run_test():
+            await app.renderer.handle_app_event(
+                AppEvent(type=AppEventType.STREAM_EVENT, data={"text": "Hello"})
+            )
+            await app.renderer.handle_app_event(
+                AppEvent(type=AppEventType.STREAM_EVENT, data={"text": " world"})
+            )
+            message = app.conversation[app.renderer._stream.index]
+
+            await app.renderer.handle_app_event(
+                AppEvent(type=AppEventType.RESULT, data=None)
+            )
+
+            assert message.content == "Hello world"
+            assert app.renderer._coalescer.pending is False
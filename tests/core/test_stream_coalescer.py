@@ -0,0 +1,119 @@
+import asyncio
+from unittest.mock import patch
+
+from agent_chat_cli.core.stream_coalescer import StreamCoalescer
+
+
+class FlushRecorder:
+    def __init__(self):
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+
+
+class TestStreamCoalescer:
+    async def test_coalesces_notifications_into_one_flush(self):
+        flush = FlushRecorder()
+        coalescer = StreamCoalescer(flush=flush, target_fps=30, max_latency=0.05)
+
+        for _ in range(100):
+            coalescer.notify()
+
+        await asyncio.sleep(0.08)
+
+        assert flush.calls == 1
+        assert coalescer.pending is False
+
+    async def test_waits_for_next_frame_after_flush(self):
+        flush = FlushRecorder()
+        coalescer = StreamCoalescer(flush=flush, target_fps=10, max_latency=1.0)
+
+        await coalescer.flush()
+        coalescer.notify()
+
+        await asyncio.sleep(0.03)
+        assert flush.calls == 1
+
+        await asyncio.sleep(0.1)
+        assert flush.calls == 2
+
+    async def test_max_latency_caps_frame_interval(self):
+        flush = FlushRecorder()
+        coalescer = StreamCoalescer(flush=flush, target_fps=1, max_latency=0.02)
+
+        await coalescer.flush()
+        coalescer.notify()
+
+        await asyncio.sleep(0.06)
+
+        assert flush.calls == 2
+
+    async def test_explicit_flush_cancels_scheduled_flush(self):
+        flush = FlushRecorder()
+        coalescer = StreamCoalescer(flush=flush, target_fps=30, max_latency=0.05)
+
+        coalescer.notify()
+        await coalescer.flush()
+        await asyncio.sleep(0.08)
+
+        assert flush.calls == 1
+
+    async def test_cancel_drops_scheduled_flush(self):
+        flush = FlushRecorder()
+        coalescer = StreamCoalescer(flush=flush, target_fps=30, max_latency=0.05)
+
+        coalescer.notify()
+        coalescer.cancel()
+        await asyncio.sleep(0.08)
+
+        assert flush.calls == 0
+
+    async def test_flush_waits_for_a_timed_flush_in_progress(self):
+        order = []
+
+        async def slow_flush():
+            order.append("start")
+            await asyncio.sleep(0.02)
+            order.append("end")
+
+        coalescer = StreamCoalescer(flush=slow_flush, target_fps=30, max_latency=0)
+
+        coalescer.notify()
+        await asyncio.sleep(0.005)
+        assert coalescer.pending is True
+
+        await coalescer.flush()
+
+        assert order == ["start", "end", "start", "end"]
+        assert coalescer.pending is False
+
+    async def test_cancel_stops_a_timed_flush_in_progress(self):
+        flush = FlushRecorder()
+
+        async def slow_flush():
+            await asyncio.sleep(0.02)
+            await flush()
+
+        coalescer = StreamCoalescer(flush=slow_flush, target_fps=30, max_latency=0)
+
+        coalescer.notify()
+        await asyncio.sleep(0.005)
+        coalescer.cancel()
+        await asyncio.sleep(0.04)
+
+        assert flush.calls == 0
+
+    async def test_logs_a_failed_timed_flush(self):
+        async def failing_flush():
+            raise RuntimeError("boom")
+
+        coalescer = StreamCoalescer(flush=failing_flush, target_fps=30, max_latency=0)
+
+        with patch("agent_chat_cli.core.stream_coalescer.log_json") as log_json:
+            coalescer.notify()
+            await asyncio.sleep(0.01)
+
+        log_json.assert_called_once_with(
+            {"event": "stream_flush_failed", "error": "RuntimeError('boom')"}
+        )
@@ -1,9 +1,12 @@
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
+from textual.containers import VerticalScroll
 from textual.widgets import TextArea
 
 from agent_chat_cli.app import AgentChatCLIApp
+from agent_chat_cli.components.chat_history import ChatHistory
+from agent_chat_cli.components.messages import Message, RoleType
 from agent_chat_cli.components.thinking_indicator import ThinkingIndicator
 from agent_chat_cli.components.tool_permission_prompt import ToolPermissionPrompt
 from agent_chat_cli.components.user_input import UserInput
@@ -27,22 +30,6 @@ def mock_config():
         yield mock
 
 
-class TestUIStateInterrupting:
-    async def test_initially_false(self, mock_agent_loop, mock_config):
-        app = AgentChatCLIApp()
-        async with app.run_test():
-            assert app.ui_state.interrupting is False
-
-    async def test_set_interrupting(self, mock_agent_loop, mock_config):
-        app = AgentChatCLIApp()
-        async with app.run_test():
-            app.ui_state.set_interrupting(True)
-            assert app.ui_state.interrupting is True
-
-            app.ui_state.set_interrupting(False)
-            assert app.ui_state.interrupting is False
-
-
 class TestUIStateThinking:
     async def test_start_thinking_shows_indicator(self, mock_agent_loop, mock_config):
         app = AgentChatCLIApp()
@@ -99,21 +86,23 @@ class TestUIStatePermissionPrompt:
         app = AgentChatCLIApp()
         async with app.run_test():
             app.ui_state.show_permission_prompt(
-                tool_name="test_tool",
-                tool_input={"key": "value"},
+                [{"tool_name": "test_tool", "tool_input": {"key": "value"}}]
             )
 
             prompt = app.query_one(ToolPermissionPrompt)
             assert prompt.is_visible is True
-            assert prompt.tool_name == "test_tool"
-            assert prompt.tool_input == {"key": "value"}
+            assert prompt.requests == [
+                {"tool_name": "test_tool", "tool_input": {"key": "value"}}
+            ]
 
     async def test_show_permission_prompt_hides_user_input(
         self, mock_agent_loop, mock_config
     ):
         app = AgentChatCLIApp()
         async with app.run_test():
-            app.ui_state.show_permission_prompt(tool_name="test", tool_input={})
+            app.ui_state.show_permission_prompt(
+                [{"tool_name": "test", "tool_input": {}}]
+            )
 
             user_input = app.query_one(UserInput)
             assert user_input.display is False
@@ -124,7 +113,9 @@ class TestUIStatePermissionPrompt:
         app = AgentChatCLIApp()
         async with app.run_test():
             app.ui_state.start_thinking()
-            app.ui_state.show_permission_prompt(tool_name="test", tool_input={})
+            app.ui_state.show_permission_prompt(
+                [{"tool_name": "test", "tool_input": {}}]
+            )
 
             indicator = app.query_one(ThinkingIndicator)
             assert indicator.is_thinking is False
@@ -132,7 +123,9 @@ class TestUIStatePermissionPrompt:
     async def test_hide_permission_prompt(self, mock_agent_loop, mock_config):
         app = AgentChatCLIApp()
         async with app.run_test():
-            app.ui_state.show_permission_prompt(tool_name="test", tool_input={})
+            app.ui_state.show_permission_prompt(
+                [{"tool_name": "test", "tool_input": {}}]
+            )
             app.ui_state.hide_permission_prompt()
 
             prompt = app.query_one(ToolPermissionPrompt)
@@ -174,3 +167,63 @@ class TestUIStateModelMenu:
 
             model_menu = app.query_one(ModelSelectionMenu)
             assert model_menu.is_visible is True
+
+
+class TestUIStateScrollToBottom:
+    async def _fill_history(self, app, pilot, count=30):
+        chat_history = app.query_one(ChatHistory)
+        for index in range(count):
+            chat_history.add_message(
+                Message(type=RoleType.SYSTEM, content=f"Message {index}")
+            )
+        app.ui_state.scroll_to_bottom()
+        await pilot.pause()
+
+    async def test_scrolls_to_end_after_refresh(self, mock_agent_loop, mock_config):
+        app = AgentChatCLIApp()
+        async with app.run_test() as pilot:
+            await self._fill_history(app, pilot)
+
+            container = app.query_one(VerticalScroll)
+            assert container.max_scroll_y > 0
+            assert container.scroll_y == container.max_scroll_y
+
+    async def test_does_not_follow_when_scrolled_up(self, mock_agent_loop, mock_config):
+        app = AgentChatCLIApp()
+        async with app.run_test() as pilot:
+            await self._fill_history(app, pilot)
+            container = app.query_one(VerticalScroll)
+            container.scroll_home(animate=False, immediate=True)
+            await pilot.pause()
+
+            await self._fill_history(app, pilot, count=5)
+
+            assert app.ui_state.scroll.is_pinned is False
+            assert container.scroll_y == 0
+
+    async def test_force_repins_to_bottom(self, mock_agent_loop, mock_config):
+        app = AgentChatCLIApp()
+        async with app.run_test() as pilot:
+            await self._fill_history(app, pilot)
+            container = app.query_one(VerticalScroll)
+            container.scroll_home(animate=False, immediate=True)
+            await pilot.pause()
+
+            app.ui_state.scroll_to_bottom(force=True)
+            await pilot.pause()
+
+            assert app.ui_state.scroll.is_pinned is True
+            assert container.scroll_y == container.max_scroll_y
+
+    async def test_debounces_burst_of_requests(self, mock_agent_loop, mock_config):
+        app = AgentChatCLIApp()
+        async with app.run_test() as pilot:
+            container = app.query_one(VerticalScroll)
+
+            with patch.object(container, "call_after_refresh") as call_after_refresh:
+                for _ in range(50):
+                    app.ui_state.scroll_to_bottom()
+
+                assert call_after_refresh.call_count == 1
+
+            await pilot.pause()
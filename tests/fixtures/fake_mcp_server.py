@@ -0,0 +1,37 @@
+"""Minimal stdio MCP server used by the MCPManager tests."""
+
+import json
+import os
+import sys
+import time
+
+TOOLS = [
+    {"name": "pid", "inputSchema": {"type": "object"}},
+    {"name": "crash", "inputSchema": {"type": "object"}},
+]
+
+for line in sys.stdin:
+    message = json.loads(line)
+
+    if "id" not in message:
+        continue
+
+    method = message["method"]
+
+    if method == "initialize":
+        time.sleep(float(os.environ.get("FAKE_MCP_DELAY", "0")))
+
+        result = {
+            "protocolVersion": message["params"]["protocolVersion"],
+            "capabilities": {"tools": {}},
+            "serverInfo": {"name": "fake", "version": "1.0.0"},
+        }
+    elif method == "tools/list":
+        result = {"tools": TOOLS}
+    elif message["params"]["name"] == "crash":
+        sys.exit(1)
+    else:
+        result = {"content": [{"type": "text", "text": str(os.getpid())}]}
+
+    print(json.dumps({"jsonrpc": "2.0", "id": message["id"], "result": result}))
+    sys.stdout.flush()
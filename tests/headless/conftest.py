@@ -0,0 +1,94 @@
+import asyncio
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from claude_agent_sdk.types import AssistantMessage, StreamEvent, ToolUseBlock
+
+from agent_chat_cli.utils.config import PermissionsConfig
+from agent_chat_cli.utils.enums import ContentType
+
+
+def text_delta(text: str) -> StreamEvent:
+    return StreamEvent(
+        uuid="test-uuid",
+        session_id="test-session",
+        event={
+            "type": ContentType.CONTENT_BLOCK_DELTA.value,
+            "delta": {"type": ContentType.TEXT_DELTA.value, "text": text},
+        },
+    )
+
+
+class FakeClient:
+    """Answers every prompt with `echo: <prompt>`, streamed word by word."""
+
+    def __init__(self, options=None, delay: float = 0, tool: str | None = None):
+        self.options = options
+        self.delay = delay
+        self.tool = tool
+        self.prompt = ""
+
+    async def connect(self):
+        pass
+
+    async def disconnect(self):
+        pass
+
+    async def set_model(self, model):
+        pass
+
+    async def query(self, prompt):
+        self.prompt = prompt
+
+    async def receive_response(self):
+        await asyncio.sleep(self.delay)
+
+        if self.prompt == "fail":
+            raise RuntimeError("boom")
+
+        if self.tool is not None:
+            yield AssistantMessage(
+                content=[ToolUseBlock(id="tool-1", name=self.tool, input={"a": 1})],
+                model="test-model",
+            )
+            await self.options.can_use_tool(self.tool, {"a": 1}, MagicMock())
+
+        for word in f"echo: {self.prompt}".split(" "):
+            yield text_delta(word + " ")
+
+
+@pytest.fixture
+def fake_clients():
+    created = []
+    settings = {"delay": 0, "tool": None}
+
+    def create_client(options):
+        client = FakeClient(options, **settings)
+        created.append(client)
+        return client
+
+    with patch("claude_agent_sdk.ClaudeSDKClient", side_effect=create_client):
+        yield created, settings
+
+
+@pytest.fixture
+def mock_config():
+    with (
+        patch("agent_chat_cli.core.agent_loop.load_config") as load_mock,
+        patch("agent_chat_cli.core.agent_loop.get_available_servers", return_value={}),
+        patch("agent_chat_cli.headless.batch.get_available_servers", return_value={}),
+        patch("agent_chat_cli.headless.daemon.get_available_servers", return_value={}),
+        patch(
+            "agent_chat_cli.core.agent_loop.get_sdk_config",
+            return_value={"model": "test-model", "system_prompt": "test"},
+        ),
+    ):
+        load_mock.return_value = MagicMock(
+            system_prompt="test",
+            model="test-model",
+            prewarm_client=False,
+            coalesce_queued_prompts=False,
+            permissions=PermissionsConfig(),
+        )
+        yield load_mock
@@ -0,0 +1,88 @@
+import io
+import json
+
+import pytest
+
+from agent_chat_cli.headless.batch import (
+    BatchPrompt,
+    load_prompts,
+    percentile,
+    run_batch,
+)
+
+
+class TestLoadPrompts:
+    def test_reads_strings_and_objects(self, tmp_path):
+        path = tmp_path / "prompts.jsonl"
+        path.write_text('"first"\n\n{"id": "b", "prompt": "second"}\n')
+
+        prompts = load_prompts(path)
+
+        assert prompts == [
+            BatchPrompt(id=1, prompt="first"),
+            BatchPrompt(id="b", prompt="second"),
+        ]
+
+    def test_names_the_malformed_line(self, tmp_path):
+        path = tmp_path / "prompts.jsonl"
+        path.write_text('"first"\n{"prompt": \n')
+
+        with pytest.raises(ValueError, match=r"prompts\.jsonl:2: invalid JSON"):
+            load_prompts(path)
+
+
+class TestPercentile:
+    def test_nearest_rank(self):
+        values = [float(value) for value in range(1, 101)]
+
+        assert percentile(values, 50) == 50.0
+        assert percentile(values, 95) == 95.0
+
+    def test_empty(self):
+        assert percentile([], 95) == 0.0
+
+
+class TestRunBatch:
+    async def test_writes_a_result_per_prompt(self, mock_config, fake_clients):
+        prompts = [
+            BatchPrompt(id=index, prompt=f"prompt {index}") for index in range(5)
+        ]
+        output = io.StringIO()
+
+        report = await run_batch(prompts, output, concurrency=2)
+
+        results = [json.loads(line) for line in output.getvalue().splitlines()]
+
+        assert report.completed == 5
+        assert report.failed == 0
+        assert len(report.latencies) == 5
+        assert sorted(result["id"] for result in results) == list(range(5))
+        assert all(
+            result["response"] == f"echo: {result['prompt']} " for result in results
+        )
+
+    async def test_runs_sessions_concurrently(self, mock_config, fake_clients):
+        clients, settings = fake_clients
+        settings["delay"] = 0.2
+        prompts = [BatchPrompt(id=index, prompt="hi") for index in range(4)]
+
+        report = await run_batch(prompts, io.StringIO(), concurrency=4)
+
+        assert len(clients) == 4
+        assert report.elapsed < 0.6
+
+    async def test_records_failures_and_continues(self, mock_config, fake_clients):
+        prompts = [
+            BatchPrompt(id=1, prompt="fail"),
+            BatchPrompt(id=2, prompt="hi"),
+        ]
+        output = io.StringIO()
+
+        report = await run_batch(prompts, output, concurrency=1)
+
+        results = [json.loads(line) for line in output.getvalue().splitlines()]
+
+        assert report.completed == 1
+        assert report.failed == 1
+        assert results[0] == {"id": 1, "prompt": "fail", "error": "boom"}
+        assert results[1]["response"] == "echo: hi "
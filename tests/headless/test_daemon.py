@@ -0,0 +1,137 @@
+import asyncio
+import shutil
+import socket
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from agent_chat_cli.headless import client
+from agent_chat_cli.headless.daemon import ChatDaemon
+
+
+@pytest.fixture
+def socket_path():
+    # tmp_path can exceed the ~100 character limit on unix socket paths
+    directory = tempfile.mkdtemp(prefix="chat-")
+    yield Path(directory) / "chat.sock"
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+async def settle(daemon: ChatDaemon) -> None:
+    while daemon._background_tasks or daemon._connections:
+        await asyncio.sleep(0.01)
+
+
+def chat(socket_path: Path, *prompts: str) -> list[str]:
+    stream = client.connect(socket_path)
+    responses = []
+
+    try:
+        for prompt in prompts:
+            chunks: list[str] = []
+            client.send_prompt(stream, prompt, chunks.append)
+            responses.append("".join(chunks))
+    finally:
+        stream.close()
+
+    return responses
+
+
+class TestChatDaemon:
+    async def test_warms_the_pool_on_start(
+        self, mock_config, fake_clients, socket_path
+    ):
+        clients, _ = fake_clients
+        daemon = ChatDaemon(socket_path, pool_size=2)
+
+        await daemon.start()
+        await settle(daemon)
+
+        try:
+            assert daemon.idle_sessions == 2
+            assert len(clients) == 2
+        finally:
+            await daemon.stop()
+
+        assert not socket_path.exists()
+
+    async def test_streams_responses_to_a_client(
+        self, mock_config, fake_clients, socket_path
+    ):
+        daemon = ChatDaemon(socket_path, pool_size=1)
+        await daemon.start()
+        await settle(daemon)
+
+        try:
+            responses = await asyncio.to_thread(chat, socket_path, "hello", "again")
+        finally:
+            await daemon.stop()
+
+        assert responses == ["echo: hello ", "echo: again "]
+
+    async def test_returns_sessions_to_the_pool(
+        self, mock_config, fake_clients, socket_path
+    ):
+        daemon = ChatDaemon(socket_path, pool_size=1)
+        await daemon.start()
+        await settle(daemon)
+
+        try:
+            await asyncio.to_thread(chat, socket_path, "first")
+            await asyncio.to_thread(chat, socket_path, "second")
+            await settle(daemon)
+
+            assert daemon.idle_sessions == 1
+            assert len(daemon._sessions) == 1
+        finally:
+            await daemon.stop()
+
+    async def test_reports_failed_turns(self, mock_config, fake_clients, socket_path):
+        daemon = ChatDaemon(socket_path, pool_size=1)
+        await daemon.start()
+        await settle(daemon)
+
+        try:
+            with pytest.raises(client.DaemonError, match="boom"):
+                await asyncio.to_thread(chat, socket_path, "fail")
+
+            assert await asyncio.to_thread(chat, socket_path, "hi") == ["echo: hi "]
+        finally:
+            await daemon.stop()
+
+    async def test_refuses_a_socket_in_use(
+        self, mock_config, fake_clients, socket_path
+    ):
+        daemon = ChatDaemon(socket_path, pool_size=0)
+        await daemon.start()
+
+        try:
+            with pytest.raises(RuntimeError, match="already listening"):
+                await ChatDaemon(socket_path, pool_size=0).start()
+        finally:
+            await daemon.stop()
+
+    async def test_replaces_a_stale_socket(
+        self, mock_config, fake_clients, socket_path
+    ):
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(str(socket_path))
+        stale.close()
+
+        daemon = ChatDaemon(socket_path, pool_size=0)
+        await daemon.start()
+
+        try:
+            assert await asyncio.to_thread(chat, socket_path, "hi") == ["echo: hi "]
+        finally:
+            await daemon.stop()
+
+
+class TestClient:
+    def test_exits_when_no_daemon_is_running(self, socket_path, capsys):
+        with pytest.raises(SystemExit) as exit_info:
+            client.main("hi", socket_path)
+
+        assert exit_info.value.code == 1
+        assert "chat serve" in capsys.readouterr().err
@@ -0,0 +1,51 @@
+import io
+import os
+import subprocess
+import sys
+
+from agent_chat_cli.headless import pipe
+
+
+class TestReadPrompt:
+    def test_uses_the_argument(self):
+        assert pipe.read_prompt(" hello ") == "hello"
+
+    def test_reads_stdin_without_an_argument(self, monkeypatch):
+        monkeypatch.setattr(sys, "stdin", io.StringIO("from stdin\n"))
+
+        assert pipe.read_prompt("-") == "from stdin"
+        assert pipe.read_prompt(None) == ""
+
+
+class TestRunPipe:
+    async def test_streams_response_to_stdout(self, mock_config, fake_clients, capsys):
+        response = await pipe.run_pipe("hello")
+
+        assert response == "echo: hello "
+        assert capsys.readouterr().out == "echo: hello \n"
+
+    async def test_does_not_warm_a_standby_client(self, mock_config, fake_clients):
+        clients, _ = fake_clients
+
+        await pipe.run_pipe("hello")
+
+        assert len(clients) == 1
+
+
+class TestPipeImports:
+    def test_does_not_import_textual(self):
+        code = (
+            "import sys, agent_chat_cli.cli, agent_chat_cli.headless.pipe; "
+            "print('textual' in sys.modules)"
+        )
+        env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            env=env,
+            check=True,
+        )
+
+        assert result.stdout.strip() == "False"
@@ -0,0 +1,25 @@
+import asyncio
+
+from agent_chat_cli.headless.rate_limiter import RateLimiter
+
+
+class TestRateLimiter:
+    async def test_allows_a_burst_without_waiting(self):
+        limiter = RateLimiter(per_minute=60, burst=3)
+        loop = asyncio.get_running_loop()
+
+        started = loop.time()
+        for _ in range(3):
+            await limiter.acquire()
+
+        assert loop.time() - started < 0.05
+
+    async def test_spaces_out_acquisitions_beyond_the_burst(self):
+        limiter = RateLimiter(per_minute=600, burst=1)
+        loop = asyncio.get_running_loop()
+
+        started = loop.time()
+        await asyncio.gather(*(limiter.acquire() for _ in range(3)))
+
+        # 10 per second: the second and third wait 0.1s each
+        assert loop.time() - started >= 0.19
@@ -0,0 +1,74 @@
+from agent_chat_cli.headless.session import HeadlessSession
+from agent_chat_cli.utils.enums import RoleType
+
+
+class TestHeadlessSession:
+    async def test_returns_streamed_response(self, mock_config, fake_clients):
+        session = HeadlessSession()
+
+        try:
+            response = await session.ask("hello there")
+        finally:
+            await session.close()
+
+        assert response == "echo: hello there "
+
+    async def test_records_conversation(self, mock_config, fake_clients):
+        session = HeadlessSession()
+
+        try:
+            await session.ask("hello")
+        finally:
+            await session.close()
+
+        assert [message.type for message in session.conversation.messages] == [
+            RoleType.USER,
+            RoleType.AGENT,
+        ]
+
+    async def test_streams_text_to_callback(self, mock_config, fake_clients):
+        chunks = []
+        session = HeadlessSession(on_text=chunks.append)
+
+        try:
+            await session.ask("one two")
+        finally:
+            await session.close()
+
+        # Chunks may be merged while waiting, but all of the text arrives
+        assert "".join(chunks) == "echo: one two "
+
+    async def test_denies_tools_by_default(self, mock_config, fake_clients):
+        _, settings = fake_clients
+        settings["tool"] = "Bash"
+        session = HeadlessSession()
+
+        try:
+            await session.ask("run it")
+        finally:
+            await session.close()
+
+        messages = session.conversation.messages
+        assert messages[1].type is RoleType.TOOL
+        assert any("Permission denied for Bash" in m.content for m in messages)
+
+    async def test_allows_tools_when_asked(self, mock_config, fake_clients):
+        _, settings = fake_clients
+        settings["tool"] = "Bash"
+        session = HeadlessSession(allow_tools=True)
+
+        try:
+            await session.ask("run it")
+        finally:
+            await session.close()
+
+        assert not any(
+            message.type is RoleType.SYSTEM for message in session.conversation.messages
+        )
+
+    def test_never_keeps_a_standby_client(self, mock_config):
+        mock_config.return_value.prewarm_client = True
+
+        session = HeadlessSession()
+
+        assert session.agent_loop.config.prewarm_client is False
@@ -1,3 +1,8 @@
+import json
+import os
+import subprocess
+import sys
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from pathlib import Path
@@ -26,6 +31,7 @@ def mock_agent_loop():
         instance.permission_response_queue.put = AsyncMock()
         instance.client = MagicMock()
         instance.client.interrupt = AsyncMock()
+        instance.interrupt = AsyncMock()
         mock.return_value = instance
         yield instance
 
@@ -90,20 +96,26 @@ class TestToolPermissionBehavior:
         app = AgentChatCLIApp()
         async with app.run_test():
             app.ui_state.show_permission_prompt(
-                tool_name="mcp__filesystem__read_file",
-                tool_input={"path": "/tmp/test.txt"},
+                [
+                    {
+                        "tool_name": "mcp__filesystem__read_file",
+                        "tool_input": {"path": "/tmp/test.txt"},
+                    }
+                ]
             )
 
             prompt = app.query_one(ToolPermissionPrompt)
             assert prompt.is_visible is True
-            assert prompt.tool_name == "mcp__filesystem__read_file"
+            assert prompt.requests[0]["tool_name"] == "mcp__filesystem__read_file"
 
     async def test_hide_permission_prompt_restores_input(
         self, mock_agent_loop, mock_config
     ):
         app = AgentChatCLIApp()
         async with app.run_test():
-            app.ui_state.show_permission_prompt(tool_name="test_tool", tool_input={})
+            app.ui_state.show_permission_prompt(
+                [{"tool_name": "test_tool", "tool_input": {}}]
+            )
             app.ui_state.hide_permission_prompt()
 
             prompt = app.query_one(ToolPermissionPrompt)
@@ -133,24 +145,26 @@ class TestThinkingIndicatorBehavior:
 
 
 class TestInterruptBehavior:
-    async def test_interrupt_sets_flag(self, mock_agent_loop, mock_config):
+    async def test_interrupt_stops_the_agent(self, mock_agent_loop, mock_config):
         app = AgentChatCLIApp()
         async with app.run_test():
             app.ui_state.start_thinking()
             await app.actions.interrupt()
 
-            assert app.ui_state.interrupting is True
+            mock_agent_loop.interrupt.assert_called_once()
 
     async def test_interrupt_blocked_during_permission_prompt(
         self, mock_agent_loop, mock_config
     ):
         app = AgentChatCLIApp()
         async with app.run_test():
-            app.ui_state.show_permission_prompt(tool_name="test", tool_input={})
+            app.ui_state.show_permission_prompt(
+                [{"tool_name": "test", "tool_input": {}}]
+            )
 
             await app.actions.interrupt()
 
-            assert app.ui_state.interrupting is False
+            mock_agent_loop.interrupt.assert_not_called()
 
     async def test_escape_triggers_interrupt_when_menu_not_visible(
         self, mock_agent_loop, mock_config
@@ -161,7 +175,7 @@ class TestInterruptBehavior:
 
             await pilot.press("escape")
 
-            assert app.ui_state.interrupting is True
+            mock_agent_loop.interrupt.assert_called_once()
 
 
 class TestSlashCommandMenuBehavior:
@@ -228,3 +242,28 @@ class TestSlashCommandMenuBehavior:
 
             menu = app.query_one(SlashCommandMenu)
             assert menu.is_visible is False
+
+
+@pytest.mark.skipif(
+    sys.version_info < (3, 14), reason="components rely on deferred annotations"
+)
+class TestAppImports:
+    def test_defers_what_the_first_frame_does_not_need(self):
+        code = (
+            "import json, logging, sys, agent_chat_cli.cli, agent_chat_cli.app; "
+            "print(json.dumps({"
+            "'modules': [name for name in ('claude_agent_sdk', 'markdown_it') "
+            "if name in sys.modules], "
+            "'handlers': len(logging.getLogger().handlers)}))"
+        )
+        env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            env=env,
+            check=True,
+        )
+
+        assert json.loads(result.stdout) == {"modules": [], "handlers": 0}
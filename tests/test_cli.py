@@ -0,0 +1,53 @@
+from pathlib import Path
+
+from agent_chat_cli.cli import build_parser
+
+
+class TestCLIParser:
+    def test_no_command_starts_the_app(self):
+        args = build_parser().parse_args([])
+
+        assert args.command is None
+
+    def test_parses_batch_options(self):
+        args = build_parser().parse_args(
+            ["batch", "prompts.jsonl", "--concurrency", "8", "--out", "out.jsonl"]
+        )
+
+        assert args.command == "batch"
+        assert args.prompts == Path("prompts.jsonl")
+        assert args.concurrency == 8
+        assert args.out == Path("out.jsonl")
+        assert args.rate is None
+        assert args.allow_tools is False
+
+    def test_parses_print_prompt(self):
+        args = build_parser().parse_args(["-p", "hello", "--allow-tools"])
+
+        assert args.command is None
+        assert args.prompt == "hello"
+        assert args.allow_tools is True
+
+    def test_bare_print_reads_stdin(self):
+        args = build_parser().parse_args(["-p"])
+
+        assert args.prompt == "-"
+
+    def test_parses_serve_and_attach(self):
+        serve = build_parser().parse_args(["serve", "--pool", "3", "--allow-tools"])
+        attach = build_parser().parse_args(["attach", "hello", "--socket", "s.sock"])
+
+        assert serve.command == "serve"
+        assert serve.pool == 3
+        assert serve.allow_tools is True
+        assert serve.socket is None
+        assert attach.command == "attach"
+        assert attach.prompt == "hello"
+        assert attach.socket == Path("s.sock")
+
+    def test_parses_search(self):
+        args = build_parser().parse_args(["search", "signing", "keys", "--limit", "5"])
+
+        assert args.command == "search"
+        assert args.query == ["signing", "keys"]
+        assert args.limit == 5
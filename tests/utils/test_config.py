@@ -1,12 +1,21 @@
+import asyncio
+import os
+import threading
+
 import pytest
 from pathlib import Path
+from unittest.mock import patch
 
+from agent_chat_cli.utils import config as config_module
 from agent_chat_cli.utils.config import (
     load_config,
     get_available_servers,
     get_sdk_config,
     AgentChatConfig,
+    ConfigService,
+    MCPServerConfig,
 )
+from agent_chat_cli.utils.enums import JournalFsync, MCPStartMode, PermissionAction
 
 
 FIXTURES_DIR = Path(__file__).parent.parent / "fixtures"
@@ -29,6 +38,17 @@ class TestLoadConfig:
         assert server.command == "echo"
         assert server.args == ["test"]
 
+    def test_loads_permission_rules(self):
+        config = load_config(FIXTURES_DIR / "test_config.yaml")
+
+        [allow, deny] = config.permissions.rules
+
+        assert config.permissions.default is PermissionAction.ASK
+        assert allow.action is PermissionAction.ALLOW
+        assert allow.server == "test_server"
+        assert allow.tool == "read_*"
+        assert deny.input == {"command": "rm -rf"}
+
     def test_filters_disabled_servers(self):
         config = load_config(FIXTURES_DIR / "test_config_with_disabled.yaml")
 
@@ -85,3 +105,193 @@ class TestAgentChatConfig:
         assert config.mcp_servers == {}
         assert config.disallowed_tools == []
         assert config.permission_mode == "bypass_permissions"
+        assert config.streaming.target_fps == 30
+        assert config.streaming.max_latency_ms == 50
+        assert config.streaming.queue_size == 256
+        assert config.prewarm_client is True
+        assert config.coalesce_queued_prompts is False
+        assert config.journal_fsync is JournalFsync.BATCH
+        assert config.log_sample_rates == {}
+        assert config.trace_file is None
+
+    def test_sdk_config_excludes_app_settings(self):
+        config = AgentChatConfig(
+            system_prompt="test",
+            model="claude-sonnet-4-20250514",
+        )
+
+        assert "streaming" not in get_sdk_config(config)
+        assert "prewarm_client" not in get_sdk_config(config)
+        assert "coalesce_queued_prompts" not in get_sdk_config(config)
+        assert "permissions" not in get_sdk_config(config)
+        assert "journal_fsync" not in get_sdk_config(config)
+        assert "log_sample_rates" not in get_sdk_config(config)
+        assert "trace_file" not in get_sdk_config(config)
+
+
+class TestMCPServerConfig:
+    def test_starts_eagerly_by_default(self):
+        config = MCPServerConfig(description="test", command="npx")
+
+        assert config.start is MCPStartMode.EAGER
+
+    def test_parses_lazy_start(self):
+        config = MCPServerConfig(description="test", command="npx", start="lazy")
+
+        assert config.start is MCPStartMode.LAZY
+
+
+BASE_CONFIG = """\
+system_prompt: base.md
+model: sonnet
+mcp_servers:
+  github:
+    description: GitHub
+    command: npx
+"""
+
+
+class TestConfigService:
+    @pytest.fixture(autouse=True)
+    def reset_service(self):
+        ConfigService.clear()
+        yield
+        ConfigService.clear()
+
+    @pytest.fixture
+    def config_path(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(config_module, "PROMPTS_DIR", tmp_path)
+        (tmp_path / "base.md").write_text("You are helpful.")
+
+        path = tmp_path / "agent-chat-cli.config.yaml"
+        path.write_text(BASE_CONFIG)
+        return path
+
+    def changes(self):
+        changes = []
+        ConfigService.subscribe(changes.append)
+        return changes
+
+    def watch(self, config_path, monkeypatch):
+        monkeypatch.setattr(config_module, "CONFIG_POLL_INTERVAL", 0)
+        return asyncio.create_task(ConfigService.watch(config_path))
+
+    async def wait_for(self, watcher, changes):
+        try:
+            async with asyncio.timeout(5):
+                while not changes:
+                    await asyncio.sleep(0.01)
+        finally:
+            watcher.cancel()
+
+    def test_parses_each_file_once(self, config_path):
+        with patch.object(
+            config_module, "_parse_config", wraps=config_module._parse_config
+        ) as parse:
+            load_config(config_path)
+            load_config(config_path)
+
+        assert parse.call_count == 1
+
+    def test_callers_get_independent_copies(self, config_path):
+        first = load_config(config_path)
+        first.model = "opus"
+
+        assert load_config(config_path).model == "sonnet"
+
+    def test_reloads_edited_config_and_reports_sections(self, config_path):
+        load_config(config_path)
+        changes = self.changes()
+
+        config_path.write_text(
+            BASE_CONFIG + "  slack:\n    description: Slack\n    command: npx\n"
+        )
+        change = ConfigService.refresh(config_path)
+
+        assert change is not None
+        assert change.sections == {"mcp_servers"}
+        assert set(change.config.mcp_servers) == {"github", "slack"}
+        assert changes == []
+        assert set(load_config(config_path).mcp_servers) == {"github", "slack"}
+
+    def test_reloads_edited_prompt_file(self, config_path, tmp_path):
+        load_config(config_path)
+
+        (tmp_path / "base.md").write_text("You are terse.")
+        change = ConfigService.refresh(config_path)
+
+        assert change is not None
+        assert change.sections == {"system_prompt"}
+        assert "You are terse." in load_config(config_path).system_prompt
+
+    def test_touch_without_edit_does_not_reload(self, config_path):
+        load_config(config_path)
+        changes = self.changes()
+
+        stat = config_path.stat()
+        os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        with patch.object(config_module, "_parse_config") as parse:
+            assert ConfigService.refresh(config_path) is None
+
+        parse.assert_not_called()
+        assert changes == []
+
+    def test_invalid_edit_keeps_last_good_config(self, config_path):
+        load_config(config_path)
+        changes = self.changes()
+
+        config_path.write_text("system_prompt: base.md\nmcp_servers: [\n")
+
+        assert ConfigService.refresh(config_path) is None
+        assert load_config(config_path).model == "sonnet"
+        assert changes == []
+
+    def test_load_config_does_not_notify(self, config_path):
+        load_config(config_path)
+        changes = self.changes()
+
+        config_path.write_text(BASE_CONFIG.replace("sonnet", "opus"))
+
+        assert load_config(config_path).model == "opus"
+        assert changes == []
+
+    async def test_watch_notifies_on_the_event_loop(self, config_path, monkeypatch):
+        load_config(config_path)
+        threads = []
+        ConfigService.subscribe(lambda change: threads.append(threading.get_ident()))
+
+        watcher = self.watch(config_path, monkeypatch)
+        config_path.write_text(BASE_CONFIG.replace("sonnet", "opus"))
+        await self.wait_for(watcher, threads)
+
+        assert threads == [threading.get_ident()]
+
+    async def test_watch_reports_edits_picked_up_by_load_config(
+        self, config_path, monkeypatch
+    ):
+        load_config(config_path)
+        changes = self.changes()
+        watcher = self.watch(config_path, monkeypatch)
+        await asyncio.sleep(0)
+
+        config_path.write_text(BASE_CONFIG.replace("sonnet", "opus"))
+        load_config(config_path)
+        await self.wait_for(watcher, changes)
+
+        assert [change.sections for change in changes] == [{"model"}]
+        assert changes[0].previous.model == "sonnet"
+
+    async def test_unsubscribed_callbacks_are_not_called(
+        self, config_path, monkeypatch
+    ):
+        load_config(config_path)
+        changes = self.changes()
+        ConfigService.unsubscribe(changes.append)
+        others = self.changes()
+
+        watcher = self.watch(config_path, monkeypatch)
+        config_path.write_text(BASE_CONFIG.replace("sonnet", "opus"))
+        await self.wait_for(watcher, others)
+
+        assert changes == []
@@ -0,0 +1,169 @@
+import json
+
+import pytest
+
+from agent_chat_cli.core.conversation_store import ConversationStore, Message
+from agent_chat_cli.utils import journal as journal_module
+from agent_chat_cli.utils.enums import JournalFsync, RoleType
+from agent_chat_cli.utils.journal import (
+    Journal,
+    find_unfinished_session,
+    mark_finished,
+    read_journal,
+)
+
+
+@pytest.fixture
+def store():
+    return ConversationStore()
+
+
+@pytest.fixture
+def journal_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(journal_module, "JOURNAL_DIR", tmp_path)
+    return tmp_path
+
+
+def records(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+class TestJournal:
+    @pytest.mark.parametrize("fsync", list(JournalFsync))
+    def test_records_the_conversation_as_it_changes(self, store, tmp_path, fsync):
+        journal = Journal(store, tmp_path / "session.jsonl", fsync)
+
+        store.add(Message(RoleType.USER, "Hi"))
+        index = store.add(Message(RoleType.AGENT))
+        store.append(index, "Hello")
+        store.append(index, " there")
+        journal.record_session("abc")
+        journal.close()
+
+        assert [record["type"] for record in records(journal.path)] == [
+            "added",
+            "added",
+            "appended",
+            "appended",
+            "session",
+            "closed",
+        ]
+
+    def test_unfinished_close_leaves_it_open(self, store, tmp_path):
+        journal = Journal(store, tmp_path / "session.jsonl")
+
+        store.add(Message(RoleType.USER, "Hi"))
+        journal.close(finished=False)
+
+        assert [record["type"] for record in records(journal.path)] == ["added"]
+
+    def test_stops_recording_once_closed(self, store, tmp_path):
+        journal = Journal(store, tmp_path / "session.jsonl")
+        journal.close()
+
+        store.add(Message(RoleType.USER, "Hi"))
+        journal.close()
+
+        assert records(journal.path) == [{"type": "closed"}]
+
+    def test_create_keeps_only_the_latest_journals(
+        self, store, journal_dir, monkeypatch
+    ):
+        monkeypatch.setattr(journal_module, "JOURNAL_KEEP", 2)
+        for name in ("session-1.jsonl", "session-2.jsonl"):
+            (journal_dir / name).write_text("")
+
+        journal = Journal.create(store)
+        journal.close()
+
+        assert sorted(path.name for path in journal_dir.iterdir()) == [
+            "session-2.jsonl",
+            journal.path.name,
+        ]
+
+
+class TestReadJournal:
+    def test_rebuilds_the_transcript(self, store, tmp_path):
+        journal = Journal(store, tmp_path / "session.jsonl")
+        store.add(Message(RoleType.USER, "Hi"))
+        index = store.add(Message(RoleType.AGENT))
+        store.append(index, "Hello")
+        store.add(
+            Message(RoleType.TOOL, '{"path": "a"}', metadata={"tool_name": "Read"})
+        )
+        journal.record_session("abc")
+        journal.close()
+
+        snapshot = read_journal(journal.path)
+
+        assert snapshot.finished
+        assert snapshot.session_id == "abc"
+        assert [(m.type, m.content) for m in snapshot.messages] == [
+            (RoleType.USER, "Hi"),
+            (RoleType.AGENT, "Hello"),
+            (RoleType.TOOL, '{"path": "a"}'),
+        ]
+        assert snapshot.messages[2].metadata == {"tool_name": "Read"}
+
+    def test_starts_over_after_a_clear(self, store, tmp_path):
+        journal = Journal(store, tmp_path / "session.jsonl")
+        journal.record_session("old")
+        store.add(Message(RoleType.USER, "Before"))
+        store.clear()
+        store.add(Message(RoleType.USER, "After"))
+        journal.close()
+
+        snapshot = read_journal(journal.path)
+
+        assert snapshot.session_id is None
+        assert [m.content for m in snapshot.messages] == ["After"]
+
+    def test_skips_a_line_cut_short_by_a_crash(self, tmp_path):
+        path = tmp_path / "session.jsonl"
+        path.write_text(
+            '{"type": "added", "index": 0, "role": "user", "content": "Hi"}\n'
+            '{"type": "appen'
+        )
+
+        snapshot = read_journal(path)
+
+        assert not snapshot.finished
+        assert [m.content for m in snapshot.messages] == ["Hi"]
+
+
+class TestFindUnfinishedSession:
+    def write(self, path, *lines):
+        path.write_text("".join(json.dumps(line) + "\n" for line in lines))
+
+    def test_returns_the_latest_journal_left_open(self, journal_dir):
+        added = {"type": "added", "index": 0, "role": "user", "content": "Hi"}
+        self.write(journal_dir / "session-1.jsonl", added)
+        self.write(journal_dir / "session-2.jsonl", added)
+
+        snapshot = find_unfinished_session()
+
+        assert snapshot is not None
+        assert snapshot.path.name == "session-2.jsonl"
+
+    def test_ignores_closed_and_empty_journals(self, journal_dir):
+        added = {"type": "added", "index": 0, "role": "user", "content": "Hi"}
+        self.write(journal_dir / "session-1.jsonl", added, {"type": "closed"})
+        assert find_unfinished_session() is None
+
+        self.write(
+            journal_dir / "session-2.jsonl", {"type": "session", "session_id": "a"}
+        )
+        assert find_unfinished_session() is None
+
+    def test_mark_finished_stops_offering_it(self, journal_dir):
+        path = journal_dir / "session-1.jsonl"
+        self.write(path, {"type": "added", "index": 0, "role": "user", "content": "Hi"})
+
+        mark_finished(path)
+
+        assert find_unfinished_session() is None
+
+    def test_missing_directory_has_nothing(self, journal_dir, monkeypatch):
+        monkeypatch.setattr(journal_module, "JOURNAL_DIR", journal_dir / "missing")
+
+        assert find_unfinished_session() is None
@@ -0,0 +1,124 @@
+import json
+import logging
+
+import pytest
+
+from agent_chat_cli.utils import logger
+from agent_chat_cli.utils.logger import (
+    JsonFormatter,
+    log,
+    log_json,
+    setup_logging,
+    shutdown_logging,
+)
+
+
+@pytest.fixture
+def log_path(tmp_path, monkeypatch):
+    monkeypatch.delenv("LOG_CONSOLE", raising=False)
+    monkeypatch.delenv("LOG_LEVEL", raising=False)
+    root_level = logging.getLogger().level
+
+    yield tmp_path / "logs" / "chat.jsonl"
+
+    shutdown_logging()
+    logging.getLogger().setLevel(root_level)
+
+
+def read_lines(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+class Unserializable:
+    calls = 0
+
+    def __str__(self) -> str:
+        Unserializable.calls += 1
+        return "unserializable"
+
+
+class TestLogJson:
+    def test_skips_serializing_when_info_is_disabled(self, log_path):
+        setup_logging(log_path)
+        logging.getLogger().setLevel(logging.WARNING)
+        Unserializable.calls = 0
+
+        log_json({"event": "quiet", "value": Unserializable()})
+        shutdown_logging()
+
+        assert Unserializable.calls == 0
+        assert log_path.read_text() == ""
+
+    def test_writes_compact_jsonl(self, log_path):
+        setup_logging(log_path)
+
+        log_json({"event": "tool_call", "tool": "Bash", "value": Unserializable()})
+        log("plain message")
+        shutdown_logging()
+
+        lines = log_path.read_text().splitlines()
+        first, second = read_lines(log_path)
+
+        assert len(lines) == 2
+        assert ": " not in lines[0]
+        assert first["event"] == "tool_call"
+        assert first["value"] == "unserializable"
+        assert first["level"] == "INFO"
+        assert second["message"] == "plain message"
+
+    def test_samples_configured_events(self, log_path):
+        setup_logging(log_path, sample_rates={"tick": 3})
+
+        for index in range(7):
+            log_json({"event": "tick", "index": index})
+
+        log_json({"event": "other"})
+        shutdown_logging()
+
+        lines = read_lines(log_path)
+
+        assert [line.get("index") for line in lines] == [0, 3, 6, None]
+        assert all(line["sampled"] == 3 for line in lines[:3])
+        assert "sampled" not in lines[3]
+
+    def test_rotates_the_log_file(self, log_path):
+        setup_logging(log_path, max_bytes=200)
+
+        for index in range(20):
+            log_json({"event": "filler", "index": index})
+
+        shutdown_logging()
+
+        assert log_path.with_name("chat.jsonl.1").exists()
+        assert len(list(log_path.parent.iterdir())) == logger.LOG_BACKUPS + 1
+
+
+class TestSetupLogging:
+    def test_console_mirror_is_opt_in(self, log_path, monkeypatch):
+        from textual.logging import TextualHandler
+
+        setup_logging(log_path)
+        root_handlers = logging.getLogger().handlers
+        assert not any(isinstance(h, TextualHandler) for h in root_handlers)
+
+        monkeypatch.setenv("LOG_CONSOLE", "1")
+        setup_logging(log_path)
+        root_handlers = logging.getLogger().handlers
+        assert any(isinstance(h, TextualHandler) for h in root_handlers)
+
+    def test_shutdown_detaches_handlers(self, log_path):
+        before = list(logging.getLogger().handlers)
+
+        setup_logging(log_path)
+        shutdown_logging()
+
+        assert logging.getLogger().handlers == before
+
+
+class TestJsonFormatter:
+    def test_indents_for_the_console(self):
+        record = logging.LogRecord(
+            "agent_chat_cli", logging.INFO, __file__, 1, {"event": "x"}, None, None
+        )
+
+        assert '\n  "event": "x"' in JsonFormatter(indent=2).format(record)
@@ -0,0 +1,58 @@
+import json
+
+import pytest
+
+from agent_chat_cli.utils import mcp_schema_cache
+from agent_chat_cli.utils.config import MCPServerConfig
+
+TOOLS = [{"name": "search", "inputSchema": {"type": "object"}}]
+INITIALIZE = {"protocolVersion": "2025-06-18", "capabilities": {"tools": {}}}
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(mcp_schema_cache, "MCP_SCHEMA_CACHE_DIR", tmp_path)
+    return tmp_path
+
+
+def server(*args: str) -> MCPServerConfig:
+    return MCPServerConfig(description="Test", command="npx", args=list(args))
+
+
+class TestMCPSchemaCache:
+    def test_round_trips_schema(self):
+        mcp_schema_cache.save_schema("github", server("a"), INITIALIZE, TOOLS)
+
+        schema = mcp_schema_cache.load_schema("github", server("a"))
+
+        assert schema is not None
+        assert schema["initialize"] == INITIALIZE
+        assert schema["tools"] == TOOLS
+
+    def test_returns_none_when_missing(self):
+        assert mcp_schema_cache.load_schema("github", server("a")) is None
+
+    def test_ignores_schema_of_a_different_launch_command(self):
+        mcp_schema_cache.save_schema("github", server("a"), INITIALIZE, TOOLS)
+
+        assert mcp_schema_cache.load_schema("github", server("b")) is None
+
+    def test_does_not_store_args_in_plain_text(self, cache_dir):
+        mcp_schema_cache.save_schema(
+            "github", server("secret-token"), INITIALIZE, TOOLS
+        )
+
+        assert "secret-token" not in (cache_dir / "github.json").read_text()
+
+    def test_ignores_a_malformed_file(self, cache_dir):
+        fingerprint = mcp_schema_cache._fingerprint(server("a"))
+        path = cache_dir / "github.json"
+
+        for schema in (
+            [],
+            {"fingerprint": fingerprint, "initialize": INITIALIZE, "tools": {}},
+            {"fingerprint": fingerprint, "tools": TOOLS},
+        ):
+            path.write_text(json.dumps(schema))
+
+            assert mcp_schema_cache.load_schema("github", server("a")) is None
@@ -86,3 +86,20 @@ class TestMCPServerStatus:
         assert MCPServerStatus.is_connected("server1") is True
         assert MCPServerStatus.is_connected("server2") is False
         assert MCPServerStatus.is_connected("server3") is True
+
+    def test_set_status_replaces_a_single_server(self):
+        MCPServerStatus.update(
+            [
+                {"name": "server1", "status": "pending"},
+                {"name": "server2", "status": "connected"},
+            ]
+        )
+
+        MCPServerStatus.set_status("server1", "connected")
+
+        assert MCPServerStatus.is_connected("server1") is True
+        assert MCPServerStatus.is_connected("server2") is True
+        assert MCPServerStatus.get_status("server1") == "connected"
+
+    def test_get_status_returns_none_for_unknown_server(self):
+        assert MCPServerStatus.get_status("unknown") is None
@@ -0,0 +1,68 @@
+from agent_chat_cli.utils.permission_cache import (
+    PermissionCache,
+    is_approval,
+    parse_selection,
+)
+
+
+class TestIsApproval:
+    def test_accepts_plain_and_session_approvals(self):
+        for response in ("", "yes", "s", "session", "a", "always"):
+            assert is_approval(response)
+
+    def test_rejects_denials_and_questions(self):
+        assert not is_approval("no")
+        assert not is_approval("why do you need this?")
+
+
+class TestParseSelection:
+    def test_reads_numbers_separated_by_spaces_or_commas(self):
+        assert parse_selection("1 3", 3) == {1, 3}
+        assert parse_selection("2,4, 5", 5) == {2, 4, 5}
+
+    def test_other_answers_are_not_a_selection(self):
+        assert parse_selection("yes", 3) is None
+        assert parse_selection("", 3) is None
+        assert parse_selection("run step 2 first", 3) is None
+
+    def test_numbers_outside_the_batch_are_not_a_selection(self):
+        assert parse_selection("0", 3) is None
+        assert parse_selection("1 4", 3) is None
+        assert parse_selection("42", 3) is None
+
+    def test_a_single_tool_cannot_be_picked(self):
+        assert parse_selection("1", 1) is None
+
+
+class TestPermissionCache:
+    def test_allows_nothing_by_default(self):
+        cache = PermissionCache()
+
+        assert not cache.is_allowed("Read", {"file_path": "a"})
+        assert cache.hits == 0
+
+    def test_allowed_call_matches_the_same_input_only(self):
+        cache = PermissionCache()
+        cache.allow_call("Read", {"file_path": "a", "limit": 10})
+
+        assert cache.is_allowed("Read", {"limit": 10, "file_path": "a"})
+        assert not cache.is_allowed("Read", {"file_path": "b", "limit": 10})
+        assert not cache.is_allowed("Write", {"file_path": "a", "limit": 10})
+
+    def test_allowed_tool_matches_any_input(self):
+        cache = PermissionCache()
+        cache.allow_tool("mcp__github__get_issue")
+
+        assert cache.is_allowed("mcp__github__get_issue", {"number": 1})
+        assert cache.is_allowed("mcp__github__get_issue", {"number": 2})
+
+    def test_counts_hits(self):
+        cache = PermissionCache()
+        cache.allow_tool("Read")
+        cache.allow_call("Write", {"file_path": "a"})
+
+        cache.is_allowed("Read", {})
+        cache.is_allowed("Read", {})
+        cache.is_allowed("Bash", {})
+
+        assert cache.stats() == {"hits": 2, "tools": 1, "calls": 1}
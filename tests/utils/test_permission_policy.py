@@ -0,0 +1,91 @@
+import pytest
+from pydantic import ValidationError
+
+from agent_chat_cli.utils.config import PermissionRule, PermissionsConfig
+from agent_chat_cli.utils.enums import PermissionAction
+from agent_chat_cli.utils.permission_policy import (
+    PermissionDecision,
+    PermissionPolicy,
+    split_tool_name,
+)
+
+
+def policy(*rules: dict, default: str = "ask") -> PermissionPolicy:
+    return PermissionPolicy(
+        PermissionsConfig(
+            rules=[PermissionRule(**rule) for rule in rules],
+            default=PermissionAction(default),
+        )
+    )
+
+
+class TestSplitToolName:
+    def test_splits_mcp_tools(self):
+        assert split_tool_name("mcp__github__get_issue") == ("github", "get_issue")
+
+    def test_built_in_tools_have_no_server(self):
+        assert split_tool_name("Read") == (None, "Read")
+
+
+class TestPermissionPolicy:
+    def test_falls_back_to_default(self):
+        assert policy().evaluate("Read", {}) == PermissionDecision(PermissionAction.ASK)
+        assert policy(default="deny").evaluate("Read", {}).action is (
+            PermissionAction.DENY
+        )
+
+    def test_matches_server_and_tool_globs(self):
+        rules = policy({"action": "allow", "server": "github", "tool": "get_*"})
+
+        assert rules.evaluate("mcp__github__get_issue", {}).action is (
+            PermissionAction.ALLOW
+        )
+        assert rules.evaluate("mcp__github__create_issue", {}).rule is None
+        assert rules.evaluate("mcp__gitlab__get_issue", {}).rule is None
+
+    def test_server_rules_skip_built_in_tools(self):
+        rules = policy({"action": "allow", "server": "*"})
+
+        assert rules.evaluate("Bash", {}).rule is None
+        assert rules.evaluate("mcp__chrome__click", {}).rule == 0
+
+    def test_first_matching_rule_wins(self):
+        rules = policy(
+            {"action": "deny", "tool": "Bash", "input": {"command": r"^rm\b"}},
+            {"action": "allow", "tool": "Bash"},
+        )
+
+        assert rules.evaluate("Bash", {"command": "rm -rf /"}) == PermissionDecision(
+            PermissionAction.DENY, 0
+        )
+        assert rules.evaluate("Bash", {"command": "ls"}) == PermissionDecision(
+            PermissionAction.ALLOW, 1
+        )
+
+    def test_input_fields_must_all_match(self):
+        rules = policy(
+            {
+                "action": "allow",
+                "tool": "Write",
+                "input": {"file_path": r"^/tmp/", "content": "hello"},
+            }
+        )
+
+        assert (
+            rules.evaluate("Write", {"file_path": "/tmp/a", "content": "hello"}).rule
+            == 0
+        )
+        assert (
+            rules.evaluate("Write", {"file_path": "/tmp/a", "content": "bye"}).rule
+            is None
+        )
+        assert rules.evaluate("Write", {"file_path": "/tmp/a"}).rule is None
+
+    def test_matches_non_string_input_as_json(self):
+        rules = policy({"action": "deny", "tool": "*", "input": {"args": '"--force"'}})
+
+        assert rules.evaluate("Run", {"args": ["push", "--force"]}).rule == 0
+
+    def test_rejects_invalid_patterns(self):
+        with pytest.raises(ValidationError, match="invalid pattern"):
+            PermissionRule(action=PermissionAction.DENY, input={"command": "("})
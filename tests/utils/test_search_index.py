@@ -0,0 +1,113 @@
+import json
+import os
+
+import pytest
+
+from agent_chat_cli.core.conversation_store import ConversationStore, Message
+from agent_chat_cli.utils import journal, save_conversation
+from agent_chat_cli.utils.enums import RoleType
+from agent_chat_cli.utils.search_index import (
+    MATCH_END,
+    MATCH_START,
+    IndexUpdate,
+    SearchIndex,
+)
+
+
+@pytest.fixture
+def conversations_dir():
+    save_conversation.CONVERSATION_OUTPUT_DIR.mkdir(parents=True)
+    return save_conversation.CONVERSATION_OUTPUT_DIR
+
+
+@pytest.fixture
+def index(tmp_path):
+    return SearchIndex(tmp_path / "search.db")
+
+
+def save(*messages):
+    store = ConversationStore()
+    for role, content in messages:
+        store.add(Message(role, content))
+    return save_conversation.save_conversation(store)
+
+
+class TestSearchIndexUpdate:
+    def test_indexes_saved_conversations_and_journals(self, index, conversations_dir):
+        save((RoleType.USER, "How do I rotate the signing keys?"))
+        journal.JOURNAL_DIR.mkdir(parents=True)
+        (journal.JOURNAL_DIR / "session-1.jsonl").write_text(
+            json.dumps(
+                {"type": "added", "index": 0, "role": "agent", "content": "Kubernetes"}
+            )
+            + "\n"
+        )
+
+        assert index.update() == IndexUpdate(indexed=2)
+        assert len(index.search("signing")) == 1
+        assert len(index.search("kubernetes")) == 1
+
+    def test_skips_files_that_did_not_change(self, index, conversations_dir):
+        save((RoleType.USER, "hello"))
+        index.update()
+
+        assert index.update() == IndexUpdate(unchanged=1)
+
+    def test_reindexes_changed_files(self, index, conversations_dir):
+        path = save((RoleType.USER, "original words"))
+        index.update()
+
+        with open(path, "a") as f:
+            f.write("\n---\n\n# Agent\n\nappended answer\n")
+
+        assert index.update() == IndexUpdate(indexed=1)
+        assert index.search("appended")
+        assert len(index.search("original")) == 1
+
+    def test_touched_file_with_same_content_is_not_reindexed(
+        self, index, conversations_dir
+    ):
+        path = save((RoleType.USER, "hello"))
+        index.update()
+
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert index.update() == IndexUpdate(unchanged=1)
+
+    def test_forgets_deleted_files(self, index, conversations_dir):
+        path = save((RoleType.USER, "ephemeral"))
+        index.update()
+
+        os.remove(path)
+
+        assert index.update() == IndexUpdate(removed=1)
+        assert index.search("ephemeral") == []
+
+
+class TestSearchIndexSearch:
+    def test_ranks_hits_and_marks_matches(self, index, conversations_dir):
+        save(
+            (RoleType.USER, "please deploy the service to staging before the demo"),
+            (RoleType.AGENT, "Retry the deploy: deploy failed"),
+        )
+        index.update()
+
+        hits = index.search("deploy")
+
+        assert [hit.role for hit in hits] == ["agent", "user"]
+        assert f"{MATCH_START}deploy{MATCH_END}" in hits[0].snippet
+
+    def test_matches_word_stems(self, index, conversations_dir):
+        save((RoleType.AGENT, "Running the migrations now"))
+        index.update()
+
+        assert index.search("migration run")
+
+    def test_query_syntax_is_taken_literally(self, index, conversations_dir):
+        save((RoleType.USER, "what does NOT mean here"))
+        index.update()
+
+        assert len(index.search('NOT "')) == 1
+        assert len(index.search("mean OR nothing")) == 0
+        assert index.search("   ") == []
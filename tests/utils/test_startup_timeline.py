@@ -0,0 +1,63 @@
+import pytest
+
+from agent_chat_cli.utils.enums import TimelineStatus
+from agent_chat_cli.utils.startup_timeline import StartupTimeline
+
+
+class TestStartupTimeline:
+    @pytest.fixture(autouse=True)
+    def reset_state(self):
+        StartupTimeline._entries = {}
+        StartupTimeline._callbacks = []
+        yield
+        StartupTimeline._entries = {}
+        StartupTimeline._callbacks = []
+
+    def test_records_entries_in_start_order(self):
+        StartupTimeline.begin("config")
+        StartupTimeline.begin("client")
+        StartupTimeline.end("client")
+        StartupTimeline.end("config")
+
+        assert [entry.name for entry in StartupTimeline.entries()] == [
+            "config",
+            "client",
+        ]
+
+    def test_end_records_duration_status_and_phases(self):
+        StartupTimeline.begin("github")
+        StartupTimeline.end("github", TimelineStatus.OK, {"spawn": 12.0})
+
+        [entry] = StartupTimeline.entries()
+
+        assert entry.duration_ms is not None and entry.duration_ms >= 0
+        assert entry.status is TimelineStatus.OK
+        assert entry.phases == {"spawn": 12.0}
+
+    def test_begin_keeps_the_first_occurrence(self):
+        StartupTimeline.begin("github")
+        started = StartupTimeline.entries()[0].started_ms
+
+        StartupTimeline.begin("github")
+
+        assert StartupTimeline.entries()[0].started_ms == started
+
+    def test_ignores_end_without_begin(self):
+        StartupTimeline.end("unknown")
+
+        assert StartupTimeline.entries() == []
+
+    def test_notifies_subscribers(self):
+        calls = []
+        StartupTimeline.subscribe(lambda: calls.append(True))
+
+        StartupTimeline.begin("config")
+        StartupTimeline.end("config")
+
+        assert len(calls) == 2
+
+    def test_as_dicts_serializes_status(self):
+        StartupTimeline.begin("chrome")
+        StartupTimeline.end("chrome", TimelineStatus.TIMEOUT)
+
+        assert StartupTimeline.as_dicts()[0]["status"] == "timeout"
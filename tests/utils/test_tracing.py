@@ -0,0 +1,151 @@
+import asyncio
+import json
+
+import pytest
+
+from agent_chat_cli.utils.tracing import Span, Tracer, _assign_lanes
+
+
+@pytest.fixture(autouse=True)
+def reset_tracer():
+    Tracer.disable()
+    yield
+    Tracer.disable()
+
+
+def make_span(span_id: int, start: float, end: float, parent_id=None) -> Span:
+    return Span(
+        name=f"span {span_id}",
+        category="test",
+        span_id=span_id,
+        parent_id=parent_id,
+        started_us=start,
+        ended_us=end,
+    )
+
+
+class TestTracer:
+    def test_records_nothing_while_disabled(self):
+        with Tracer.span("query", "agent_loop") as span:
+            span.set(chars=5)
+            Tracer.start("tool_call", "agent_loop").end()
+
+        assert span.recording is False
+        assert Tracer.spans() == []
+
+    def test_nested_spans_are_children(self):
+        Tracer.enable()
+
+        with Tracer.span("query", "agent_loop", chars=5) as query:
+            with Tracer.span("stream", "agent_loop") as stream:
+                tool = Tracer.start("tool_call", "agent_loop", tool="Read")
+
+            tool.end(is_error=False)
+
+        assert [span.name for span in Tracer.spans()] == [
+            "stream",
+            "tool_call",
+            "query",
+        ]
+        assert query.parent_id is None
+        assert stream.parent_id == query.span_id
+        assert tool.parent_id == stream.span_id
+        assert tool.attributes == {"tool": "Read", "is_error": False}
+        assert query.duration_us is not None and query.duration_us >= 0
+
+    async def test_tasks_inherit_the_current_span(self):
+        Tracer.enable()
+
+        async def child():
+            with Tracer.span("stream", "agent_loop") as span:
+                return span
+
+        with Tracer.span("query", "agent_loop") as query:
+            stream = await asyncio.create_task(child())
+
+        assert stream.parent_id == query.span_id
+
+    def test_explicit_parent(self):
+        Tracer.enable()
+
+        with Tracer.span("query", "agent_loop") as query:
+            pass
+
+        wait = Tracer.start("permission_wait", "agent_loop", parent=query)
+
+        assert wait.parent_id == query.span_id
+
+    def test_marks_failed_and_cancelled_spans(self):
+        Tracer.enable()
+
+        with pytest.raises(ValueError), Tracer.span("save", "actions"):
+            raise ValueError("disk full")
+
+        with pytest.raises(asyncio.CancelledError), Tracer.span("stream", "agent_loop"):
+            raise asyncio.CancelledError
+
+        failed, cancelled = Tracer.spans()
+        assert failed.attributes == {"error": "ValueError('disk full')"}
+        assert cancelled.attributes == {"cancelled": True}
+
+    def test_buffer_keeps_the_newest_spans(self):
+        Tracer.enable(buffer_size=2)
+
+        for name in ("first", "second", "third"):
+            Tracer.start(name, "test").end()
+
+        assert [span.name for span in Tracer.spans()] == ["second", "third"]
+        assert Tracer.chrome_trace()["otherData"] == {"dropped_spans": 1}
+
+
+class TestChromeTrace:
+    def test_exports_complete_events(self, tmp_path):
+        path = tmp_path / "trace.json"
+        Tracer.enable(path)
+
+        with Tracer.span("query", "agent_loop", chars=5):
+            pass
+
+        Tracer.export()
+
+        trace = json.loads(path.read_text())
+        [query] = [event for event in trace["traceEvents"] if event["ph"] == "X"]
+
+        assert query["name"] == "query"
+        assert query["cat"] == "agent_loop"
+        assert query["tid"] == 1
+        assert query["args"]["chars"] == 5
+        assert query["args"]["parent_id"] is None
+
+    def test_export_without_a_path_does_nothing(self, tmp_path):
+        Tracer.enable()
+        Tracer.start("query", "agent_loop").end()
+
+        Tracer.export()
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_children_share_their_parents_lane(self):
+        lanes = _assign_lanes(
+            [
+                make_span(1, 0, 100),
+                make_span(2, 10, 90, parent_id=1),
+                make_span(3, 20, 30, parent_id=2),
+            ]
+        )
+
+        assert lanes == {1: 1, 2: 1, 3: 1}
+
+    def test_concurrent_spans_get_their_own_lane(self):
+        lanes = _assign_lanes(
+            [
+                make_span(1, 0, 100),
+                make_span(2, 10, 60, parent_id=1),
+                make_span(3, 20, 80, parent_id=1),
+                make_span(4, 30, 40),
+                make_span(5, 70, 75, parent_id=1),
+            ]
+        )
+
+        # 3 overlaps its sibling, 4 is unrelated, and 5 fits once 2 ended
+        assert lanes == {1: 1, 2: 1, 3: 2, 4: 3, 5: 1}
@@ -0,0 +1,116 @@
+import math
+
+from agent_chat_cli.utils.turn_metrics import SessionMetrics, TurnMetrics, percentile
+
+
+def make_turn(ttft: float = 0.5, stream: float = 2.0, **fields) -> TurnMetrics:
+    # Timestamps in seconds from the query, as perf_counter would give them
+    return TurnMetrics(
+        started=0.0,
+        first_chunk_at=ttft,
+        last_chunk_at=ttft + stream,
+        finished_at=ttft + stream + 0.1,
+        **fields,
+    )
+
+
+class TestTurnMetrics:
+    def test_chunks_record_first_token_and_gaps(self):
+        turn = TurnMetrics()
+
+        turn.chunk()
+        turn.chunk()
+        turn.chunk()
+        turn.finish()
+
+        assert turn.chunks == 3
+        assert turn.ttft_ms is not None and turn.ttft_ms >= 0
+        assert len(turn.gaps_ms) == 2
+        assert turn.total_ms is not None and turn.total_ms >= turn.ttft_ms
+
+    def test_nothing_streamed(self):
+        turn = TurnMetrics()
+        turn.finish(interrupted=True)
+
+        assert turn.ttft_ms is None
+        assert turn.stream_ms is None
+        assert turn.tokens_per_second is None
+        assert turn.summary().endswith("total · interrupted")
+
+    def test_throughput_prefers_api_time(self):
+        turn = make_turn(stream=2.0)
+        turn.record_result(
+            usage={"input_tokens": 10, "output_tokens": 100},
+            cost_usd=0.01,
+            api_ms=1000,
+            num_turns=1,
+        )
+
+        assert turn.tokens_per_second == 100
+
+        turn.api_ms = None
+
+        assert turn.tokens_per_second == 50
+
+    def test_summary(self):
+        turn = make_turn(ttft=1.2, stream=2.0, permission_wait_ms=4100)
+        turn.record_result(
+            usage={"output_tokens": 104}, cost_usd=0.0123, api_ms=2000, num_turns=1
+        )
+
+        assert turn.summary() == (
+            "1.2s to first token · 3.3s total · 52 tok/s · "
+            "4.1s awaiting permission · $0.0123"
+        )
+
+    def test_as_dict_is_rounded(self):
+        turn = make_turn(ttft=0.12345, gaps_ms=[10.04, 30.06])
+
+        entry = turn.as_dict()
+
+        assert entry["ttft_ms"] == 123.5
+        assert entry["max_gap_ms"] == 30.1
+        assert entry["output_tokens"] is None
+
+
+class TestSessionMetrics:
+    def test_reports_percentiles_across_turns(self):
+        metrics = SessionMetrics()
+
+        for ttft in (0.1, 0.2, 0.3, 0.4, 2.0):
+            metrics.add(make_turn(ttft=ttft))
+
+        p50, p95 = metrics.percentiles()["time to first token"]
+
+        assert (round(p50), round(p95)) == (300, 2000)
+        assert "awaiting permission" not in metrics.percentiles()
+
+    def test_keeps_a_bounded_history_but_session_totals(self):
+        metrics = SessionMetrics(history=2)
+
+        for _ in range(3):
+            turn = make_turn()
+            turn.record_result({"output_tokens": 10}, 0.5, 1000, 1)
+            metrics.add(turn)
+
+        assert len(metrics.turns) == 2
+        assert metrics.total_turns == 3
+        assert metrics.total_cost_usd == 1.5
+        assert metrics.total_output_tokens == 30
+        assert metrics.report().startswith("Last 2 of 3 turns ($1.5000, 30 output")
+
+    def test_report_without_turns(self):
+        assert SessionMetrics().report() == "No turns yet"
+
+
+class TestPercentile:
+    def test_nearest_rank(self):
+        values = list(range(1, 101))
+
+        assert percentile(values, 50) == 50
+        assert percentile(values, 95) == 95
+        assert percentile([7.0], 95) == 7.0
+
+    def test_skips_missing_values(self):
+        assert percentile([None, 3.0, None, 1.0], 50) == 1.0
+        assert math.isnan(percentile([None], 50))